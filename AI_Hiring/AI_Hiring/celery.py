@@ -1,13 +1,44 @@
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_hiring.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'AI_Hiring.settings')
 
 app = Celery('ai_hiring')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
+# Per-task runtime, queue wait, retry and queue depth metrics
+import utils.task_metrics  # noqa: E402,F401
+
+
+@worker_init.connect
+def persistent_db_connections(**kwargs):
+    """Workers reuse their connections across tasks; web requests close theirs (CONN_MAX_AGE=0).
+
+    Runs before the pool starts, so prefork children and pool threads all open connections with it.
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    for alias in connections:
+        connections.settings[alias]['CONN_MAX_AGE'] = settings.DB_WORKER_CONN_MAX_AGE
+
+# Queues: CPU-bound scoring runs on prefork workers sized to the cores, while email and
+# other I/O-bound tasks run on a thread pool, so a scoring burst never delays notifications
+SCORING_QUEUE = 'scoring'
+IO_QUEUE = 'io'
+app.conf.task_default_queue = 'default'
+app.conf.task_routes = {
+    'apps.ats.tasks.*': {'queue': SCORING_QUEUE},
+    'apps.applications.tasks.*': {'queue': SCORING_QUEUE},
+    'apps.interviews.tasks.calibrate_interviewers': {'queue': SCORING_QUEUE},
+    'apps.interviews.tasks.refresh_interviewer_summaries': {'queue': SCORING_QUEUE},
+    'apps.notifications.*': {'queue': IO_QUEUE},
+    'apps.authentication.tasks.*': {'queue': IO_QUEUE},
+}
+
 # Periodic tasks
 app.conf.beat_schedule = {
     'send-daily-recruiter-summary': {
@@ -22,4 +53,12 @@ app.conf.beat_schedule = {
         'task': 'apps.interviews.tasks.send_reminders',
         'schedule': crontab(minute='*/30'),
     },
+    'calibrate-interviewers': {
+        'task': 'apps.interviews.tasks.calibrate_interviewers',
+        'schedule': crontab(hour=2, minute=0),
+    },
+    'cluster-duplicate-resumes': {
+        'task': 'apps.ats.tasks.cluster_resumes',
+        'schedule': crontab(hour=3, minute=0),
+    },
 }
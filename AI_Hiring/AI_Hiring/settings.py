@@ -17,6 +17,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party
     'rest_framework',
@@ -40,6 +41,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'utils.instrumentation.PerformanceMiddleware',
+    'utils.profiling.ProfilingMiddleware',
+    'utils.middleware.QueryCountMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -47,6 +51,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'utils.db_routing.ReplicaPinningMiddleware',
 ]
 
 ROOT_URLCONF = 'AI_Hiring.urls'
@@ -70,16 +75,48 @@ TEMPLATES = [
 WSGI_APPLICATION = 'AI_Hiring.wsgi.application'
 
 # Database
+# Under ASGI, the default deployment, each request runs in a thread of its own, where a
+# persistent connection would be left open for good: web requests close their connection
+# (DB_CONN_MAX_AGE=0) and PgBouncer pools them. Set DB_CONN_MAX_AGE only for WSGI workers.
+# Celery workers keep theirs for DB_WORKER_CONN_MAX_AGE seconds (applied in AI_Hiring.celery);
+# the Django fixup closes connections inherited across fork and recycles broken or expired
+# ones, or ones left inside a transaction, around each task. Health checks run before reuse.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',  
-        'NAME': 'hiring_ai',                     
-        'USER': 'yuvansh',                     
-        'PASSWORD': 'Yuvi@2005',             
-        'HOST': 'localhost',                        
-        'PORT': '5432',                         
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': config('DB_NAME', default='hiring_ai'),
+        'USER': config('DB_USER', default='yuvansh'),
+        'PASSWORD': config('DB_PASSWORD', default='Yuvi@2005'),
+        'HOST': config('DB_HOST', default='localhost'),
+        'PORT': config('DB_PORT', default='5432'),
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=0, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        # PgBouncer's transaction pooling cannot keep the named cursors QuerySet.iterator() uses open
+        'DISABLE_SERVER_SIDE_CURSORS': config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
+        'OPTIONS': {
+            'connect_timeout': config('DB_CONNECT_TIMEOUT', default=5, cast=int),
+        },
     }
 }
+DB_WORKER_CONN_MAX_AGE = config('DB_WORKER_CONN_MAX_AGE', default=600, cast=int)
+
+# Read replicas (DB_REPLICA_HOSTS, comma-separated host or host:port) serve list, detail,
+# report and analytics reads; writes and everything else stay on the primary. A user's
+# reads return to the primary for DB_REPLICA_PIN_SECONDS after a write, covering replication lag.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, config('DB_REPLICA_HOSTS', default='').split(',')), start=1):
+    host, _, port = replica.partition(':')
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        # Tests run against the primary alone, with the replica aliases pointing at it
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+DATABASE_REPLICA_PIN_SECONDS = config('DB_REPLICA_PIN_SECONDS', default=10, cast=int)
+DATABASE_ROUTERS = ['utils.db_routing.PrimaryReplicaRouter']
 
 
 # Password validation
@@ -98,6 +135,24 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing: argon2 (default), scrypt or pbkdf2, with tunable cost.
+# Stored hashes from another tier or cost are upgraded on the next login.
+PASSWORD_HASHER_TIER = config('PASSWORD_HASHER_TIER', default='argon2')
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=2, cast=int)
+ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', default=19456, cast=int)  # KiB
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=1, cast=int)
+SCRYPT_WORK_FACTOR = config('SCRYPT_WORK_FACTOR', default=2 ** 14, cast=int)
+SCRYPT_BLOCK_SIZE = config('SCRYPT_BLOCK_SIZE', default=8, cast=int)
+PBKDF2_ITERATIONS = config('PBKDF2_ITERATIONS', default=600000, cast=int)
+PASSWORD_HASHER_TIERS = {
+    'argon2': 'apps.authentication.hashers.TunableArgon2PasswordHasher',
+    'scrypt': 'apps.authentication.hashers.TunableScryptPasswordHasher',
+    'pbkdf2': 'apps.authentication.hashers.TunablePBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [PASSWORD_HASHER_TIERS[PASSWORD_HASHER_TIER]] + [
+    hasher for tier, hasher in PASSWORD_HASHER_TIERS.items() if tier != PASSWORD_HASHER_TIER
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -124,15 +179,38 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    'UPDATE_LAST_LOGIN': False,  # Recorded asynchronously, see RECORD_LAST_LOGIN
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.authentication.serializers.RoleTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.authentication.serializers.VersionedTokenRefreshSerializer',
+    'TOKEN_USER_CLASS': 'apps.authentication.backends.ClaimsUser',
+}
+
+# Queue last_login updates to Celery instead of writing them during the login request
+RECORD_LAST_LOGIN = config('RECORD_LAST_LOGIN', default=True, cast=bool)
+
+# Stateless mode builds request.user from token claims instead of selecting it on every request
+AUTH_STATELESS_JWT = config('AUTH_STATELESS_JWT', default=True, cast=bool)
+TOKEN_VERSION_CACHE_TIMEOUT = int(SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds())
+
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.redis.RedisCache'),
+        'LOCATION': config('CACHE_URL', default='redis://localhost:6379/1'),
+    }
 }
 
+# Short-lived shared cache of user roles for permission checks
+ROLE_CACHE_TIMEOUT = config('ROLE_CACHE_TIMEOUT', default=60, cast=int)
+
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
+        'apps.authentication.backends.StatelessJWTAuthentication'
+        if AUTH_STATELESS_JWT else
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
@@ -155,6 +233,15 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+# Long scoring tasks: acknowledge after running so a lost worker's task is redelivered,
+# and reserve one message at a time so a busy worker doesn't hoard the queue
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = config('CELERY_WORKER_PREFETCH_MULTIPLIER', default=1, cast=int)
+# Unacknowledged messages are redelivered after this, so it must exceed the longest task
+CELERY_BROKER_TRANSPORT_OPTIONS = {'visibility_timeout': config('CELERY_VISIBILITY_TIMEOUT', default=3600, cast=int)}
+TASK_METRICS_ENABLED = config('TASK_METRICS_ENABLED', default=True, cast=bool)
+TASK_METRICS_REDIS_URL = config('TASK_METRICS_REDIS_URL', default=CELERY_BROKER_URL)
 
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -173,8 +260,64 @@ AWS_ACCESS_KEY_ID = config('AWS_ACCESS_KEY_ID', default='')
 AWS_SECRET_ACCESS_KEY = config('AWS_SECRET_ACCESS_KEY', default='')
 AWS_STORAGE_BUCKET_NAME = config('AWS_STORAGE_BUCKET_NAME', default='')
 AWS_S3_REGION_NAME = config('AWS_S3_REGION_NAME', default='us-east-1')
+AWS_S3_ENDPOINT_URL = config('AWS_S3_ENDPOINT_URL', default=None)  # e.g. MinIO for local development
+# Endpoint browsers reach for presigned uploads when AWS_S3_ENDPOINT_URL is internal, e.g. http://minio:9000
+AWS_S3_PUBLIC_ENDPOINT_URL = config('AWS_S3_PUBLIC_ENDPOINT_URL', default=None)
 AWS_S3_FILE_OVERWRITE = False
 AWS_DEFAULT_ACL = None
 
+if AWS_STORAGE_BUCKET_NAME:
+    STORAGES = {
+        'default': {'BACKEND': 'storages.backends.s3.S3Storage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+
+# Direct resume uploads
+RESUME_MAX_UPLOAD_SIZE = config('RESUME_MAX_UPLOAD_SIZE', default=10 * 1024 * 1024, cast=int)
+RESUME_UPLOAD_URL_EXPIRY = config('RESUME_UPLOAD_URL_EXPIRY', default=900, cast=int)
+RESUME_RANGE_READ_SIZE = config('RESUME_RANGE_READ_SIZE', default=256 * 1024, cast=int)
+
+# Bulk resume import
+BULK_IMPORT_CHUNK_SIZE = config('BULK_IMPORT_CHUNK_SIZE', default=50, cast=int)
+BULK_IMPORT_MAX_FILES = config('BULK_IMPORT_MAX_FILES', default=5000, cast=int)
+BULK_IMPORT_MAX_FILE_SIZE = config('BULK_IMPORT_MAX_FILE_SIZE', default=10 * 1024 * 1024, cast=int)
+
+# Load testing: adds X-DB-Query-Count/X-DB-Query-Ms response headers for the loadtest command
+LOADTEST_QUERY_HEADERS = config('LOADTEST_QUERY_HEADERS', default=False, cast=bool)
+
+# Performance instrumentation
+PERF_INSTRUMENTATION = config('PERF_INSTRUMENTATION', default=True, cast=bool)
+PERF_SAMPLE_RATE = config('PERF_SAMPLE_RATE', default=0.0, cast=float)  # share of requests given a full timing breakdown
+PERF_SLOW_REQUEST_MS = config('PERF_SLOW_REQUEST_MS', default=1000, cast=int)
+PERF_METRICS_ALLOWED_IPS = config('PERF_METRICS_ALLOWED_IPS', default='127.0.0.1,::1').split(',')
+# Sampling profiler: share of ATS scoring calls and requests stored as ProfileSample stacks
+PROFILE_SCORING_SAMPLE_RATE = config('PROFILE_SCORING_SAMPLE_RATE', default=0.0, cast=float)
+PROFILE_REQUEST_SAMPLE_RATE = config('PROFILE_REQUEST_SAMPLE_RATE', default=0.0, cast=float)
+PROFILE_INTERVAL_MS = config('PROFILE_INTERVAL_MS', default=5.0, cast=float)
+
+# Targeted rescoring after job edits
+RESCORE_CHUNK_SIZE = config('RESCORE_CHUNK_SIZE', default=500, cast=int)
+
+# Per-job memory-mapped application features for bulk_filter
+FEATURE_STORE_DIR = config('FEATURE_STORE_DIR', default=os.path.join(BASE_DIR, 'var', 'feature_store'))
+FEATURE_STORE_MAX_OPEN = config('FEATURE_STORE_MAX_OPEN', default=256, cast=int)  # mapped stores kept per process
+
+# Interview scheduling
+SCHEDULING_SLOT_STEP_MINUTES = config('SCHEDULING_SLOT_STEP_MINUTES', default=15, cast=int)
+SCHEDULING_WORKDAY_START_HOUR = config('SCHEDULING_WORKDAY_START_HOUR', default=9, cast=int)
+SCHEDULING_WORKDAY_END_HOUR = config('SCHEDULING_WORKDAY_END_HOUR', default=18, cast=int)
+SCHEDULING_MAX_WINDOW_DAYS = config('SCHEDULING_MAX_WINDOW_DAYS', default=31, cast=int)
+INTERVIEW_BULK_MAX_ITEMS = config('INTERVIEW_BULK_MAX_ITEMS', default=500, cast=int)
+
+# Interviewer calibration
+CALIBRATION_MAX_ITERATIONS = config('CALIBRATION_MAX_ITERATIONS', default=25, cast=int)
+CALIBRATION_PRIOR_WEIGHT = config('CALIBRATION_PRIOR_WEIGHT', default=5.0, cast=float)  # pseudo-ratings pulling new interviewers to neutral
+
+# Near-duplicate resume detection; changing the signature shape requires clearing ats_resume_signatures
+DEDUP_NUM_PERM = config('DEDUP_NUM_PERM', default=128, cast=int)
+DEDUP_LSH_BANDS = config('DEDUP_LSH_BANDS', default=16, cast=int)  # 16 bands of 8 rows: candidates from ~0.7 similarity
+DEDUP_SIMILARITY_THRESHOLD = config('DEDUP_SIMILARITY_THRESHOLD', default=0.8, cast=float)
+DEDUP_REUSE_SIMILARITY = config('DEDUP_REUSE_SIMILARITY', default=0.95, cast=float)  # near-identical resumes share parsed entities
+
 # AI Configuration
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
\ No newline at end of file
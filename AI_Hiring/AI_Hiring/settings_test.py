@@ -0,0 +1,34 @@
+# AI_Hiring/settings_test.py
+# Test suite without PostgreSQL or Redis: python manage.py test --settings=AI_Hiring.settings_test
+# Range exclusion constraints and GIN indexes are skipped on SQLite (see utils.postgres), so
+# interview scheduling and the JSON skill filters of the database path are not covered here.
+import tempfile
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'test.sqlite3'),
+    },
+    # A separate database rather than a mirror, so routing tests can tell the two apart
+    'replica_1': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'test_replica.sqlite3'),
+    },
+}
+DATABASE_REPLICAS = ['replica_1']
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+CELERY_TASK_ALWAYS_EAGER = True
+TASK_METRICS_ENABLED = False
+PERF_SAMPLE_RATE = 0.0
+PROFILE_SCORING_SAMPLE_RATE = 0.0
+PROFILE_REQUEST_SAMPLE_RATE = 0.0
+FEATURE_STORE_DIR = tempfile.mkdtemp(prefix='feature_store_')
+MEDIA_ROOT = tempfile.mkdtemp(prefix='media_')
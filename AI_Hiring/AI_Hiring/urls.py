@@ -5,6 +5,7 @@ from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework import permissions
+from utils.instrumentation import metrics_view
 
 # Swagger configuration
 schema_view = get_schema_view(
@@ -32,9 +33,13 @@ urlpatterns = [
     path('api/users/', include('apps.users.urls')),
     path('api/jobs/', include('apps.jobs.urls')),
     path('api/applications/', include('apps.applications.urls')),
+    path('api/ats/', include('apps.ats.urls')),
     path('api/interviews/', include('apps.interviews.urls')),
     path('api/analytics/', include('apps.analytics.urls')),
     
+    # Prometheus metrics, local scrapers only
+    path('metrics', metrics_view, name='metrics'),
+    
     # Documentation
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
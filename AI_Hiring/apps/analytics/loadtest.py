@@ -0,0 +1,313 @@
+# apps/analytics/loadtest.py
+import itertools
+import random
+import threading
+from datetime import timedelta
+from typing import Callable, Dict, List, Tuple
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.utils import timezone
+from apps.applications.models import Application
+from apps.ats.benchmarks.corpus import SKILLS, generate_corpus, generate_jobs
+from apps.interviews.models import Interview, InterviewAssignment, InterviewFeedback
+from apps.interviews.services import FeedbackAggregationService
+from apps.jobs.models import Department, Job
+from apps.users.models import CandidateProfile, RecruiterProfile, User
+from utils.loadtest import http_request
+from utils.postgres import is_postgres
+
+SEEDED_STATUSES = ('submitted', 'under_review', 'shortlisted', 'interview_scheduled', 'interviewed', 'rejected')
+INTERVIEW_STATUSES = ('shortlisted', 'interview_scheduled', 'interviewed')
+RECOMMENDATIONS = ('strong_no', 'no', 'maybe', 'yes', 'strong_yes')
+
+
+def username(prefix: str, role: str, index: int) -> str:
+    return f'{prefix}-{role}-{index}'
+
+
+class LoadTestSeeder:
+    """Bulk-create a self-contained data set for load tests; every row is tagged with the prefix"""
+
+    def __init__(self, prefix: str = 'loadtest', password: str = 'loadtest-Passw0rd!', seed: int = 0):
+        self.prefix = prefix
+        self.password = password
+        self.random_seed = seed
+        self.rng = random.Random(seed)
+
+    def clear(self) -> int:
+        """Delete a previous seed; applications, interviews and feedback cascade from users and jobs"""
+        with transaction.atomic():
+            Job.objects.filter(department__name=self.department_name).delete()
+            deleted, _ = User.objects.filter(username__startswith=f'{self.prefix}-').delete()
+            Department.objects.filter(name=self.department_name).delete()
+        return deleted
+
+    @property
+    def department_name(self) -> str:
+        return f'{self.prefix} engineering'
+
+    @transaction.atomic
+    def seed(self, candidates: int, recruiters: int, interviewers: int, jobs: int, burst_jobs: int,
+             applications_per_job: int, interview_ratio: float) -> Dict[str, int]:
+        # Hash once; every seeded account shares the password
+        encoded = make_password(self.password)
+        users = {
+            role: self._create_users(role, count, encoded)
+            for role, count in (
+                ('candidate', candidates), ('recruiter', recruiters),
+                ('hiring_manager', max(1, recruiters // 5)), ('interviewer', interviewers),
+            )
+        }
+        CandidateProfile.objects.bulk_create([
+            CandidateProfile(
+                user=user,
+                skills=self.rng.sample(SKILLS, self.rng.randint(3, 10)),
+                experience_years=self.rng.randint(0, 15),
+            )
+            for user in users['candidate']
+        ], batch_size=1000)
+        RecruiterProfile.objects.bulk_create([
+            RecruiterProfile(user=user, employee_id=user.username, hire_date=timezone.now().date())
+            for user in users['recruiter'] + users['hiring_manager']
+        ], batch_size=1000)
+
+        department = Department.objects.create(name=self.department_name)
+        created_jobs = self._create_jobs(jobs + burst_jobs, department, users['recruiter'], users['hiring_manager'])
+        # The last burst_jobs jobs get no applications, leaving them free for the apply scenario
+        applications = self._create_applications(created_jobs[:jobs], users['candidate'], applications_per_job)
+        interviews, feedback = self._create_interviews(applications, users['interviewer'], interview_ratio)
+
+        return {
+            **{f'{role}s': len(role_users) for role, role_users in users.items()},
+            'jobs': len(created_jobs),
+            'applications': len(applications),
+            'interviews': interviews,
+            'feedback': feedback,
+        }
+
+    def _create_users(self, role: str, count: int, encoded_password: str) -> List[User]:
+        users = [
+            User(
+                username=username(self.prefix, role, i),
+                email=f'{username(self.prefix, role, i)}@example.com',
+                first_name=role.replace('_', ' ').title(),
+                last_name=str(i),
+                role=role,
+                password=encoded_password,
+            )
+            for i in range(count)
+        ]
+        return User.objects.bulk_create(users, batch_size=1000)
+
+    def _create_jobs(self, count: int, department: Department, recruiters: List[User], managers: List[User]) -> List[Job]:
+        published_at = timezone.now()
+        jobs = generate_jobs(count, self.random_seed)
+        for i, job in enumerate(jobs):
+            job.department = department
+            job.status = 'active'
+            job.published_at = published_at
+            job.created_by = recruiters[i % len(recruiters)] if recruiters else None
+            job.hiring_manager = managers[i % len(managers)]
+        return Job.objects.bulk_create(jobs, batch_size=1000)
+
+    def _create_applications(self, jobs: List[Job], candidates: List[User], per_job: int) -> List[Application]:
+        resume = self.resume_name()
+        if not default_storage.exists(resume):
+            default_storage.save(resume, ContentFile(generate_corpus(1, self.random_seed)[0].encode()))
+
+        submitted_at = timezone.now()
+        applications = []
+        for job in jobs:
+            for candidate in self.rng.sample(candidates, min(per_job, len(candidates))):
+                scores = [round(self.rng.uniform(20, 100), 2) for _ in range(4)]
+                applications.append(Application(
+                    job=job,
+                    candidate=candidate,
+                    status=self.rng.choice(SEEDED_STATUSES),
+                    resume=resume,
+                    ats_score=round(sum(scores) / 4, 2),
+                    skill_match_score=scores[0],
+                    experience_match_score=scores[1],
+                    education_match_score=scores[2],
+                    keyword_match_score=scores[3],
+                    submitted_at=submitted_at,
+                ))
+        return Application.objects.bulk_create(applications, batch_size=2000)
+
+    def _create_interviews(self, applications: List[Application], interviewers: List[User], ratio: float) -> Tuple[int, int]:
+        if not interviewers:
+            return 0, 0
+        eligible = [application for application in applications if application.status in INTERVIEW_STATUSES]
+        selected = self.rng.sample(eligible, int(len(eligible) * ratio))
+
+        # Slot k goes to interviewer k % n at hour k // n, so nobody is double booked
+        now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        first_slot = now - timedelta(hours=len(selected) // len(interviewers) // 2 + 1)
+        interviews, panels = [], []
+        for k, application in enumerate(selected):
+            scheduled_at = first_slot + timedelta(hours=k // len(interviewers))
+            interview = Interview(
+                application=application,
+                type=self.rng.choice(Interview.TYPE_CHOICES)[0],
+                status='completed' if scheduled_at < now else 'scheduled',
+                scheduled_at=scheduled_at,
+                duration_minutes=60,
+            )
+            interviews.append(interview)
+            panels.append(interviewers[k % len(interviewers)])
+        Interview.objects.bulk_create(interviews, batch_size=2000)
+
+        # Booked periods are range columns, which only PostgreSQL has
+        track_periods = is_postgres()
+        InterviewAssignment.objects.bulk_create([
+            InterviewAssignment(
+                interview=interview,
+                interviewer=interviewer,
+                period=DateTimeTZRange(interview.scheduled_at, interview.ends_at) if track_periods else None,
+            )
+            for interview, interviewer in zip(interviews, panels)
+        ], batch_size=2000)
+
+        feedback = []
+        for interview, interviewer in zip(interviews, panels):
+            if interview.status != 'completed':
+                continue
+            ratings = [self.rng.randint(1, 5) for _ in range(5)]
+            feedback.append(InterviewFeedback(
+                interview=interview,
+                interviewer=interviewer,
+                technical_skills=ratings[0],
+                communication=ratings[1],
+                problem_solving=ratings[2],
+                cultural_fit=ratings[3],
+                overall_rating=ratings[4],
+                recommendation=RECOMMENDATIONS[ratings[4] - 1],
+            ))
+        InterviewFeedback.objects.bulk_create(feedback, batch_size=2000)
+
+        # bulk_create skips the signals that normally maintain the summaries
+        FeedbackAggregationService().refresh_many({entry.interview.application_id for entry in feedback})
+        return len(interviews), len(feedback)
+
+    def resume_name(self) -> str:
+        return f'{self.prefix}/resume.txt'
+
+
+class Scenario:
+    """Named endpoints of one load-test scenario; each send callable performs a single request"""
+
+    def __init__(self, name: str, endpoints: List[Tuple[str, Callable]], max_requests: int = None):
+        self.name = name
+        self.endpoints = endpoints
+        self.max_requests = max_requests
+
+
+def login(base_url: str, username: str, password: str) -> Dict[str, str]:
+    status, _, body = http_request(f'{base_url}/api/auth/login/', method='POST', body={'username': username, 'password': password})
+    if status != 200:
+        raise ValueError(f'Login as {username} failed with status {status}')
+    return {'Authorization': f"Bearer {body['access']}"}
+
+
+def _cycle(items):
+    """Thread-safe round robin over items"""
+    iterator = itertools.cycle(items)
+    lock = threading.Lock()
+
+    def next_item():
+        with lock:
+            return next(iterator)
+    return next_item
+
+
+def build_scenarios(base_url: str, prefix: str, password: str, names: List[str], candidate_sessions: int = 20) -> List[Scenario]:
+    """Scenarios against a seeded data set, logging in the accounts they need up front"""
+    job_ids = [str(pk) for pk in Job.objects.filter(department__name=f'{prefix} engineering').order_by('created_at').values_list('id', flat=True)]
+    burst_job_ids = [
+        str(pk) for pk in Job.objects.filter(department__name=f'{prefix} engineering', applications__isnull=True).values_list('id', flat=True)
+    ]
+    if not job_ids:
+        raise ValueError(f"No seeded jobs for prefix '{prefix}'; run seed_loadtest first")
+
+    def get(path, headers=None):
+        """GET sender; path may be a callable producing a fresh path per request"""
+        def send():
+            url = base_url + (path() if callable(path) else path)
+            status, response_headers, _ = http_request(url, headers=headers)
+            return status, response_headers
+        return send
+
+    scenarios = []
+    if 'apply' in names:
+        candidate_count = User.objects.filter(username__startswith=f'{prefix}-candidate-').count()
+        sessions = [
+            login(base_url, username(prefix, 'candidate', i), password)
+            for i in range(min(candidate_sessions, candidate_count))
+        ]
+        # Every (candidate, burst job) pair can apply exactly once
+        pairs = _cycle([(headers, job_id) for headers in sessions for job_id in burst_job_ids])
+        resume = generate_corpus(1)[0].encode()
+
+        def apply():
+            headers, job_id = pairs()
+            status, response_headers, _ = http_request(
+                f'{base_url}/api/applications/', method='POST', headers=headers,
+                body={'job': job_id, 'cover_letter': 'Load test application'},
+                files={'resume': ('resume.txt', resume, 'text/plain')},
+            )
+            return status, response_headers
+        scenarios.append(Scenario('apply', [('candidate apply', apply)], max_requests=len(sessions) * len(burst_job_ids)))
+
+    if 'job_board' in names:
+        headers = login(base_url, username(prefix, 'candidate', 0), password)
+        next_job = _cycle(job_ids)
+        pages = max(1, len(job_ids) // 20)
+        next_page = _cycle(range(1, pages + 1))
+        scenarios.append(Scenario('job_board', [
+            ('job list', get(lambda: f'/api/jobs/jobs/?page={next_page()}', headers)),
+            ('job detail', get(lambda: f'/api/jobs/jobs/{next_job()}/', headers)),
+            ('job list (async)', get('/api/jobs/async/jobs/', headers)),
+        ]))
+
+    if 'bulk_filter' in names:
+        headers = login(base_url, username(prefix, 'recruiter', 0), password)
+        rng = random.Random(0)
+        lock = threading.Lock()
+
+        def bulk_filter():
+            with lock:
+                filters = {'min_score': rng.randint(30, 80), 'status': rng.sample(SEEDED_STATUSES, 2)}
+                ranking = rng.choice(['ats_score', 'calibrated_feedback'])
+            status, response_headers, _ = http_request(
+                f'{base_url}/api/applications/bulk_filter/', method='POST', headers=headers,
+                body={'filters': filters, 'ranking': ranking},
+            )
+            return status, response_headers
+        scenarios.append(Scenario('bulk_filter', [('recruiter bulk_filter', bulk_filter)]))
+
+    if 'dashboard' in names:
+        recruiter = login(base_url, username(prefix, 'recruiter', 0), password)
+        manager = login(base_url, username(prefix, 'hiring_manager', 0), password)
+        next_job = _cycle(job_ids)
+        scenarios.append(Scenario('dashboard', [
+            ('analytics dashboard', get('/api/analytics/dashboard/', recruiter)),
+            ('applications under review', get('/api/applications/?status=under_review', recruiter)),
+            ('interview list', get('/api/interviews/', recruiter)),
+            ('feedback compare', get(lambda: f'/api/applications/compare/?job={next_job()}', manager)),
+        ]))
+
+    if 'login' in names:
+        candidate_count = User.objects.filter(username__startswith=f'{prefix}-candidate-').count()
+        next_user = _cycle([username(prefix, 'candidate', i) for i in range(candidate_count)])
+
+        def login_storm():
+            status, response_headers, _ = http_request(
+                f'{base_url}/api/auth/login/', method='POST', body={'username': next_user(), 'password': password},
+            )
+            return status, response_headers
+        scenarios.append(Scenario('login', [('login', login_storm)]))
+
+    return scenarios
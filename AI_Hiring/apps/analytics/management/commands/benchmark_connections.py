@@ -0,0 +1,136 @@
+# apps/analytics/management/commands/benchmark_connections.py
+import asyncio
+import threading
+import time
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from utils.loadtest import LoadResult, format_table, run_load
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the database cost of a request opening a fresh connection with one reusing a "
+        "persistent connection, with and without health checks. Each simulated request goes through "
+        "the request_started and request_finished signals Django uses to manage connections and runs "
+        "--queries trivial queries, so the difference is connection setup. The default asgi handler "
+        "runs requests as ASGIHandler does, each in a thread-sensitive context of its own; wsgi runs "
+        "them on a fixed pool of threads, as gunicorn's sync workers do."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--handler', choices=('asgi', 'wsgi'), default='asgi')
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--queries', type=int, default=1, help='Queries per simulated request')
+
+    def handle(self, *args, **options):
+        alias = options['database']
+        settings_dict = connections.settings[alias]
+        configured = settings_dict.get('CONN_MAX_AGE'), settings_dict.get('CONN_HEALTH_CHECKS')
+        opened = OpenedConnections(alias)
+        connection_created.connect(opened)
+
+        def query():
+            with connections[alias].cursor() as cursor:
+                for _ in range(options['queries']):
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+
+        def send():
+            request_started.send(sender=WSGIHandler)
+            try:
+                query()
+                return 200
+            finally:
+                request_finished.send(sender=WSGIHandler)
+
+        async def asend():
+            # ASGIHandler's connection handling: signals and the sync view in the request's own thread
+            async with ThreadSensitiveContext():
+                await sync_to_async(request_started.send, thread_sensitive=True)(sender=ASGIHandler, scope={})
+                try:
+                    await sync_to_async(query, thread_sensitive=True)()
+                    return 200
+                finally:
+                    await sync_to_async(request_finished.send, thread_sensitive=True)(sender=ASGIHandler)
+
+        modes = [
+            ('new connection', 0, False),
+            ('persistent', 600, False),
+            ('persistent + health checks', 600, True),
+        ]
+        rows = []
+        try:
+            for label, max_age, health_checks in modes:
+                # Connections read these when they open, so every mode starts from closed connections
+                settings_dict['CONN_MAX_AGE'], settings_dict['CONN_HEALTH_CHECKS'] = max_age, health_checks
+                connections[alias].close()
+                opened.reset()
+                if options['handler'] == 'asgi':
+                    # A bare event loop, as under uvicorn; inside async_to_sync thread-sensitive calls would share its thread
+                    result = asyncio.run(run_async_load(label, asend, options['requests'], options['concurrency']))
+                else:
+                    result = run_load(label, send, total=options['requests'], concurrency=options['concurrency'])
+                rows.append({
+                    **result.summary(),
+                    'connections_opened': len(opened.connections),
+                    'left_open': opened.close_leftovers(),
+                })
+        finally:
+            settings_dict['CONN_MAX_AGE'], settings_dict['CONN_HEALTH_CHECKS'] = configured
+            connection_created.disconnect(opened)
+
+        self.stdout.write(format_table(rows))
+        self.stdout.write(
+            f"\nHandler: {options['handler']}. Configured: CONN_MAX_AGE={configured[0]}, "
+            f"CONN_HEALTH_CHECKS={configured[1]}. left_open counts connections still open after the run, "
+            "whose threads are gone and can never reuse or close them."
+        )
+
+
+async def run_async_load(name, asend, total, concurrency):
+    """Await asend() total times on one event loop, at most concurrency at a time, as an ASGI server does"""
+    result = LoadResult(name)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def request():
+        async with limit:
+            started = time.perf_counter()
+            status = await asend()
+            result.record(time.perf_counter() - started, status)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(total)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+class OpenedConnections:
+    """connection_created receiver collecting the new connections to one database"""
+
+    def __init__(self, alias: str):
+        self.alias = alias
+        self.connections = []
+        self._lock = threading.Lock()
+
+    def __call__(self, sender, connection, **kwargs):
+        if connection.alias == self.alias:
+            with self._lock:
+                self.connections.append(connection)
+
+    def reset(self):
+        self.connections = []
+
+    def close_leftovers(self) -> int:
+        """Close the driver connections no request closed, returning how many there were"""
+        leftovers = [wrapper.connection for wrapper in self.connections if wrapper.connection is not None]
+        for connection in leftovers:
+            # The driver connection directly: the wrappers belong to the finished load threads
+            connection.close()
+        return len(leftovers)
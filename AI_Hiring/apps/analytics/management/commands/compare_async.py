@@ -0,0 +1,50 @@
+# apps/analytics/management/commands/compare_async.py
+from django.core.management.base import BaseCommand, CommandError
+from utils.loadtest import format_table, http_request, run_load
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the sync DRF read endpoints against their async counterparts on a running server. "
+        "Run it once against gunicorn (WSGI) and once against uvicorn workers (ASGI) to compare deployments."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--username', required=True)
+        parser.add_argument('--password', required=True)
+        parser.add_argument('--job', required=True, help='Job ID used for the detail endpoints')
+        parser.add_argument('--application', required=True, help='Application ID used for status polling')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=50)
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        status, _, body = http_request(f'{base_url}/api/auth/login/', method='POST', body={
+            'username': options['username'],
+            'password': options['password'],
+        })
+        if status != 200:
+            raise CommandError(f'Login failed with status {status}')
+        headers = {'Authorization': f"Bearer {body['access']}"}
+
+        job, application = options['job'], options['application']
+        pairs = [
+            ('job list', '/api/jobs/jobs/', '/api/jobs/async/jobs/'),
+            ('job detail', f'/api/jobs/jobs/{job}/', f'/api/jobs/async/jobs/{job}/'),
+            ('application status', f'/api/applications/{application}/', f'/api/applications/async/{application}/status/'),
+        ]
+
+        rows = []
+        for label, sync_path, async_path in pairs:
+            for mode, path in (('sync', sync_path), ('async', async_path)):
+                url = base_url + path
+                result = run_load(
+                    f'{label} ({mode})',
+                    lambda: http_request(url, headers=headers)[0],
+                    total=options['requests'],
+                    concurrency=options['concurrency'],
+                )
+                rows.append(result.summary())
+
+        self.stdout.write(format_table(rows))
@@ -0,0 +1,53 @@
+# apps/analytics/management/commands/loadtest.py
+from django.core.management.base import BaseCommand, CommandError
+from utils.loadtest import format_table, run_load
+from apps.analytics.loadtest import build_scenarios
+
+SCENARIOS = ('apply', 'job_board', 'bulk_filter', 'dashboard', 'login')
+
+
+class Command(BaseCommand):
+    help = (
+        "Run scripted load-test scenarios against a running server seeded with seed_loadtest, sharing its "
+        "database settings. Reports per-endpoint RPS, latency percentiles and histograms; start the server "
+        "with LOADTEST_QUERY_HEADERS=True to also get per-request query counts. The apply scenario queues "
+        "confirmation emails, so it needs a Celery broker (or eager tasks), and each seed supports one apply run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--prefix', default='loadtest')
+        parser.add_argument('--password', default='loadtest-Passw0rd!')
+        parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+        parser.add_argument('--requests', type=int, default=500, help='Requests per endpoint')
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--candidate-sessions', type=int, default=20, help='Candidates logged in for the apply burst')
+
+    def handle(self, *args, **options):
+        try:
+            scenarios = build_scenarios(
+                options['base_url'].rstrip('/'),
+                options['prefix'],
+                options['password'],
+                options['scenarios'],
+                candidate_sessions=options['candidate_sessions'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        results = []
+        for scenario in scenarios:
+            total = options['requests']
+            if scenario.max_requests is not None:
+                total = min(total, scenario.max_requests)
+            if not total:
+                self.stdout.write(self.style.WARNING(f"Skipping {scenario.name}: nothing left to send, reseed first"))
+                continue
+            for endpoint, send in scenario.endpoints:
+                self.stdout.write(f"{scenario.name}: {endpoint} x{total}")
+                results.append(run_load(endpoint, send, total=total, concurrency=options['concurrency']))
+
+        self.stdout.write('')
+        self.stdout.write(format_table([result.summary() for result in results]))
+        self.stdout.write('')
+        self.stdout.write(format_table([result.histogram() for result in results]))
@@ -0,0 +1,68 @@
+# apps/analytics/management/commands/profile_hotspots.py
+from collections import Counter
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from apps.analytics.models import ProfileSample
+from utils.loadtest import format_table
+from utils.profiling import hotspots
+
+
+class Command(BaseCommand):
+    help = (
+        "Aggregate stored ProfileSample stacks over a time window and list the hottest functions. "
+        "--flamegraph writes the merged collapsed stacks for flamegraph.pl or speedscope."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=float, default=24, help='Window ending now')
+        parser.add_argument('--kind', choices=[kind for kind, _ in ProfileSample.KIND_CHOICES])
+        parser.add_argument('--label', help='Only requests whose label contains this, e.g. a view name')
+        parser.add_argument('--application', help='Only profiles of this application ID')
+        parser.add_argument('--resume-hash')
+        parser.add_argument('--limit', type=int, default=25)
+        parser.add_argument('--flamegraph', metavar='PATH', help='Write merged collapsed stacks to PATH')
+
+    def handle(self, *args, **options):
+        profiles = ProfileSample.objects.filter(created_at__gte=timezone.now() - timedelta(hours=options['hours']))
+        if options['kind']:
+            profiles = profiles.filter(kind=options['kind'])
+        if options['label']:
+            profiles = profiles.filter(label__icontains=options['label'])
+        if options['application']:
+            profiles = profiles.filter(application_id=options['application'])
+        if options['resume_hash']:
+            profiles = profiles.filter(resume_hash=options['resume_hash'])
+
+        stacks = Counter()
+        count, duration_ms, sampled_ms = 0, 0.0, 0.0
+        for profile in profiles.only('stacks', 'duration_ms', 'interval_ms').iterator(chunk_size=200):
+            stacks.update(profile.stacks)
+            count += 1
+            duration_ms += profile.duration_ms
+            sampled_ms += sum(profile.stacks.values()) * profile.interval_ms
+        if not stacks:
+            raise CommandError('No stack samples in this window; raise PROFILE_SCORING_SAMPLE_RATE or widen --hours')
+
+        total = sum(stacks.values())
+        # Each sample stands for one interval, so sample shares scale to estimated wall time
+        ms_per_sample = sampled_ms / total
+        rows = [
+            {
+                'function': function,
+                'self': self_samples,
+                'self_%': round(100 * self_samples / total, 1),
+                'total': total_samples,
+                'total_%': round(100 * total_samples / total, 1),
+                'self_ms': round(self_samples * ms_per_sample, 1),
+            }
+            for function, self_samples, total_samples in hotspots(stacks)[:options['limit']]
+        ]
+        self.stdout.write(f"{count} profiles, {total} samples, {duration_ms:.0f} ms profiled")
+        self.stdout.write(format_table(rows))
+
+        if options['flamegraph']:
+            with open(options['flamegraph'], 'w') as f:
+                for stack, samples in stacks.most_common():
+                    f.write(f'{stack} {samples}\n')
+            self.stdout.write(self.style.SUCCESS(f"Wrote {len(stacks)} collapsed stacks to {options['flamegraph']}"))
@@ -0,0 +1,42 @@
+# apps/analytics/management/commands/seed_loadtest.py
+import time
+from django.core.management.base import BaseCommand
+from apps.analytics.loadtest import LoadTestSeeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-create users, jobs, applications, interviews and feedback for load tests. "
+        "Every seeded row is tagged with --prefix so a seed can be cleared and recreated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='loadtest')
+        parser.add_argument('--password', default='loadtest-Passw0rd!', help='Password shared by every seeded account')
+        parser.add_argument('--candidates', type=int, default=2000)
+        parser.add_argument('--recruiters', type=int, default=10, help='Also creates one hiring manager per five recruiters')
+        parser.add_argument('--interviewers', type=int, default=50)
+        parser.add_argument('--jobs', type=int, default=100)
+        parser.add_argument('--burst-jobs', type=int, default=20, help='Extra jobs left without applications for the apply scenario')
+        parser.add_argument('--applications-per-job', type=int, default=200)
+        parser.add_argument('--interview-ratio', type=float, default=0.5, help='Share of shortlisted/interviewing applications given an interview')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--clear', action='store_true', help='Delete the previous seed with this prefix first')
+
+    def handle(self, *args, **options):
+        seeder = LoadTestSeeder(prefix=options['prefix'], password=options['password'], seed=options['seed'])
+        if options['clear']:
+            self.stdout.write(f"Deleted {seeder.clear()} rows from the previous seed")
+
+        started = time.perf_counter()
+        counts = seeder.seed(
+            candidates=options['candidates'],
+            recruiters=options['recruiters'],
+            interviewers=options['interviewers'],
+            jobs=options['jobs'],
+            burst_jobs=options['burst_jobs'],
+            applications_per_job=options['applications_per_job'],
+            interview_ratio=options['interview_ratio'],
+        )
+        summary = ', '.join(f'{total} {name}' for name, total in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Seeded {summary} in {time.perf_counter() - started:.1f}s"))
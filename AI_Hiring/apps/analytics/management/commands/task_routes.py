@@ -0,0 +1,40 @@
+# apps/analytics/management/commands/task_routes.py
+from collections import Counter
+from django.core.management.base import BaseCommand
+from AI_Hiring.celery import app
+from utils.loadtest import format_table
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the queue every registered Celery task routes to. With --publish, send each task "
+        "through an in-memory broker and count the messages that land in each queue."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--publish', action='store_true', help='Publish each task once to an in-memory broker')
+
+    def handle(self, *args, **options):
+        app.loader.import_default_modules()
+        names = sorted(name for name in app.tasks if not name.startswith('celery.'))
+        routes = {name: app.amqp.router.route({}, name)['queue'].name for name in names}
+        self.stdout.write(format_table([{'task': name, 'queue': queue} for name, queue in routes.items()]))
+
+        if not options['publish']:
+            return
+        with app.connection_for_write('memory://') as connection:
+            for name in names:
+                # Nothing consumes these, and no result backend is needed to check routing
+                app.send_task(name, connection=connection, ignore_result=True)
+            channel = connection.default_channel
+            expected = Counter(routes.values())
+            rows = [
+                {'queue': queue, 'expected': count, 'delivered': channel._size(queue)}
+                for queue, count in sorted(expected.items())
+            ]
+        self.stdout.write('')
+        self.stdout.write(format_table(rows))
+        if all(row['expected'] == row['delivered'] for row in rows):
+            self.stdout.write(self.style.SUCCESS('Every task was delivered to its routed queue'))
+        else:
+            self.stdout.write(self.style.ERROR('Some tasks did not reach their routed queue'))
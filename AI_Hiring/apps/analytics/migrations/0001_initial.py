@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('applications', '0005_application_duplicate_of'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileSample',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('ats_score', 'ATS Score'), ('request', 'Request')], max_length=20)),
+                ('label', models.CharField(blank=True, max_length=200)),
+                ('resume_hash', models.CharField(blank=True, db_index=True, max_length=64)),
+                ('duration_ms', models.FloatField()),
+                ('interval_ms', models.FloatField()),
+                ('sample_count', models.PositiveIntegerField(default=0)),
+                ('stacks', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('application', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='profile_samples', to='applications.application')),
+            ],
+            options={
+                'db_table': 'analytics_profile_samples',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['kind', 'created_at'], name='analytics_p_kind_4cc2a1_idx')],
+            },
+        ),
+    ]
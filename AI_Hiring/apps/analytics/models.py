@@ -1,3 +1,30 @@
 from django.db import models
+import uuid
 
-# Create your models here.
+class ProfileSample(models.Model):
+    """Stack samples captured while profiling one ATS scoring call or request"""
+    KIND_CHOICES = [
+        ('ats_score', 'ATS Score'),
+        ('request', 'Request'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    label = models.CharField(max_length=200, blank=True)  # method and view name for requests
+    application = models.ForeignKey('applications.Application', on_delete=models.SET_NULL, null=True, blank=True, related_name='profile_samples')
+    resume_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    
+    duration_ms = models.FloatField()
+    interval_ms = models.FloatField()
+    sample_count = models.PositiveIntegerField(default=0)
+    # Collapsed stacks ("module:function;module:function") mapped to sample counts
+    stacks = models.JSONField(default=dict)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'analytics_profile_samples'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['kind', 'created_at']),
+        ]
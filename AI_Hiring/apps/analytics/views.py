@@ -3,9 +3,11 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from utils.db_routing import ReplicaReadMixin
 
-class AnalyticsViewSet(viewsets.GenericViewSet):
+class AnalyticsViewSet(ReplicaReadMixin, viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated]
+    replica_actions = ('dashboard',)
     
     @action(detail=False, methods=['get'])
     def dashboard(self, request):
@@ -0,0 +1,23 @@
+# apps/applications/async_views.py
+from utils.async_views import async_api_view, api_response, not_found
+from .models import Application
+
+
+@async_api_view
+async def application_status(request, user, pk):
+    """Lightweight async status endpoint for candidates polling their application"""
+    # Same visibility rules as ApplicationViewSet.get_queryset
+    queryset = Application.objects.all()
+    if user.role == 'candidate':
+        queryset = queryset.filter(candidate_id=user.pk)
+    elif user.role not in ['recruiter', 'hiring_manager']:
+        return not_found()
+
+    try:
+        application = await queryset.values(
+            'id', 'job', 'status', 'ats_score', 'submitted_at', 'updated_at'
+        ).aget(pk=pk)
+    except Application.DoesNotExist:
+        return not_found()
+
+    return api_response(application)
@@ -0,0 +1,268 @@
+# apps/applications/feature_store.py
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from .models import Application
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+ALIGNMENT = 64
+STATUS_CODES = {status: code for code, (status, _) in enumerate(Application.STATUS_CHOICES)}
+SCORE_COLUMNS = ('ats_score', 'skill_match_score', 'experience_match_score', 'education_match_score', 'keyword_match_score')
+# Ranking criteria of ApplicationFilterService.rank_applications the store can answer
+RANKING_COLUMNS = {
+    'ats_score': 'ats_score',
+    'skill_match': 'skill_match_score',
+    'experience': 'experience_years',
+    'recent': 'submitted_at',
+}
+FILTERS = {'job', 'min_score', 'max_score', 'status', 'skills', 'skills_any', 'skills_none', 'experience_min'}
+# A sorted row list beats a bitmap once fewer than 1 in 32 rows have the skill (4 bytes per row vs 1 bit per row)
+SPARSE_DENSITY = 1 / 32
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class JobFeatureStore:
+    """Columnar features of one job's applications in a memory-mapped file.
+
+    The file is a JSON header followed by one aligned block per column, so every
+    worker on the host maps the same pages and reads columns as NumPy views.
+    Skills are an inverted index in roaring style: common skills get a packed
+    bitmap over the rows, rare ones a sorted array of row numbers.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], columns: Dict[str, np.ndarray]):
+        self.path = path
+        self.version = header['version']
+        self.count = header['count']
+        # Skill -> ('dense', bitmap row) or ('sparse', start, end) into the postings column
+        self.skills = header['skills']
+        self.columns = columns
+
+    @classmethod
+    def open(cls, path: Path) -> 'JobFeatureStore':
+        raw = np.memmap(path, dtype=np.uint8, mode='r')
+        header_size = int.from_bytes(raw[:8].tobytes(), 'little')
+        header = json.loads(raw[8:8 + header_size].tobytes())
+        if header.get('format') != FORMAT_VERSION:
+            raise ValueError(f'Unsupported feature store format in {path}')
+        start = _align(8 + header_size)
+        columns = {}
+        for column in header['columns']:
+            dtype = np.dtype(column['dtype'])
+            offset = start + column['offset']
+            size = int(np.prod(column['shape'])) * dtype.itemsize
+            columns[column['name']] = raw[offset:offset + size].view(dtype).reshape(column['shape'])
+        return cls(path, header, columns)
+
+    @classmethod
+    def build(cls, job_id, version: int, path: Path) -> 'JobFeatureStore':
+        """Snapshot the job's applications from the database and write them atomically"""
+        rows = list(
+            Application.objects.filter(job_id=job_id).order_by('created_at', 'id').values_list(
+                'id', *SCORE_COLUMNS, 'status', 'submitted_at',
+                'candidate__candidate_profile__experience_years', 'candidate__candidate_profile__skills',
+            )
+        )
+        count = len(rows)
+        postings = defaultdict(list)
+        for i, row in enumerate(rows):
+            for skill in set(row[-1] or []):
+                if isinstance(skill, str):
+                    postings[skill].append(i)
+
+        words = -(-count // 64)
+        dense = [skill for skill in sorted(postings) if len(postings[skill]) >= count * SPARSE_DENSITY]
+        sparse = [skill for skill in sorted(postings) if len(postings[skill]) < count * SPARSE_DENSITY]
+        bitmaps = np.zeros((len(dense), words * 64), dtype=bool)
+        for i, skill in enumerate(dense):
+            bitmaps[i, postings[skill]] = True
+        skill_index = {skill: ('dense', i) for i, skill in enumerate(dense)}
+        offset = 0
+        for skill in sparse:
+            skill_index[skill] = ('sparse', offset, offset + len(postings[skill]))
+            offset += len(postings[skill])
+
+        columns = {
+            'id': np.array([row[0].bytes for row in rows], dtype='S16').view(np.uint8).reshape(count, 16),
+            **{
+                name: np.array([np.nan if row[1 + i] is None else row[1 + i] for row in rows], dtype=np.float32)
+                for i, name in enumerate(SCORE_COLUMNS)
+            },
+            'status': np.array([STATUS_CODES.get(row[6], 255) for row in rows], dtype=np.uint8),
+            'submitted_at': np.array([row[7].timestamp() if row[7] else -np.inf for row in rows], dtype=np.float64),
+            'experience_years': np.array([row[8] or 0 for row in rows], dtype=np.float32),
+            'skill_bitmaps': np.packbits(bitmaps, axis=1, bitorder='little').view(np.uint64),
+            'skill_postings': np.array([row for skill in sparse for row in postings[skill]], dtype=np.uint32),
+        }
+        header = {'format': FORMAT_VERSION, 'version': version, 'count': count, 'skills': skill_index}
+        _write(path, header, columns)
+        return cls.open(path)
+
+    def mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Boolean row mask for filter_applications' filters; NULL scores never match, as in SQL"""
+        mask = np.ones(self.count, dtype=bool)
+        if 'min_score' in filters:
+            mask &= self.columns['ats_score'] >= float(filters['min_score'])
+        if 'max_score' in filters:
+            mask &= self.columns['ats_score'] <= float(filters['max_score'])
+        if 'experience_min' in filters:
+            mask &= self.columns['experience_years'] >= float(filters['experience_min'])
+        if 'status' in filters:
+            # Lookup table over the uint8 codes instead of np.isin's sort
+            allowed = np.zeros(256, dtype=bool)
+            allowed[[STATUS_CODES[status] for status in filters['status'] if status in STATUS_CODES]] = True
+            mask &= allowed[self.columns['status']]
+        if 'skills' in filters or 'skills_any' in filters or 'skills_none' in filters:
+            mask &= self.skill_mask(filters.get('skills', ()), filters.get('skills_any', ()), filters.get('skills_none', ()))
+        return mask
+
+    def skill_mask(self, all_of=(), any_of=(), none_of=()) -> np.ndarray:
+        """Rows with every skill in all_of, at least one in any_of and none in none_of"""
+        words = -(-self.count // 64)
+        result = None
+        for skill in all_of:
+            bits = self._skill_bits(skill, words)
+            result = bits if result is None else result & bits
+        if any_of:
+            either = np.zeros(words, dtype=np.uint64)
+            for skill in any_of:
+                either |= self._skill_bits(skill, words)
+            result = either if result is None else result & either
+        for skill in none_of:
+            bits = ~self._skill_bits(skill, words)
+            result = bits if result is None else result & bits
+        if result is None:
+            return np.ones(self.count, dtype=bool)
+        return np.unpackbits(result.view(np.uint8), count=self.count, bitorder='little').view(bool)
+
+    def _skill_bits(self, skill: str, words: int) -> np.ndarray:
+        """One skill's rows as bitmap words; sparse postings are expanded on the fly"""
+        entry = self.skills.get(skill)
+        if entry is None:
+            return np.zeros(words, dtype=np.uint64)
+        if entry[0] == 'dense':
+            return self.columns['skill_bitmaps'][entry[1]].copy()
+        rows = self.columns['skill_postings'][entry[1]:entry[2]]
+        bits = np.zeros(words * 64, dtype=bool)
+        bits[rows] = True
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    def rank(self, rows: np.ndarray, criteria: str, limit: Optional[int] = None) -> np.ndarray:
+        """Rows ordered best first by a ranking criterion; ties keep their stored order"""
+        column = RANKING_COLUMNS.get(criteria)
+        if column is not None:
+            keys = self.columns[column][rows]
+            if column in ('ats_score', 'skill_match_score'):
+                keys = np.nan_to_num(keys, nan=0.0)  # rank_applications treats a missing score as 0
+            if limit is not None and limit < len(rows):
+                # Only the top `limit` rows need a full sort
+                top = np.argpartition(-keys, limit - 1)[:limit]
+                rows, keys = rows[top], keys[top]
+            rows = rows[np.lexsort((rows, -keys))]
+        return rows[:limit] if limit is not None else rows
+
+    def ids(self, rows: np.ndarray) -> List[uuid.UUID]:
+        return [uuid.UUID(bytes=row.tobytes()) for row in self.columns['id'][rows]]
+
+
+def _write(path: Path, header: Dict[str, Any], columns: Dict[str, np.ndarray]):
+    layout, offset = [], 0
+    for name, array in columns.items():
+        offset = _align(offset)
+        layout.append({'name': name, 'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset})
+        offset += array.nbytes
+    blob = json.dumps({**header, 'columns': layout}).encode()
+    start = _align(8 + len(blob))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Readers keep mapping the old file until they reopen, so replace rather than rewrite in place
+    temporary = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(temporary, 'wb') as f:
+        f.write(len(blob).to_bytes(8, 'little'))
+        f.write(blob)
+        for entry, array in zip(layout, columns.values()):
+            f.seek(start + entry['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        # Pad so a trailing empty column still lies within the file
+        f.truncate(max(start + offset, f.tell()))
+    os.replace(temporary, path)
+
+
+def store_path(job_id) -> Path:
+    return Path(settings.FEATURE_STORE_DIR) / f'{job_id}.features'
+
+
+def _version_key(job_id) -> str:
+    return f'feature_store:version:{job_id}'
+
+
+def current_version(job_id) -> int:
+    """Shared version of a job's features; a missing key starts from the clock so stale files never match"""
+    key = _version_key(job_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate(job_id):
+    """Mark a job's stored features stale on every host; the next read rebuilds them"""
+    try:
+        cache.incr(_version_key(job_id))
+    except ValueError:
+        cache.add(_version_key(job_id), time.time_ns(), timeout=None)
+
+
+def invalidate_on_commit(job_ids: Iterable):
+    job_ids = set(job_ids)
+    if job_ids:
+        transaction.on_commit(lambda: [invalidate(job_id) for job_id in job_ids])
+
+
+_stores: 'OrderedDict[str, JobFeatureStore]' = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_store(job_id) -> JobFeatureStore:
+    """The job's feature store at its current version, reopened or rebuilt when stale"""
+    job_id = str(job_id)
+    # Read the version before the rows, so a write committed mid-build leaves the result stale
+    version = current_version(job_id)
+    with _lock:
+        store = _stores.get(job_id)
+        if store is not None and store.version == version:
+            _stores.move_to_end(job_id)
+            return store
+
+    path = store_path(job_id)
+    store = None
+    if path.exists():
+        try:
+            store = JobFeatureStore.open(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable feature store {path}: {e}")
+    if store is None or store.version != version:
+        store = JobFeatureStore.build(job_id, version, path)
+
+    with _lock:
+        _stores[job_id] = store
+        _stores.move_to_end(job_id)
+        while len(_stores) > settings.FEATURE_STORE_MAX_OPEN:
+            _stores.popitem(last=False)
+    return store
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_bulk_import'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='resume_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
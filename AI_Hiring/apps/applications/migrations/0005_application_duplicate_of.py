@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_application_resume_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='applications.application'),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='duplicate_similarity',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
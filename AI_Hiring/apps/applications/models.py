@@ -19,6 +19,8 @@ class Application(models.Model):
         ('withdrawn', 'Withdrawn'),
     ]
     
+    AUTO_REJECTION_REASON = 'ATS score below threshold'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='applications')
     candidate = models.ForeignKey(User, on_delete=models.CASCADE, related_name='applications')
@@ -37,6 +39,11 @@ class Application(models.Model):
     education_match_score = models.FloatField(null=True, blank=True)
     keyword_match_score = models.FloatField(null=True, blank=True)
     ats_feedback = models.JSONField(default=dict)
+    resume_hash = models.CharField(max_length=64, blank=True, db_index=True)  # key of the cached ats.ParsedResume
+    
+    # Near-duplicate detection
+    duplicate_of = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='duplicates')
+    duplicate_similarity = models.FloatField(null=True, blank=True)
     
     # Tracking
     submitted_at = models.DateTimeField(null=True, blank=True)
@@ -57,6 +64,24 @@ class Application(models.Model):
             models.Index(fields=['candidate', 'status']),
             models.Index(fields=['ats_score']),
         ]
+    
+    def apply_ats_result(self, ats_result):
+        """Copy ATS scores onto the application and auto-process by job thresholds"""
+        self.ats_score = ats_result['total_score']
+        self.skill_match_score = ats_result['scores']['skill_match']
+        self.experience_match_score = ats_result['scores']['experience_match']
+        self.education_match_score = ats_result['scores']['education_match']
+        self.keyword_match_score = ats_result['scores']['keyword_match']
+        self.ats_feedback = ats_result['feedback']
+        self.resume_hash = ats_result.get('resume_hash', self.resume_hash)
+        
+        if self.ats_score < self.job.auto_reject_threshold:
+            self.status = 'rejected'
+            self.rejection_reason = self.AUTO_REJECTION_REASON
+        elif self.ats_score >= self.job.auto_shortlist_threshold:
+            self.status = 'shortlisted'
+        else:
+            self.status = 'under_review'
 
 class ApplicationStatusHistory(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -70,3 +95,44 @@ class ApplicationStatusHistory(models.Model):
     class Meta:
         db_table = 'application_status_history'
         ordering = ['-created_at']
+
+class BulkImport(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('unpacking', 'Unpacking'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='bulk_imports')
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='bulk_imports')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    
+    # Source: either a ZIP archive or individually uploaded files
+    archive = models.FileField(upload_to='applications/bulk_imports/', null=True, blank=True)
+    files = models.JSONField(default=list)
+    
+    # Progress
+    total = models.IntegerField(default=0)
+    processed = models.IntegerField(default=0)
+    created = models.IntegerField(default=0)
+    skipped = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    errors = models.JSONField(default=list)
+    
+    # Metadata
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'application_bulk_imports'
+        ordering = ['-created_at']
+    
+    @property
+    def progress(self):
+        if not self.total:
+            return 0.0
+        return round(self.processed / self.total * 100, 2)
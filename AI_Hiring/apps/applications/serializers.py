@@ -1,21 +1,37 @@
 # apps/applications/serializers.py
+import zipfile
 from rest_framework import serializers
-from .models import Application, ApplicationStatusHistory
+from .models import Application, ApplicationStatusHistory, BulkImport
+from .services import ResumeUploadService
 from apps.jobs.models import Job
 from apps.users.models import User
 
 class ApplicationSerializer(serializers.ModelSerializer):
     candidate_name = serializers.SerializerMethodField()
     job_title = serializers.SerializerMethodField()
+    resume_key = serializers.CharField(write_only=True, required=False)
     
     class Meta:
         model = Application
         fields = [
-            'id', 'job', 'candidate', 'status', 'resume', 'cover_letter',
+            'id', 'job', 'candidate', 'status', 'resume', 'resume_key', 'cover_letter',
             'portfolio_links', 'answers_to_questions', 'ats_score',
             'submitted_at', 'candidate_name', 'job_title'
         ]
         read_only_fields = ['id', 'candidate', 'ats_score', 'submitted_at']
+        extra_kwargs = {'resume': {'required': False}}
+    
+    def validate(self, attrs):
+        # Resumes uploaded directly to the bucket are referenced by key instead of sent inline
+        resume_key = attrs.pop('resume_key', None)
+        if resume_key:
+            try:
+                attrs['resume'] = ResumeUploadService.validate_upload(self.context['request'].user, resume_key)
+            except ValueError as e:
+                raise serializers.ValidationError({'resume_key': str(e)})
+        elif not attrs.get('resume') and self.instance is None:
+            raise serializers.ValidationError({'resume': 'Upload a resume file or provide resume_key'})
+        return attrs
     
     def get_candidate_name(self, obj):
         return f"{obj.candidate.first_name} {obj.candidate.last_name}"
@@ -29,8 +45,30 @@ class ApplicationDetailSerializer(ApplicationSerializer):
     class Meta(ApplicationSerializer.Meta):
         fields = ApplicationSerializer.Meta.fields + [
             'skill_match_score', 'experience_match_score', 'education_match_score',
-            'keyword_match_score', 'ats_feedback', 'notes', 'status_history'
+            'keyword_match_score', 'ats_feedback', 'notes', 'status_history',
+            'duplicate_of', 'duplicate_similarity'
         ]
+        read_only_fields = ApplicationSerializer.Meta.read_only_fields + ['duplicate_of', 'duplicate_similarity']
     
     def get_status_history(self, obj):
         return obj.status_history.values('from_status', 'to_status', 'created_at', 'reason')
+
+class BulkImportSerializer(serializers.ModelSerializer):
+    progress = serializers.FloatField(read_only=True)
+    
+    class Meta:
+        model = BulkImport
+        fields = [
+            'id', 'job', 'status', 'archive', 'total', 'processed', 'created',
+            'skipped', 'failed', 'progress', 'errors', 'created_at', 'completed_at'
+        ]
+        read_only_fields = [
+            'id', 'status', 'total', 'processed', 'created', 'skipped',
+            'failed', 'errors', 'created_at', 'completed_at'
+        ]
+        extra_kwargs = {'archive': {'write_only': True, 'required': False}}
+    
+    def validate_archive(self, value):
+        if value and not zipfile.is_zipfile(value):
+            raise serializers.ValidationError("Archive must be a ZIP file")
+        return value
@@ -0,0 +1,295 @@
+import os
+import uuid
+import zipfile
+from typing import Dict, Iterator, List
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+from apps.ats.dedup import DedupService
+from apps.ats.scanner import profile_links
+from apps.ats.services import ATSService
+from apps.users.models import User, CandidateProfile
+from utils.storage import create_presigned_post, is_s3_storage, open_stored_file
+from . import feature_store
+from .models import Application, BulkImport
+import logging
+
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.txt')
+MAX_RECORDED_ERRORS = 100
+
+
+class BulkImportService:
+    """Service for unpacking resume batches and creating applications in chunks"""
+
+    def __init__(self, bulk_import: BulkImport):
+        self.bulk_import = bulk_import
+        self.chunk_size = settings.BULK_IMPORT_CHUNK_SIZE
+        self.max_files = settings.BULK_IMPORT_MAX_FILES
+        self.max_file_size = settings.BULK_IMPORT_MAX_FILE_SIZE
+        self.unpack_failures = 0
+
+    def iter_chunks(self) -> Iterator[List[str]]:
+        """Stream resumes from the import source into storage, yielding chunks of stored names"""
+        chunk = []
+        for name in self._iter_stored_resumes():
+            chunk.append(name)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _iter_stored_resumes(self) -> Iterator[str]:
+        if self.bulk_import.archive:
+            yield from self._unpack_archive()
+        else:
+            # Multi-file uploads are already in storage
+            yield from self.bulk_import.files[:self.max_files]
+
+    def _unpack_archive(self) -> Iterator[str]:
+        """Extract archive members one at a time so the archive is never held in memory"""
+        prefix = f'applications/bulk_imports/{self.bulk_import.id}/'
+        count = 0
+
+        with self.bulk_import.archive.open('rb') as archive_file:
+            with zipfile.ZipFile(archive_file) as archive:
+                for info in archive.infolist():
+                    filename = os.path.basename(info.filename)
+                    if info.is_dir() or not filename or filename.startswith('.') or '__MACOSX' in info.filename:
+                        continue
+                    if not filename.lower().endswith(RESUME_EXTENSIONS):
+                        continue
+                    if count >= self.max_files:
+                        logger.warning(f"Bulk import {self.bulk_import.id} truncated at {self.max_files} files")
+                        break
+
+                    # Guard against members that lie about their size in the central directory
+                    with archive.open(info) as member:
+                        data = member.read(self.max_file_size + 1)
+                    if len(data) > self.max_file_size:
+                        self.record_errors([{'file': filename, 'error': 'File too large'}])
+                        continue
+
+                    count += 1
+                    yield default_storage.save(prefix + filename, ContentFile(data))
+
+    def import_chunk(self, names: List[str]) -> Dict[str, int]:
+        """Create candidates and applications for a chunk of stored resumes and score them"""
+        ats_service = ATSService()
+        errors = []
+
+        # Extract text and contact details once per resume
+        parsed = {}
+        profile_urls = {}
+        for name in names:
+            try:
+                with open_stored_file(name) as resume_file:
+                    resume_text = ats_service.extract_text_from_resume(resume_file)
+            except Exception as e:
+                errors.append({'file': os.path.basename(name), 'error': str(e)})
+                continue
+
+            contact = ats_service.extract_contact(resume_text)
+            email = contact.get('email', '').lower()
+            if not email:
+                errors.append({'file': os.path.basename(name), 'error': 'No email address found in resume'})
+                continue
+            # The first resume wins when a batch contains the same candidate twice
+            parsed.setdefault(email, (name, resume_text))
+            profile_urls.setdefault(email, profile_links(contact))
+
+        extraction_errors = len(errors)
+        try:
+            applications = self._create_and_score(parsed, profile_urls, errors)
+        except Exception as e:
+            # Count the whole chunk as failed so the import still completes
+            logger.exception(f"Bulk import {self.bulk_import.id} chunk failed: {e}")
+            del errors[extraction_errors:]
+            result = {'processed': len(names), 'created': 0, 'skipped': 0, 'failed': len(names)}
+            errors += [{'file': os.path.basename(name), 'error': f'Import failed: {e}'} for name, _ in parsed.values()]
+            self.record_progress(errors=errors, **result)
+            return result
+
+        # Duplicates within the batch and candidates who already applied are skipped
+        result = {
+            'processed': len(names),
+            'created': len(applications),
+            'skipped': len(names) - len(errors) - len(applications),
+            'failed': len(errors),
+        }
+        self.record_progress(errors=errors, **result)
+        return result
+
+    def _create_and_score(self, parsed: Dict[str, tuple], profile_urls: Dict[str, Dict[str, str]],
+                          errors: List[Dict[str, str]]) -> List[Application]:
+        job = self.bulk_import.job
+        ats_service = ATSService()
+        with transaction.atomic():
+            candidates = self._get_or_create_candidates(list(parsed), profile_urls)
+
+            already_applied = set(
+                Application.objects.filter(job=job, candidate__in=candidates.values())
+                .values_list('candidate_id', flat=True)
+            )
+
+            submitted_at = timezone.now()
+            applications = []
+            texts = []
+            for email, (name, resume_text) in parsed.items():
+                candidate = candidates.get(email)
+                if candidate is None:
+                    errors.append({'file': os.path.basename(name), 'error': 'Email address belongs to another account'})
+                    continue
+                if candidate.id in already_applied:
+                    continue
+                applications.append(Application(
+                    job=job,
+                    candidate=candidate,
+                    status='submitted',
+                    resume=name,
+                    submitted_at=submitted_at,
+                ))
+                texts.append(resume_text)
+
+            # Another chunk of the same import may have created an application for this candidate meanwhile
+            Application.objects.bulk_create(applications, ignore_conflicts=True)
+            inserted = set(Application.objects.filter(pk__in=[a.pk for a in applications]).values_list('pk', flat=True))
+            kept = [(a, text) for a, text in zip(applications, texts) if a.pk in inserted]
+            applications, texts = [a for a, _ in kept], [text for _, text in kept]
+
+        # Score outside the insert transaction so rows are visible while scoring runs
+        for application, ats_result in zip(applications, ats_service.score_resumes(job, texts)):
+            application.apply_ats_result(ats_result)
+
+        Application.objects.bulk_update(applications, [
+            'ats_score', 'skill_match_score', 'experience_match_score', 'education_match_score',
+            'keyword_match_score', 'ats_feedback', 'resume_hash', 'status', 'rejection_reason',
+        ])
+        DedupService().flag_applications(applications)
+        # bulk_create and bulk_update skip the signals that keep the feature store fresh
+        feature_store.invalidate(job.pk)
+        return applications
+
+    def _get_or_create_candidates(self, emails: List[str], profile_urls: Dict[str, Dict[str, str]] = None) -> Dict[str, User]:
+        """Resolve candidate users by lowercased email, bulk creating the ones that don't exist.
+
+        Emails of staff accounts are left out, so they never receive applications.
+        """
+        profile_urls = profile_urls or {}
+        existing = self._users_by_email(emails)
+        candidates = {email: user for email, user in existing.items() if user.role == 'candidate'}
+
+        new_users = [
+            User(
+                username=email,
+                email=email,
+                role='candidate',
+                password=make_password(None),
+            )
+            for email in emails if email not in existing
+        ]
+        # A concurrent chunk may insert the same username; keep its row and skip ours
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+        candidates.update({
+            email: user for email, user in self._users_by_email([user.email for user in new_users]).items()
+            if user.role == 'candidate'
+        })
+
+        created_ids = {user.id for user in new_users}
+        CandidateProfile.objects.bulk_create([
+            CandidateProfile(user=user, **profile_urls.get(email, {}))
+            for email, user in candidates.items() if user.id in created_ids
+        ])
+        return candidates
+
+    @staticmethod
+    def _users_by_email(emails: List[str]) -> Dict[str, User]:
+        """Users by lowercased email; stored addresses keep whatever case they were registered with"""
+        if not emails:
+            return {}
+        users = User.objects.annotate(email_lower=Lower('email')).filter(email_lower__in=emails)
+        # Prefer the candidate account when a staff account shares the address
+        return {user.email_lower: user for user in sorted(users, key=lambda user: user.role == 'candidate')}
+
+    def record_errors(self, errors: List[Dict[str, str]]):
+        self.unpack_failures += len(errors)
+        self.record_progress(errors=errors, processed=len(errors), failed=len(errors))
+
+    def record_progress(self, errors=None, **counters):
+        """Atomically add to the progress counters and complete the import when all chunks are done"""
+        with transaction.atomic():
+            bulk_import = BulkImport.objects.select_for_update().get(id=self.bulk_import.id)
+            for field, value in counters.items():
+                setattr(bulk_import, field, getattr(bulk_import, field) + value)
+            if errors:
+                bulk_import.errors = (bulk_import.errors + errors)[:MAX_RECORDED_ERRORS]
+            self._maybe_complete(bulk_import)
+            bulk_import.save()
+        self.bulk_import = bulk_import
+
+    def set_status(self, status: str, total: int = None):
+        with transaction.atomic():
+            bulk_import = BulkImport.objects.select_for_update().get(id=self.bulk_import.id)
+            bulk_import.status = status
+            if total is not None:
+                bulk_import.total = total
+            self._maybe_complete(bulk_import)
+            bulk_import.save()
+        self.bulk_import = bulk_import
+
+    def _maybe_complete(self, bulk_import: BulkImport):
+        if bulk_import.status == 'processing' and bulk_import.processed >= bulk_import.total:
+            bulk_import.status = 'completed'
+            bulk_import.completed_at = timezone.now()
+
+
+def save_uploaded_resumes(bulk_import: BulkImport, uploaded_files) -> List[str]:
+    """Store a multi-file upload under the import's prefix and return the storage names"""
+    prefix = f'applications/bulk_imports/{bulk_import.id}/'
+    return [default_storage.save(prefix + os.path.basename(f.name), f) for f in uploaded_files]
+
+
+class ResumeUploadService:
+    """Direct-to-bucket resume uploads so large files never pass through the web worker"""
+
+    @staticmethod
+    def is_available() -> bool:
+        return is_s3_storage(default_storage)
+
+    @staticmethod
+    def upload_prefix(user) -> str:
+        return f'{Application.resume.field.upload_to}uploads/{user.pk}/'
+
+    @classmethod
+    def create_upload(cls, user, filename: str) -> Dict[str, object]:
+        """Reserve a key under the user's upload prefix and presign a POST for it"""
+        name = cls.upload_prefix(user) + f'{uuid.uuid4().hex}/' + default_storage.get_valid_name(os.path.basename(filename))
+        presigned = create_presigned_post(
+            name,
+            max_size=settings.RESUME_MAX_UPLOAD_SIZE,
+            expires_in=settings.RESUME_UPLOAD_URL_EXPIRY,
+        )
+        return {
+            'resume_key': name,
+            'url': presigned['url'],
+            'fields': presigned['fields'],
+            'max_size': settings.RESUME_MAX_UPLOAD_SIZE,
+            'expires_in': settings.RESUME_UPLOAD_URL_EXPIRY,
+        }
+
+    @classmethod
+    def validate_upload(cls, user, name: str) -> str:
+        """Check that a client-supplied key belongs to the user and the object landed in storage"""
+        if not name.startswith(cls.upload_prefix(user)) or '..' in name:
+            raise ValueError('Invalid resume key')
+        if not name.lower().endswith(RESUME_EXTENSIONS):
+            raise ValueError('Unsupported resume file type')
+        if not default_storage.exists(name):
+            raise ValueError('Resume upload not found')
+        return name
@@ -0,0 +1,19 @@
+# apps/applications/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.users.models import CandidateProfile
+from . import feature_store
+from .models import Application
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_job_features(sender, instance, **kwargs):
+    feature_store.invalidate_on_commit([instance.job_id])
+
+
+@receiver(post_save, sender=CandidateProfile)
+def invalidate_candidate_features(sender, instance, **kwargs):
+    # Skills and experience are stored with every job the candidate applied to
+    job_ids = Application.objects.filter(candidate_id=instance.user_id).values_list('job_id', flat=True).distinct()
+    feature_store.invalidate_on_commit(job_ids)
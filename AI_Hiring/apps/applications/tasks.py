@@ -0,0 +1,38 @@
+from celery import shared_task
+from .models import BulkImport
+from .services import BulkImportService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def process_bulk_import(bulk_import_id):
+    """Unpack a bulk import and fan the resumes out to chunk workers"""
+    bulk_import = BulkImport.objects.select_related('job').get(id=bulk_import_id)
+    service = BulkImportService(bulk_import)
+    service.set_status('unpacking')
+
+    dispatched = 0
+    try:
+        for names in service.iter_chunks():
+            import_resume_chunk.delay(str(bulk_import_id), names)
+            dispatched += len(names)
+    except Exception as e:
+        logger.error(f"Failed to unpack bulk import {bulk_import_id}: {e}")
+        service.record_progress(errors=[{'file': '', 'error': f'Could not unpack archive: {e}'}])
+        if not dispatched:
+            service.set_status('failed')
+            return False
+
+    # Chunks may already be finished, in which case this completes the import
+    service.set_status('processing', total=dispatched + service.unpack_failures)
+    logger.info(f"Bulk import {bulk_import_id} dispatched {dispatched} resumes")
+    return True
+
+
+@shared_task
+def import_resume_chunk(bulk_import_id, names):
+    """Create and score applications for one chunk of a bulk import"""
+    bulk_import = BulkImport.objects.select_related('job').get(id=bulk_import_id)
+    return BulkImportService(bulk_import).import_chunk(names)
@@ -1,3 +1,199 @@
-from django.test import TestCase
+import io
+import os
+from unittest import mock, skipUnless
+import requests
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from moto import mock_aws
+from storages.backends.s3 import S3Storage
+from apps.ats.services import ApplicationFilterService
+from apps.jobs.models import Job
+from apps.users.models import CandidateProfile, User
+from .models import Application, BulkImport
+from utils.postgres import is_postgres
+from utils.storage import open_stored_file
+from .services import BulkImportService, ResumeUploadService
 
-# Create your tests here.
+
+def store_resume(filename, email):
+    text = f"Jane Doe\n{email}\n\nSkills\nPython, Django, SQL\n\nExperience\nBackend Engineer, 2018 - 2023\n"
+    return default_storage.save(f'applications/bulk_imports/test/{filename}', ContentFile(text.encode()))
+
+
+class BulkImportChunkTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create(username='recruiter', email='recruiter@example.com', role='recruiter')
+        self.job = Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python'],
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+        self.bulk_import = BulkImport.objects.create(job=self.job, created_by=self.recruiter, status='processing', total=1)
+
+    def import_chunk(self, names):
+        return BulkImportService(self.bulk_import).import_chunk(names)
+
+    def test_existing_candidate_matched_case_insensitively(self):
+        candidate = User.objects.create(username='jane', email='Jane.Doe@Example.com', role='candidate')
+
+        result = self.import_chunk([store_resume('jane.txt', 'jane.doe@example.com')])
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(User.objects.filter(email__iexact='jane.doe@example.com').count(), 1)
+        self.assertTrue(Application.objects.filter(job=self.job, candidate=candidate).exists())
+
+    def test_staff_email_gets_no_application(self):
+        result = self.import_chunk([store_resume('recruiter.txt', 'recruiter@example.com')])
+
+        self.assertEqual(result['failed'], 1)
+        self.assertFalse(Application.objects.filter(candidate=self.recruiter).exists())
+        self.assertEqual(User.objects.filter(email='recruiter@example.com').count(), 1)
+
+    def test_candidate_created_by_another_chunk_is_reused(self):
+        self.import_chunk([store_resume('first.txt', 'new@example.com')])
+        self.bulk_import.refresh_from_db()
+        self.bulk_import.total += 1
+        self.bulk_import.save()
+
+        result = self.import_chunk([store_resume('second.txt', 'new@example.com')])
+
+        self.assertEqual(result['skipped'], 1)
+        self.assertEqual(User.objects.filter(email='new@example.com').count(), 1)
+
+    def test_failed_chunk_still_completes_import(self):
+        with mock.patch('apps.applications.services.ATSService.score_resumes', side_effect=RuntimeError('scoring down')):
+            result = self.import_chunk([store_resume('jane.txt', 'jane@example.com')])
+
+        self.assertEqual(result, {'processed': 1, 'created': 0, 'skipped': 0, 'failed': 1})
+        self.bulk_import.refresh_from_db()
+        self.assertEqual(self.bulk_import.status, 'completed')
+        self.assertIn('scoring down', self.bulk_import.errors[0]['error'])
+
+
+class SkillFilterTests(TestCase):
+    def setUp(self):
+        self.job = Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python'],
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+        self.applications = []
+        for i, skills in enumerate([['Python', 'Django'], ['Go'], []]):
+            candidate = User.objects.create(username=f'candidate{i}', email=f'candidate{i}@example.com', role='candidate')
+            CandidateProfile.objects.create(user=candidate, skills=skills)
+            self.applications.append(
+                Application.objects.create(job=self.job, candidate=candidate, status='submitted', ats_score=50 + i)
+            )
+
+    def test_empty_skill_lists_agree_between_store_and_database(self):
+        service = ApplicationFilterService()
+        for key in ('skills', 'skills_any', 'skills_none'):
+            with self.subTest(key):
+                filters = {'job': str(self.job.id), key: []}
+
+                from_store = service.ranked_ids(filters)
+                from_database = service.filter_applications(Application.objects.all(), filters)
+
+                self.assertEqual(len(from_store), 3)
+                self.assertEqual(set(from_store), set(from_database.values_list('id', flat=True)))
+
+    @skipUnless(is_postgres(), 'JSON containment and has_any_keys on arrays need PostgreSQL')
+    def test_skill_filters_agree_between_store_and_database(self):
+        service = ApplicationFilterService()
+        cases = [
+            ({'skills': ['Python', 'Django']}, [0]),
+            ({'skills': ['Python', 'Go']}, []),
+            ({'skills_any': ['Go', 'Django']}, [0, 1]),
+            ({'skills_none': ['Go']}, [0, 2]),
+            ({'skills': ['Python'], 'skills_none': ['Django']}, []),
+        ]
+        for filters, expected in cases:
+            with self.subTest(filters):
+                filters = {'job': str(self.job.id), **filters}
+
+                from_store = service.ranked_ids(filters)
+                from_database = service.filter_applications(Application.objects.all(), filters)
+
+                self.assertEqual(set(from_store), {self.applications[i].id for i in expected})
+                self.assertEqual(set(from_store), set(from_database.values_list('id', flat=True)))
+
+
+# docker-compose's MinIO, e.g. http://localhost:9000; without it the tests run against moto's in-process S3
+S3_TEST_ENDPOINT_URL = os.environ.get('S3_TEST_ENDPOINT_URL')
+
+
+@override_settings(RESUME_MAX_UPLOAD_SIZE=1024, RESUME_RANGE_READ_SIZE=16)
+class DirectUploadTests(TestCase):
+    """Presigned upload, validation and ranged reads against an S3-compatible stand-in"""
+
+    bucket = 'resumes-test'
+
+    def setUp(self):
+        if S3_TEST_ENDPOINT_URL is None:
+            s3_mock = mock_aws()
+            s3_mock.start()
+            self.addCleanup(s3_mock.stop)
+        # Swap the storage in directly: overriding STORAGES in Django 4.2 drops the backend OPTIONS
+        storage = S3Storage(
+            bucket_name=self.bucket,
+            endpoint_url=S3_TEST_ENDPOINT_URL,
+            access_key=os.environ.get('S3_TEST_ACCESS_KEY', 'minioadmin'),
+            secret_key=os.environ.get('S3_TEST_SECRET_KEY', 'minioadmin'),
+            region_name='us-east-1',
+        )
+        storage_patch = mock.patch.object(default_storage, '_wrapped', storage)
+        storage_patch.start()
+        self.addCleanup(storage_patch.stop)
+        client = default_storage.connection.meta.client
+        if self.bucket not in [bucket['Name'] for bucket in client.list_buckets()['Buckets']]:
+            client.create_bucket(Bucket=self.bucket)
+        self.candidate = User.objects.create(username='candidate', email='candidate@example.com', role='candidate')
+
+    def upload(self, presigned, content):
+        return requests.post(
+            presigned['url'],
+            data={**presigned['fields'], 'Content-Type': 'text/plain'},
+            files={'file': ('resume.txt', content)},
+            timeout=10,
+        )
+
+    def test_presigned_upload_round_trip(self):
+        content = b'Jane Doe\njane@example.com\n' * 20
+        presigned = ResumeUploadService.create_upload(self.candidate, 'resume.txt')
+
+        response = self.upload(presigned, content)
+
+        self.assertLess(response.status_code, 300, response.text)
+        name = ResumeUploadService.validate_upload(self.candidate, presigned['resume_key'])
+        # Reads go through 16-byte ranged GETs
+        with open_stored_file(name) as resume_file:
+            self.assertEqual(resume_file.read(), content)
+            resume_file.seek(-9, io.SEEK_END)
+            self.assertEqual(resume_file.read(), b'mple.com\n')
+
+    @skipUnless(S3_TEST_ENDPOINT_URL, 'moto does not enforce POST policy conditions')
+    def test_oversized_upload_is_refused(self):
+        presigned = ResumeUploadService.create_upload(self.candidate, 'resume.txt')
+
+        response = self.upload(presigned, b'x' * 2048)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_upload_key_must_belong_to_user(self):
+        presigned = ResumeUploadService.create_upload(self.candidate, 'resume.txt')
+        self.upload(presigned, b'resume')
+        other = User.objects.create(username='other', email='other@example.com', role='candidate')
+
+        with self.assertRaisesMessage(ValueError, 'Invalid resume key'):
+            ResumeUploadService.validate_upload(other, presigned['resume_key'])
+
+    def test_missing_upload_is_rejected(self):
+        presigned = ResumeUploadService.create_upload(self.candidate, 'resume.txt')
+
+        with self.assertRaisesMessage(ValueError, 'Resume upload not found'):
+            ResumeUploadService.validate_upload(self.candidate, presigned['resume_key'])
+
+    @override_settings(AWS_S3_PUBLIC_ENDPOINT_URL='http://uploads.example.test')
+    def test_presigned_url_uses_public_endpoint(self):
+        presigned = ResumeUploadService.create_upload(self.candidate, 'resume.txt')
+
+        self.assertTrue(presigned['url'].startswith('http://uploads.example.test/'))
@@ -1,11 +1,14 @@
 # apps/applications/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ApplicationViewSet
+from .views import ApplicationViewSet, BulkImportViewSet
+from .async_views import application_status
 
 router = DefaultRouter()
+router.register(r'bulk-imports', BulkImportViewSet)
 router.register(r'', ApplicationViewSet)
 
 urlpatterns = [
+    path('async/<uuid:pk>/status/', application_status, name='application-status-async'),
     path('', include(router.urls)),
 ]
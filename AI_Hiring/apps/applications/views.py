@@ -1,18 +1,30 @@
-from rest_framework import viewsets, status, filters
+from rest_framework import viewsets, mixins, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
-from .models import Application, ApplicationStatusHistory
-from .serializers import ApplicationSerializer, ApplicationDetailSerializer
+from .models import Application, ApplicationStatusHistory, BulkImport
+from .serializers import ApplicationSerializer, ApplicationDetailSerializer, BulkImportSerializer
+from .services import RESUME_EXTENSIONS, ResumeUploadService, save_uploaded_resumes
+from .tasks import process_bulk_import
+from apps.ats.dedup import DedupService
+from apps.ats.scanner import profile_links
 from apps.ats.services import ATSService, ApplicationFilterService
+from apps.interviews.models import FeedbackSummary
+from apps.interviews.serializers import FeedbackSummarySerializer
 from apps.notifications.services import EmailService
-from utils.permissions import IsRecruiterOrOwner, IsRecruiter
+from apps.users.models import CandidateProfile
+from utils.permissions import IsHiringManager, IsRecruiterOrOwner, IsRecruiter, get_user_role
+from utils.instrumentation import span
+from utils.db_routing import ReplicaReadMixin
 
-class ApplicationViewSet(viewsets.ModelViewSet):
+class ApplicationViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     queryset = Application.objects.all()
+    # bulk_filter stays on the primary: a feature store built from a lagging replica would be stale until the next write
+    replica_actions = ('list', 'retrieve', 'ats_report', 'duplicates', 'feedback_summary', 'compare')
     serializer_class = ApplicationSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -36,10 +48,11 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
+        role = get_user_role(self.request)
         
-        if user.role == 'candidate':
-            return queryset.filter(candidate=user)
-        elif user.role in ['recruiter', 'hiring_manager']:
+        if role == 'candidate':
+            return queryset.filter(candidate_id=user.pk)
+        elif role in ['recruiter', 'hiring_manager']:
             return queryset
         else:
             return queryset.none()
@@ -50,44 +63,53 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Set candidate
-        serializer.validated_data['candidate'] = request.user
-        
-        # Save application
-        application = serializer.save()
+        # Save application for the requesting candidate
+        application = serializer.save(candidate_id=request.user.pk)
         
         # Calculate ATS score
         ats_service = ATSService()
         ats_result = ats_service.calculate_ats_score(application, application.job)
         
-        # Update application with scores
-        application.ats_score = ats_result['total_score']
-        application.skill_match_score = ats_result['scores']['skill_match']
-        application.experience_match_score = ats_result['scores']['experience_match']
-        application.education_match_score = ats_result['scores']['education_match']
-        application.keyword_match_score = ats_result['scores']['keyword_match']
-        application.ats_feedback = ats_result['feedback']
-        
-        # Auto-process based on thresholds
-        if application.ats_score < application.job.auto_reject_threshold:
-            application.status = 'rejected'
-            application.rejection_reason = 'ATS score below threshold'
-        elif application.ats_score >= application.job.auto_shortlist_threshold:
-            application.status = 'shortlisted'
-        else:
-            application.status = 'under_review'
+        # Update application with scores and auto-process based on thresholds
+        application.apply_ats_result(ats_result)
         
         application.submitted_at = timezone.now()
         application.save()
+        with span('ats.dedup'):
+            DedupService().flag_applications([application])
+        
+        # Fill in profile links the candidate hasn't set from their resume
+        links = profile_links(ats_result.get('entities', {}).get('contact', {}))
+        for field, url in links.items():
+            CandidateProfile.objects.filter(user_id=request.user.pk, **{field: ''}).update(**{field: url})
         
         # Send confirmation email
-        EmailService.send_application_confirmation.delay(application.id)
+        with span('email.enqueue'):
+            EmailService.send_application_confirmation.delay(application.id)
         
         return Response(
             ApplicationDetailSerializer(application).data,
             status=status.HTTP_201_CREATED
         )
     
+    @action(detail=False, methods=['post'])
+    def upload_url(self, request):
+        """Get a presigned POST for uploading a resume directly to object storage"""
+        if not ResumeUploadService.is_available():
+            return Response(
+                {'error': 'Direct uploads require S3 storage'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        filename = request.data.get('filename', '')
+        if not filename.lower().endswith(RESUME_EXTENSIONS):
+            return Response(
+                {'error': 'Unsupported resume file type'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(ResumeUploadService.create_upload(request.user, filename))
+    
     @action(detail=True, methods=['post'], permission_classes=[IsRecruiter])
     def update_status(self, request, pk=None):
         """Update application status with history tracking"""
@@ -108,7 +130,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             application=application,
             from_status=old_status,
             to_status=new_status,
-            changed_by=request.user,
+            changed_by_id=request.user.pk,
             reason=reason
         )
         
@@ -131,16 +153,36 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         queryset = self.get_queryset()
         filters = request.data.get('filters', {})
         ranking = request.data.get('ranking', 'ats_score')
+        limit = request.data.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                limit = 0
+            if limit < 1:
+                return Response({'error': 'limit must be a positive integer'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Apply filters
-        filtered_qs = filter_service.filter_applications(queryset, filters)
-        
-        # Rank applications
-        applications = list(filtered_qs)
-        ranked_applications = filter_service.rank_applications(applications, ranking)
+        # A single job's filters and ranking are answered from its feature store; the DB only loads the result
+        with span('filter.store'):
+            application_ids = filter_service.ranked_ids(filters, ranking, limit)
+        if application_ids is not None:
+            with span('filter.hydrate'):
+                ranked_applications = filter_service.hydrate(queryset, application_ids)
+        else:
+            # Apply filters
+            filtered_qs = filter_service.filter_applications(queryset, filters)
+            if ranking == 'calibrated_feedback':
+                filtered_qs = filtered_qs.select_related('feedback_summary')
+            
+            # Rank applications
+            with span('filter.query'):
+                applications = list(filtered_qs)
+            with span('filter.rank'):
+                ranked_applications = filter_service.rank_applications(applications, ranking)[:limit]
         
-        serializer = ApplicationSerializer(ranked_applications, many=True)
-        return Response(serializer.data)
+        with span('serialize'):
+            data = ApplicationSerializer(ranked_applications, many=True).data
+        return Response(data)
     
     @action(detail=True, methods=['get'])
     def ats_report(self, request, pk=None):
@@ -155,3 +197,68 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             'keyword_match_score': application.keyword_match_score,
             'feedback': application.ats_feedback,
         })
+    
+    @action(detail=True, methods=['get'], permission_classes=[IsRecruiter])
+    def duplicates(self, request, pk=None):
+        """Applications from other candidates with an identical or near-identical resume"""
+        application = self.get_object()
+        matches = DedupService().duplicates_for(application)
+        return Response([
+            {**ApplicationSerializer(other, context=self.get_serializer_context()).data, 'similarity': round(similarity, 3)}
+            for other, similarity in matches
+        ])
+    
+    @action(detail=True, methods=['get'], permission_classes=[IsHiringManager])
+    def feedback_summary(self, request, pk=None):
+        """Get the precomputed interview feedback summary for an application"""
+        summary = FeedbackSummary.objects.filter(application_id=pk).first()
+        if summary is None:
+            return Response({'error': 'No interview feedback yet'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(FeedbackSummarySerializer(summary).data)
+    
+    @action(detail=False, methods=['get'], permission_classes=[IsHiringManager])
+    def compare(self, request):
+        """Compare candidates for a job by their calibrated interview feedback"""
+        job_id = request.query_params.get('job')
+        if not job_id:
+            return Response({'error': 'job is required'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        summaries = FeedbackSummary.objects.filter(application__job_id=job_id).order_by(
+            F('calibrated_rating').desc(nulls_last=True),
+            F('calibrated_overall').desc(nulls_last=True),
+            F('overall_mean').desc(nulls_last=True)
+        )
+        return Response(FeedbackSummarySerializer(summaries, many=True).data)
+
+
+class BulkImportViewSet(ReplicaReadMixin,
+                        mixins.CreateModelMixin,
+                        mixins.RetrieveModelMixin,
+                        mixins.ListModelMixin,
+                        viewsets.GenericViewSet):
+    """Bulk resume ingestion for a job from a ZIP archive or a multi-file upload"""
+    queryset = BulkImport.objects.all()
+    serializer_class = BulkImportSerializer
+    permission_classes = [IsRecruiter]
+    filterset_fields = ['job', 'status']
+    
+    def create(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        uploaded_files = request.FILES.getlist('files')
+        if not serializer.validated_data.get('archive') and not uploaded_files:
+            return Response(
+                {'error': 'Provide a ZIP archive or one or more resume files'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        with transaction.atomic():
+            bulk_import = serializer.save(created_by_id=request.user.pk)
+            if uploaded_files:
+                bulk_import.files = save_uploaded_resumes(bulk_import, uploaded_files)
+                bulk_import.save(update_fields=['files'])
+            
+            transaction.on_commit(lambda: process_bulk_import.delay(str(bulk_import.id)))
+        
+        return Response(self.get_serializer(bulk_import).data, status=status.HTTP_202_ACCEPTED)
@@ -0,0 +1,162 @@
+# apps/ats/benchmarks/corpus.py
+import io
+import random
+from typing import List
+import docx
+from apps.jobs.models import Job
+
+FIRST_NAMES = ('Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Avery', 'Quinn', 'Jamie', 'Drew')
+LAST_NAMES = ('Smith', 'Garcia', 'Chen', 'Okafor', 'Novak', 'Patel', 'Silva', 'Kowalski', 'Haddad', 'Larsen')
+COMPANIES = ('Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries', 'Wayne Analytics', 'Vandelay')
+TITLES = ('Software Engineer', 'Backend Developer', 'Data Engineer', 'Data Scientist', 'DevOps Engineer',
+          'Frontend Developer', 'Engineering Manager', 'Machine Learning Engineer', 'QA Engineer')
+SKILLS = (
+    'Python', 'Java', 'JavaScript', 'Go', 'Ruby', 'React', 'Angular', 'Vue', 'Django', 'Flask', 'Spring',
+    'Node.js', 'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch', 'AWS', 'Azure', 'GCP',
+    'Docker', 'Kubernetes', 'Terraform', 'Jenkins', 'Git', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
+    'Tableau', 'Agile', 'Scrum', 'Leadership', 'Communication',
+)
+VERBS = ('Built', 'Designed', 'Led', 'Migrated', 'Optimized', 'Automated', 'Maintained', 'Launched', 'Scaled')
+OBJECTS = ('payment services', 'data pipelines', 'internal dashboards', 'the search platform', 'CI pipelines',
+           'customer APIs', 'recommendation models', 'reporting jobs', 'the mobile backend')
+OUTCOMES = ('cutting latency by {n}%', 'serving {n}k requests per minute', 'saving {n} hours per week',
+            'reducing costs by {n}%', 'for {n} enterprise customers')
+DEGREES = ('Bachelor of Science in Computer Science', 'Master of Science in Data Science', 'B.Tech in Information Technology',
+           'Bachelor of Arts in Economics', 'MBA', 'PhD in Statistics', 'Associate Degree in Networking')
+SCHOOLS = ('State University', 'Institute of Technology', 'City College', 'Polytechnic University')
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+PDF_LINES_PER_PAGE = 60
+
+
+def generate_resume(rng: random.Random, positions: int = None) -> str:
+    """One plain-text resume with contact details, dated positions, education and skills"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f'{first}.{last}{rng.randint(1, 999)}'.lower()
+    skills = rng.sample(SKILLS, rng.randint(5, 14))
+    positions = positions or rng.randint(1, 6)
+
+    lines = [
+        f'{first} {last}',
+        f'{handle}@example.com | +1 ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}',
+        f'linkedin.com/in/{handle.replace(".", "-")} | https://github.com/{handle.replace(".", "")}',
+        '',
+        'Summary',
+        f'{rng.choice(TITLES)} with {rng.randint(1, 15)}+ years of experience in {", ".join(skills[:3])}.',
+        '',
+        'Experience',
+    ]
+
+    year = 2024
+    for _ in range(positions):
+        start_year = year - rng.randint(1, 4)
+        lines.append(
+            f'{rng.choice(TITLES)}, {rng.choice(COMPANIES)} '
+            f'{rng.choice(MONTHS)} {start_year} - {rng.choice(MONTHS)} {year}'
+        )
+        for _ in range(rng.randint(2, 5)):
+            outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+            lines.append(f'- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)}, {outcome}.')
+        year = start_year - rng.randint(0, 1)
+
+    lines += ['', 'Education']
+    for _ in range(rng.randint(1, 2)):
+        lines.append(f'{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}, {rng.randint(1995, 2020)}')
+
+    lines += ['', 'Skills', ', '.join(skills)]
+    if rng.random() < 0.4:
+        lines += ['', 'Certifications', 'AWS Certified Solutions Architect']
+    return '\n'.join(lines)
+
+
+def generate_corpus(size: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [generate_resume(rng) for _ in range(size)]
+
+
+def generate_jobs(count: int, seed: int = 0) -> List[Job]:
+    """Unsaved jobs; the scoring engine reads their fields without touching the database"""
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        skills = rng.sample(SKILLS, 8)
+        minimum = rng.randint(0, 8)
+        jobs.append(Job(
+            title=rng.choice(TITLES),
+            description=f'We are hiring to work on {rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}.',
+            requirements=[
+                f"{rng.choice(('Bachelor', 'Master'))}'s degree in Computer Science or related field",
+                f'{minimum}+ years of experience with {skills[0]}',
+                f'Experience with {skills[1]} and {skills[2]}',
+            ],
+            responsibilities=[f'{rng.choice(VERBS)} {rng.choice(OBJECTS)}' for _ in range(3)],
+            skills_required=skills[:5],
+            skills_preferred=skills[5:],
+            job_type='full_time',
+            experience_level='mid',
+            experience_min_years=minimum,
+            experience_max_years=minimum + rng.randint(2, 6),
+            location='Remote',
+        ))
+    return jobs
+
+
+def _pdf_escape(line: str) -> bytes:
+    return line.encode('latin-1', errors='replace').replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def render_pdf(text: str) -> bytes:
+    """Minimal uncompressed PDF with one Helvetica text line per resume line"""
+    lines = text.splitlines() or ['']
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        3: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    }
+    kids = []
+    number = 4
+    for start in range(0, len(lines), PDF_LINES_PER_PAGE):
+        content = b'BT /F1 10 Tf 12 TL 50 760 Td ' + b''.join(
+            b'(' + _pdf_escape(line) + b') Tj T* ' for line in lines[start:start + PDF_LINES_PER_PAGE]
+        ) + b'ET'
+        objects[number] = (
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % (number + 1)
+        )
+        objects[number + 1] = b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content)
+        kids.append(number)
+        number += 2
+    objects[2] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(b'%d 0 R' % kid for kid in kids), len(kids))
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(output)
+        output += b'%d 0 obj\n%s\nendobj\n' % (number, objects[number])
+    xref = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    output += b''.join(b'%010d 00000 n \n' % offsets[number] for number in sorted(objects))
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(output)
+
+
+def render_docx(text: str) -> bytes:
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+RENDERERS = {
+    'pdf': render_pdf,
+    'docx': render_docx,
+    'txt': lambda text: text.encode('utf-8'),
+}
+
+
+def resume_file(data: bytes, extension: str) -> io.BytesIO:
+    """In-memory upload named the way extract_text_from_resume dispatches on"""
+    buffer = io.BytesIO(data)
+    buffer.name = f'resume.{extension}'
+    return buffer
@@ -0,0 +1,190 @@
+# apps/ats/benchmarks/runner.py
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+import numpy as np
+from apps.ats import services
+from apps.ats.dedup import minhash
+from apps.ats.parsing import parse_resume
+from apps.ats.scanner import scan_resume
+from apps.ats.scoring import ScoringEngine
+from .corpus import RENDERERS, generate_corpus, generate_jobs, resume_file
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+DEFAULT_SIZES = (25, 100, 400)
+BATCH_REPEATS = 200
+DEFAULT_ROUNDS = 3
+# Timings below this are dominated by timer and scheduler noise, so only their memory is compared
+NOISE_FLOOR_MS = 0.15
+
+
+@contextmanager
+def offline_pipeline():
+    """Pin the ATS service to its local rule-based path so runs are comparable across machines"""
+    spacy_available = services.SPACY_AVAILABLE
+    services.SPACY_AVAILABLE = False
+    try:
+        yield
+    finally:
+        services.SPACY_AVAILABLE = spacy_available
+
+
+def measure(name: str, size: int, func: Callable, calls: Sequence, units_per_call: int = 1,
+            track_memory: bool = True, rounds: int = DEFAULT_ROUNDS) -> Dict[str, object]:
+    """Time func over every call argument (fastest of several rounds), then rerun it under tracemalloc for peak memory"""
+    func(calls[0])  # warm caches and lazy imports
+    latencies, elapsed = None, float('inf')
+    for _ in range(rounds):
+        # Interference from other processes only ever adds time, so the fastest round is the least noisy
+        round_latencies = np.empty(len(calls))
+        gc.collect()
+        started = time.perf_counter()
+        for i, argument in enumerate(calls):
+            call_started = time.perf_counter()
+            func(argument)
+            round_latencies[i] = time.perf_counter() - call_started
+        round_elapsed = time.perf_counter() - started
+        if round_elapsed < elapsed:
+            latencies, elapsed = round_latencies, round_elapsed
+
+    peak_kb = None
+    if track_memory:
+        # A separate pass, since tracing allocations slows every call down
+        gc.collect()
+        tracemalloc.start()
+        for argument in calls:
+            func(argument)
+        peak_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {
+        'name': name,
+        'size': size,
+        'calls': len(calls),
+        'per_sec': round(len(calls) * units_per_call / elapsed, 1),
+        'p50_ms': round(p50, 3),
+        'p95_ms': round(p95, 3),
+        'p99_ms': round(p99, 3),
+        'peak_kb': peak_kb,
+    }
+
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, seed: int = 0, track_memory: bool = True,
+              only: Sequence[str] = (), rounds: int = DEFAULT_ROUNDS) -> List[Dict[str, object]]:
+    """Run every ATS pipeline benchmark at each corpus size; ``only`` filters by name prefix"""
+    results = []
+
+    def selected(name):
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    def run(name, size, func, calls, units_per_call=1):
+        if selected(name):
+            results.append(measure(name, size, func, calls, units_per_call, track_memory, rounds))
+
+    with offline_pipeline():
+        service = services.ATSService()
+        service.openai_client = None
+        job = generate_jobs(1, seed)[0]
+        engine = ScoringEngine.for_job(job)
+
+        for size in sizes:
+            texts = generate_corpus(size, seed)
+
+            for extension, render in RENDERERS.items():
+                documents = [render(text) for text in texts] if selected(f'extract_text.{extension}') else []
+                run(f'extract_text.{extension}', size,
+                    lambda data, extension=extension: service.extract_text_from_resume(resume_file(data, extension)),
+                    documents)
+
+            run('scan_resume', size, scan_resume, texts)
+            run('parse_resume', size, parse_resume, texts)
+            run('extract_resume_entities', size, service.extract_resume_entities, texts)
+            run('minhash', size, lambda text: minhash(text, 128), texts)
+
+            parsed = [service.build_parsed_resume(text, content_hash=str(i)) for i, text in enumerate(texts)]
+            run('extract_features', size,
+                lambda record: service.extract_features(record.text, record.entities, job, record.structured),
+                parsed)
+
+            features = engine.to_arrays([
+                service.extract_features(record.text, record.entities, job, record.structured) for record in parsed
+            ])
+            # Each score component over the whole batch, the vectorized successors of the _calculate_* methods
+            repeats = [features] * BATCH_REPEATS
+            run('score.skill_match', size, engine._skill_match, repeats, size)
+            run('score.experience_match', size, lambda batch: engine._experience_match(batch['years']), repeats, size)
+            run('score.education_match', size, engine._education_match, repeats, size)
+            run('score.batch', size, engine.score_batch, repeats, size)
+
+            # End to end as calculate_ats_score does it, minus the Postgres cache lookups
+            pdfs = [RENDERERS['pdf'](text) for text in texts] if selected('end_to_end') else []
+            run('end_to_end', size, lambda data: score_uncached(service, engine, job, data), pdfs)
+
+    return results
+
+
+def score_uncached(service, engine, job, pdf_data: bytes) -> Dict[str, object]:
+    text = service.extract_text_from_resume(resume_file(pdf_data, 'pdf'))
+    record = service.build_parsed_resume(text)
+    row = service.extract_features(record.text, record.entities, job, record.structured)
+    batch = engine.score_batch(engine.to_arrays([row]))
+    return {component: float(values[0]) for component, values in batch.items()}
+
+
+def environment() -> Dict[str, object]:
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'sklearn': services.SKLEARN_AVAILABLE,
+        'nltk': services.NLTK_AVAILABLE,
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, object]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results: List[Dict[str, object]], path: Path = BASELINE_PATH):
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+        f.write('\n')
+
+
+def compare(results: List[Dict[str, object]], baseline: Dict[str, object], tolerance: float) -> List[Dict[str, object]]:
+    """Benchmarks whose median latency, throughput or peak memory moved past the tolerance"""
+    previous = {(row['name'], row['size']): row for row in baseline.get('results', [])}
+    regressions = []
+    for row in results:
+        before = previous.get((row['name'], row['size']))
+        if before is None:
+            continue
+        timed = before['p50_ms'] >= NOISE_FLOOR_MS
+        checks = {
+            'p50_ms': timed and row['p50_ms'] > before['p50_ms'] * (1 + tolerance),
+            'per_sec': timed and row['per_sec'] < before['per_sec'] / (1 + tolerance),
+            'peak_kb': (
+                row['peak_kb'] is not None and before.get('peak_kb') is not None
+                and row['peak_kb'] > before['peak_kb'] * (1 + tolerance)
+            ),
+        }
+        for metric, regressed in checks.items():
+            if regressed:
+                regressions.append({
+                    'name': row['name'],
+                    'size': row['size'],
+                    'metric': metric,
+                    'baseline': before[metric],
+                    'current': row[metric],
+                    'change': f"{(row[metric] / before[metric] - 1) * 100:+.0f}%" if before[metric] else 'n/a',
+                })
+    return regressions
@@ -0,0 +1,336 @@
+# apps/ats/dedup.py
+import hashlib
+import re
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from apps.applications.models import Application
+from .models import LSHBucket, ParsedResume, ResumeSignature
+import logging
+
+logger = logging.getLogger(__name__)
+
+WORD_RE = re.compile(r'\w+')
+SHINGLE_SIZE = 3
+SHINGLE_MULTIPLIER = np.uint64(0x100000001B3)
+HASH_SEED = 20240601
+PERMUTATION_CHUNK = 4096
+FETCH_SIZE = 10000
+
+
+@lru_cache(maxsize=None)
+def _hash_functions(num_perm: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fixed multiply-shift hash parameters; signatures are only comparable under the same seed"""
+    rng = np.random.default_rng(HASH_SEED)
+    multipliers = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    offsets = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+    return multipliers[:, None], offsets[:, None]
+
+
+def shingles(text: str) -> np.ndarray:
+    """Distinct 64-bit hashes of the word 3-grams in ``text``"""
+    words = WORD_RE.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    word_hashes = np.fromiter((zlib.crc32(word.encode()) for word in words), dtype=np.uint64, count=len(words))
+    if len(words) < SHINGLE_SIZE:
+        return np.unique(word_hashes)
+
+    count = len(words) - SHINGLE_SIZE + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        # uint64 arithmetic wraps, which is what a rolling hash wants
+        combined = combined * SHINGLE_MULTIPLIER + word_hashes[offset:offset + count]
+    return np.unique(combined)
+
+
+def minhash(text: str, num_perm: int) -> Optional[np.ndarray]:
+    """MinHash signature: per hash function, the minimum over the resume's shingles"""
+    values = shingles(text)
+    if not len(values):
+        return None
+    multipliers, offsets = _hash_functions(num_perm)
+    signature = np.full(num_perm, np.iinfo(np.uint32).max, dtype=np.uint64)
+    for start in range(0, len(values), PERMUTATION_CHUNK):
+        chunk = values[None, start:start + PERMUTATION_CHUNK]
+        hashed = (chunk * multipliers + offsets) >> np.uint64(32)
+        signature = np.minimum(signature, hashed.min(axis=1))
+    return signature.astype(np.uint32)
+
+
+def band_keys(signature: np.ndarray, bands: int) -> List[int]:
+    """One signed 64-bit key per band of rows, salted with the band number"""
+    rows = len(signature) // bands
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.to_bytes(2, 'big') + signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest(),
+            'big',
+            signed=True,
+        )
+        for band in range(bands)
+    ]
+
+
+def _decode(signature) -> np.ndarray:
+    return np.frombuffer(bytes(signature), dtype=np.uint32)
+
+
+class DedupService:
+    """MinHash/LSH index over parsed resumes for near-duplicate lookups and corpus clustering"""
+
+    def __init__(self):
+        self.num_perm = settings.DEDUP_NUM_PERM
+        self.bands = settings.DEDUP_LSH_BANDS
+        self.threshold = settings.DEDUP_SIMILARITY_THRESHOLD
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        return minhash(text, self.num_perm)
+
+    def index(self, parsed_resumes: Iterable[ParsedResume],
+              signatures: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """Store signatures and bucket rows for resumes that aren't indexed yet"""
+        signatures = dict(signatures or {})
+        records, buckets = [], []
+        for parsed in parsed_resumes:
+            signature = signatures.get(parsed.content_hash)
+            if signature is None:
+                signature = self.signature(parsed.text)
+            if signature is None:
+                continue
+            signatures[parsed.content_hash] = signature
+            records.append(ResumeSignature(resume_id=parsed.content_hash, signature=signature.tobytes()))
+            buckets.extend(LSHBucket(key=key, resume_id=parsed.content_hash) for key in band_keys(signature, self.bands))
+
+        ResumeSignature.objects.bulk_create(records, ignore_conflicts=True, batch_size=1000)
+        LSHBucket.objects.bulk_create(buckets, ignore_conflicts=True, batch_size=5000)
+        return signatures
+
+    def load_signatures(self, content_hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        return {
+            content_hash: _decode(signature)
+            for content_hash, signature in ResumeSignature.objects.filter(pk__in=set(content_hashes)).values_list('pk', 'signature')
+        }
+
+    def similar_resumes(self, signatures: Dict[str, np.ndarray],
+                        threshold: Optional[float] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """Indexed resumes whose estimated Jaccard similarity to each signature meets the threshold.
+
+        Only resumes sharing at least one band key are compared, so the cost depends on the
+        number of colliding resumes rather than on the size of the corpus.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        keys = {content_hash: band_keys(signature, self.bands) for content_hash, signature in signatures.items()}
+
+        members = defaultdict(set)
+        all_keys = {key for resume_keys in keys.values() for key in resume_keys}
+        for key, content_hash in LSHBucket.objects.filter(key__in=all_keys).values_list('key', 'resume_id'):
+            members[key].add(content_hash)
+
+        candidates = {
+            content_hash: set().union(*(members[key] for key in resume_keys)) - {content_hash}
+            for content_hash, resume_keys in keys.items()
+        }
+        stored = self.load_signatures(set().union(*candidates.values()) - signatures.keys()) if candidates else {}
+        stored.update(signatures)
+
+        results = {}
+        for content_hash, others in candidates.items():
+            others = sorted(others & stored.keys())
+            if not others:
+                results[content_hash] = []
+                continue
+            similarity = (np.vstack([stored[other] for other in others]) == signatures[content_hash]).mean(axis=1)
+            matches = [(other, float(value)) for other, value in zip(others, similarity) if value >= threshold]
+            results[content_hash] = sorted(matches, key=lambda match: match[1], reverse=True)
+        return results
+
+    def nearest(self, signatures: Dict[str, np.ndarray], threshold: float) -> Dict[str, str]:
+        """Most similar indexed resume for each signature, where one meets the threshold"""
+        return {
+            content_hash: matches[0][0]
+            for content_hash, matches in self.similar_resumes(signatures, threshold).items() if matches
+        }
+
+    def flag_applications(self, applications: List[Application]) -> int:
+        """Point each application at the closest earlier application by another candidate with a near-identical resume"""
+        applications = [application for application in applications if application.resume_hash]
+        signatures = self.load_signatures(application.resume_hash for application in applications)
+        similar = self.similar_resumes(signatures)
+
+        # An identical resume from another candidate is the strongest signal of all
+        matches = {
+            application.resume_hash: [(application.resume_hash, 1.0)] + similar.get(application.resume_hash, [])
+            for application in applications
+        }
+        similarity = {
+            (content_hash, other): value
+            for content_hash, resume_matches in matches.items() for other, value in resume_matches
+        }
+        others = list(Application.objects.filter(
+            resume_hash__in={other for resume_matches in matches.values() for other, _ in resume_matches}
+        ).values_list('id', 'candidate_id', 'job_id', 'resume_hash', 'created_at'))
+
+        flagged = []
+        for application in applications:
+            best = None
+            for other_id, candidate_id, job_id, resume_hash, created_at in others:
+                value = similarity.get((application.resume_hash, resume_hash))
+                if value is None or candidate_id == application.candidate_id or created_at >= application.created_at:
+                    continue
+                # Highest similarity first, then the same job, then the original submission
+                rank = (value, job_id == application.job_id, -created_at.timestamp())
+                if best is None or rank > best[0]:
+                    best = (rank, other_id)
+            if best is not None:
+                application.duplicate_of_id = best[1]
+                application.duplicate_similarity = round(best[0][0], 3)
+                flagged.append(application)
+
+        Application.objects.bulk_update(flagged, ['duplicate_of', 'duplicate_similarity'])
+        return len(flagged)
+
+    def duplicates_for(self, application: Application) -> List[Tuple[Application, float]]:
+        """Applications by other candidates whose resume is identical or near-identical to this one"""
+        if not application.resume_hash:
+            return []
+        signatures = self.load_signatures([application.resume_hash])
+        similarity = dict(self.similar_resumes(signatures).get(application.resume_hash, []))
+        similarity[application.resume_hash] = 1.0
+
+        others = (
+            Application.objects.filter(resume_hash__in=similarity)
+            .exclude(candidate_id=application.candidate_id)
+            .select_related('job', 'candidate')
+            .order_by('created_at')
+        )
+        matches = [(other, similarity[other.resume_hash]) for other in others]
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def index_missing(self) -> int:
+        """Compute signatures for cached resumes that predate the index"""
+        indexed = 0
+        batch = []
+        for parsed in ParsedResume.objects.filter(signature__isnull=True).only('content_hash', 'text').iterator(chunk_size=500):
+            batch.append(parsed)
+            if len(batch) == 500:
+                indexed += len(self.index(batch))
+                batch = []
+        if batch:
+            indexed += len(self.index(batch))
+        return indexed
+
+    def load_corpus(self) -> Tuple[List[str], np.ndarray, List[str]]:
+        """All signatures as one matrix, streamed from a server-side cursor"""
+        sql, params = ResumeSignature.objects.order_by('pk').values_list('pk', 'signature', 'cluster').query.sql_with_params()
+        content_hashes, rows, clusters = [], [], []
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(sql, params)
+            while True:
+                fetched = cursor.fetchmany(FETCH_SIZE)
+                if not fetched:
+                    break
+                for content_hash, signature, cluster in fetched:
+                    content_hashes.append(content_hash)
+                    rows.append(_decode(signature))
+                    clusters.append(cluster)
+        matrix = np.vstack(rows) if rows else np.empty((0, self.num_perm), dtype=np.uint32)
+        return content_hashes, matrix, clusters
+
+    def cluster(self) -> Dict[str, int]:
+        """Group the whole corpus into near-duplicate clusters and flag the applications in them"""
+        indexed = self.index_missing()
+        content_hashes, matrix, previous = self.load_corpus()
+        labels = cluster_signatures(matrix, self.bands, self.threshold)
+
+        # Label each cluster with its smallest content hash so labels are stable across runs
+        roots = {}
+        for content_hash, label in zip(content_hashes, labels):
+            roots[label] = min(roots.get(label, content_hash), content_hash)
+        sizes = np.bincount(labels) if len(labels) else np.zeros(0, dtype=np.int64)
+
+        changed = []
+        clusters, signatures = {}, {}
+        for i, (content_hash, label, cluster) in enumerate(zip(content_hashes, labels, previous)):
+            new_cluster = roots[label] if sizes[label] > 1 else ''
+            if new_cluster:
+                clusters[content_hash] = new_cluster
+                signatures[content_hash] = matrix[i]
+            if new_cluster != cluster:
+                changed.append(ResumeSignature(resume_id=content_hash, cluster=new_cluster))
+        ResumeSignature.objects.bulk_update(changed, ['cluster'], batch_size=1000)
+
+        stats = {
+            'indexed': indexed,
+            'resumes': len(content_hashes),
+            'clusters': int((sizes > 1).sum()),
+            'clustered_resumes': int(sizes[sizes > 1].sum()),
+            'updated': len(changed),
+            'flagged_applications': self.flag_clustered_applications(clusters, signatures),
+        }
+        logger.info(f"Resume clustering finished: {stats}")
+        return stats
+
+    def flag_clustered_applications(self, clusters: Dict[str, str], signatures: Dict[str, np.ndarray]) -> int:
+        """Flag applications whose resume shares a cluster with an earlier application by another candidate"""
+        groups = defaultdict(list)
+        rows = Application.objects.exclude(resume_hash='').order_by('created_at').values_list(
+            'id', 'candidate_id', 'resume_hash', 'duplicate_of_id'
+        )
+        for application_id, candidate_id, resume_hash, duplicate_of_id in rows.iterator(chunk_size=FETCH_SIZE):
+            groups[clusters.get(resume_hash, resume_hash)].append((application_id, candidate_id, resume_hash, duplicate_of_id))
+
+        flagged = []
+        for members in groups.values():
+            if len({candidate_id for _, candidate_id, _, _ in members}) < 2:
+                continue
+            original_id, original_candidate, original_hash, _ = members[0]
+            for application_id, candidate_id, resume_hash, duplicate_of_id in members[1:]:
+                if candidate_id == original_candidate or duplicate_of_id is not None:
+                    continue
+                if resume_hash == original_hash:
+                    value = 1.0
+                else:
+                    value = float((signatures[resume_hash] == signatures[original_hash]).mean())
+                flagged.append(Application(id=application_id, duplicate_of_id=original_id, duplicate_similarity=round(value, 3)))
+
+        Application.objects.bulk_update(flagged, ['duplicate_of', 'duplicate_similarity'], batch_size=1000)
+        return len(flagged)
+
+
+def cluster_signatures(matrix: np.ndarray, bands: int, threshold: float) -> np.ndarray:
+    """Connected components of the near-duplicate graph, as one label per row.
+
+    Rows that agree on every value of a band are grouped with ``np.unique``; within each group,
+    neighbours in sorted order are linked when their estimated similarity meets the threshold.
+    """
+    count = len(matrix)
+    parent = np.arange(count)
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    if count < 2:
+        return parent
+    rows = matrix.shape[1] // bands
+    for band in range(bands):
+        _, groups = np.unique(matrix[:, band * rows:(band + 1) * rows], axis=0, return_inverse=True)
+        groups = groups.ravel()
+        order = np.argsort(groups, kind='stable')
+        same_group = groups[order[1:]] == groups[order[:-1]]
+        left, right = order[:-1][same_group], order[1:][same_group]
+        if not len(left):
+            continue
+        similar = (matrix[left] == matrix[right]).mean(axis=1) >= threshold
+        for a, b in zip(left[similar], right[similar]):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return np.array([find(node) for node in range(count)])
@@ -0,0 +1,63 @@
+# apps/ats/management/commands/benchmark_ats.py
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from utils.loadtest import format_table
+from apps.ats.benchmarks.runner import (
+    BASELINE_PATH, DEFAULT_ROUNDS, DEFAULT_SIZES, compare, environment, load_baseline, run_suite, save_baseline,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the ATS pipeline on a deterministic synthetic corpus and compare against the stored "
+        "baseline. Exits non-zero when any benchmark regresses beyond the tolerance."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES), help='Corpus sizes to run')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Timing passes per benchmark; the fastest is kept')
+        parser.add_argument('--only', nargs='+', default=[], help='Run benchmarks whose name starts with these prefixes')
+        parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+        parser.add_argument('--tolerance', type=float, default=0.5, help='Allowed relative slowdown before failing')
+        parser.add_argument('--update-baseline', action='store_true', help='Store this run as the new baseline')
+        parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+        parser.add_argument('--json', type=Path, help='Also write the results to this file')
+
+    def handle(self, *args, **options):
+        results = run_suite(
+            sizes=options['sizes'],
+            seed=options['seed'],
+            track_memory=not options['no_memory'],
+            only=options['only'],
+            rounds=options['rounds'],
+        )
+        if not results:
+            raise CommandError('No benchmarks matched --only')
+        self.stdout.write(format_table(results))
+
+        if options['json']:
+            with open(options['json'], 'w') as f:
+                json.dump({'environment': environment(), 'results': results}, f, indent=2)
+
+        if options['update_baseline']:
+            save_baseline(results, options['baseline'])
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+            return
+
+        baseline = load_baseline(options['baseline'])
+        if not baseline:
+            self.stdout.write(self.style.WARNING('No baseline found; run with --update-baseline to create one'))
+            return
+        if baseline.get('environment') != environment():
+            self.stdout.write(self.style.WARNING(
+                f"Baseline was recorded on {baseline.get('environment')}; numbers may not be comparable"
+            ))
+
+        regressions = compare(results, baseline, options['tolerance'])
+        if regressions:
+            self.stdout.write('')
+            self.stdout.write(format_table(regressions))
+            raise CommandError(f"{len(regressions)} benchmark metrics regressed beyond {options['tolerance']:.0%}")
+        self.stdout.write(self.style.SUCCESS('No regressions against the baseline'))
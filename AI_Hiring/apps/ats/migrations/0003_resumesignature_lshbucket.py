@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ats', '0002_parsedresume'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeSignature',
+            fields=[
+                ('resume', models.OneToOneField(db_column='content_hash', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='ats.parsedresume')),
+                ('signature', models.BinaryField()),
+                ('cluster', models.CharField(blank=True, db_index=True, max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'ats_resume_signatures',
+            },
+        ),
+        migrations.CreateModel(
+            name='LSHBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.BigIntegerField()),
+                ('resume', models.ForeignKey(db_column='content_hash', on_delete=django.db.models.deletion.CASCADE, related_name='buckets', to='ats.resumesignature')),
+            ],
+            options={
+                'db_table': 'ats_lsh_buckets',
+                'unique_together': {('key', 'resume')},
+            },
+        ),
+    ]
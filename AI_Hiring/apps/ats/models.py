@@ -1,3 +1,60 @@
 from django.db import models
+import hashlib
+import uuid
 
-# Create your models here.
+class ScoringProfile(models.Model):
+    """ATS weights and rule parameters for a job, or for every job in a department"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=100)
+    department = models.ForeignKey('jobs.Department', on_delete=models.SET_NULL, null=True, blank=True, related_name='scoring_profiles')
+    
+    # Missing keys fall back to the engine defaults in apps.ats.scoring
+    weights = models.JSONField(default=dict)
+    rules = models.JSONField(default=dict)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return self.name
+    
+    class Meta:
+        db_table = 'ats_scoring_profiles'
+
+class ParsedResume(models.Model):
+    """Extracted text, entities and structured sections for a resume, shared by every job that scores it"""
+    content_hash = models.CharField(max_length=64, primary_key=True)
+    text = models.TextField()
+    entities = models.JSONField(default=dict)
+    structured = models.JSONField(default=dict)
+    parser_version = models.PositiveSmallIntegerField(default=0)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'ats_parsed_resumes'
+    
+    @staticmethod
+    def hash_text(text):
+        return hashlib.sha256(text.encode('utf-8', errors='ignore')).hexdigest()
+
+class ResumeSignature(models.Model):
+    """MinHash signature of a parsed resume, used to find near-duplicate resumes"""
+    resume = models.OneToOneField(ParsedResume, on_delete=models.CASCADE, primary_key=True, db_column='content_hash', related_name='signature')
+    signature = models.BinaryField()  # DEDUP_NUM_PERM uint32 minimums
+    cluster = models.CharField(max_length=64, blank=True, db_index=True)  # content hash of the cluster's first member
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'ats_resume_signatures'
+
+class LSHBucket(models.Model):
+    """One row per (band hash, resume); resumes sharing any band hash are near-duplicate candidates"""
+    key = models.BigIntegerField()
+    resume = models.ForeignKey(ResumeSignature, on_delete=models.CASCADE, db_column='content_hash', related_name='buckets')
+    
+    class Meta:
+        db_table = 'ats_lsh_buckets'
+        unique_together = ['key', 'resume']
@@ -0,0 +1,204 @@
+# apps/ats/parsing.py
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when the parser output changes so cached records are re-parsed on next use
+PARSER_VERSION = 2
+
+SECTION_HEADERS = {
+    'summary': ('summary', 'professional summary', 'profile', 'objective', 'about me'),
+    'experience': (
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'work history', 'career history', 'relevant experience',
+    ),
+    'education': ('education', 'academic background', 'qualifications', 'academic qualifications'),
+    'skills': ('skills', 'technical skills', 'core competencies', 'technologies'),
+    'projects': ('projects', 'personal projects', 'key projects'),
+    'certifications': ('certifications', 'certificates', 'licenses', 'licenses and certifications'),
+}
+HEADER_SECTIONS = {header: section for section, headers in SECTION_HEADERS.items() for header in headers}
+HEADER_RE = re.compile(
+    r'^\s*(' + '|'.join(sorted(map(re.escape, HEADER_SECTIONS), key=len, reverse=True)) + r')\s*:?\s*$',
+    re.IGNORECASE,
+)
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+_MONTH = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?'
+
+
+def _date(prefix: str) -> str:
+    return rf'(?:(?P<{prefix}_month>{_MONTH})\s*|(?P<{prefix}_num>0?[1-9]|1[0-2])[/\-.])?(?P<{prefix}_year>(?:19|20)\d{{2}})'
+
+
+DATE_RANGE_RE = re.compile(
+    _date('start') + r'\s*(?:-|–|—|to|until)\s*(?:' + _date('end') + r'|(?P<present>present|current|now|today))',
+    re.IGNORECASE,
+)
+
+DEGREE_RE = re.compile(
+    r'\b(?P<degree>ph\.?\s?d|doctor(?:ate)?|master(?:\'?s)?|m\.?sc|m\.?s|m\.?b\.?a|m\.?tech|'
+    r'bachelor(?:\'?s)?|b\.?sc|b\.?s|b\.?a|b\.?tech|b\.?e|associate(?:\'?s)?|diploma|certificat(?:e|ion))\b\.?'
+    r'(?:\s+(?:(?:of|in)\s+)?(?:(?:science|arts|engineering|technology)\s+in\s+)?'
+    # Greedy words that stop before "from"/"at" rather than a lazy run of letters and spaces, which
+    # backtracked quadratically over long whitespace runs
+    r'(?P<field>[A-Z][A-Za-z&]*(?:[ \t]+(?!(?:from|at)\b)[A-Za-z&]+)*)(?=\s*(?:[,;.(|\-–—]|\bfrom\b|\bat\b|\d|$)))?',
+    re.IGNORECASE,
+)
+# Short abbreviations are only trusted inside an education section
+LONG_FORM_DEGREES = re.compile(r'^(?:ph|doctor|master|bachelor|associate|diploma|certificat)', re.IGNORECASE)
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+DEGREE_LEVELS = (
+    ('phd', re.compile(r'^(?:ph|doctor)', re.IGNORECASE)),
+    ('master', re.compile(r'^(?:master|m\.?sc|m\.?s|m\.?b\.?a|m\.?tech)', re.IGNORECASE)),
+    ('bachelor', re.compile(r'^(?:bachelor|b\.?sc|b\.?s|b\.?a|b\.?tech|b\.?e)', re.IGNORECASE)),
+    ('associate', re.compile(r'^associate', re.IGNORECASE)),
+    ('diploma', re.compile(r'^diploma', re.IGNORECASE)),
+    ('certification', re.compile(r'^certificat', re.IGNORECASE)),
+)
+DEGREE_RANK = {'certification': 0, 'diploma': 1, 'associate': 2, 'bachelor': 3, 'master': 4, 'phd': 5}
+
+
+def parse_resume(text: str, today: Optional[date] = None) -> Dict[str, Any]:
+    """Segment a resume and extract employment intervals and degree records in one pass over its lines"""
+    today = today or date.today()
+    current_month = today.year * 12 + today.month - 1
+
+    sections = {}
+    intervals = []
+    positions = []
+    degrees = []
+    section = None
+    has_sections = False
+    previous_line = ''
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        header = HEADER_RE.match(stripped)
+        if header:
+            section = HEADER_SECTIONS[header.group(1).lower()]
+            sections.setdefault(section, 0)
+            has_sections = True
+            continue
+        if section:
+            sections[section] += 1
+
+        in_education = section == 'education'
+        degree_line = False
+        for match in DEGREE_RE.finditer(stripped):
+            if not in_education and not LONG_FORM_DEGREES.match(match.group('degree')):
+                continue
+            degree_line = True
+            degrees.append(_degree_record(match, stripped))
+
+        # Date ranges outside the experience section (or on degree lines) are schooling, projects, etc.
+        if (section == 'experience' or not has_sections) and not degree_line:
+            for match in DATE_RANGE_RE.finditer(stripped):
+                interval = _interval(match, current_month)
+                if interval:
+                    intervals.append(interval)
+                    title = (stripped[:match.start()] + stripped[match.end():]).strip(' ,|-–—()')
+                    positions.append({
+                        'title': title or previous_line,
+                        'start': _month_label(interval[0]),
+                        'end': None if match.group('present') else _month_label(interval[1] - 1),
+                    })
+        previous_line = stripped
+
+    months = _merged_months(intervals)
+    return {
+        'parser_version': PARSER_VERSION,
+        'sections': sections,
+        'positions': positions,
+        'experience_months': months,
+        'experience_years': round(months / 12, 1) if intervals else None,
+        'education': _dedupe_degrees(degrees),
+        'highest_degree': max((d['level'] for d in degrees), key=DEGREE_RANK.get, default=None),
+    }
+
+
+def _interval(match, current_month: int) -> Optional[Tuple[int, int]]:
+    """Half-open month range [start, end); year-only ranges cover whole years"""
+    start = _month_index(match, 'start', default_month=1)
+    if match.group('present'):
+        end = current_month + 1
+    else:
+        end = _month_index(match, 'end', default_month=12) + 1
+    end = min(end, current_month + 1)
+    if start is None or end <= start:
+        return None
+    return start, end
+
+
+def _month_index(match, prefix: str, default_month: int) -> Optional[int]:
+    year = match.group(f'{prefix}_year')
+    if not year:
+        return None
+    if match.group(f'{prefix}_month'):
+        month = MONTHS[match.group(f'{prefix}_month')[:3].lower()]
+    elif match.group(f'{prefix}_num'):
+        month = int(match.group(f'{prefix}_num'))
+    else:
+        month = default_month
+    return int(year) * 12 + month - 1
+
+
+def _month_label(index: int) -> str:
+    return f'{index // 12:04d}-{index % 12 + 1:02d}'
+
+
+def _merged_months(intervals: List[Tuple[int, int]]) -> int:
+    """Total months covered, counting overlapping positions once"""
+    total = 0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def _degree_record(match, line: str) -> Dict[str, Any]:
+    degree = match.group('degree')
+    level = next(name for name, pattern in DEGREE_LEVELS if pattern.match(degree))
+    years = YEAR_RE.findall(line)
+    field = (match.group('field') or '').strip(' ,')
+    return {
+        'level': level,
+        'degree': degree,
+        'field': field,
+        'year': int(years[-1]) if years else None,
+    }
+
+
+def _dedupe_degrees(degrees: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = set()
+    unique = []
+    for degree in degrees:
+        key = (degree['level'], degree['field'].lower())
+        if key not in seen:
+            seen.add(key)
+            unique.append(degree)
+    return unique
+
+
+def meets_education_requirement(requirement: str, degrees: List[Dict[str, Any]], has_certifications: bool = False) -> bool:
+    """Whether a candidate's degrees satisfy a required education keyword; higher degrees satisfy lower ones"""
+    levels = {degree['level'] for degree in degrees}
+    if requirement == 'certification':
+        return has_certifications or 'certification' in levels
+    if requirement == 'degree':
+        return any(DEGREE_RANK[level] >= DEGREE_RANK['associate'] for level in levels)
+    return any(DEGREE_RANK[level] >= DEGREE_RANK[requirement] for level in levels)
@@ -0,0 +1,111 @@
+# apps/ats/rescoring.py
+import logging
+from typing import Dict, Sequence
+import numpy as np
+from django.conf import settings
+from apps.applications import feature_store
+from apps.applications.models import Application
+from apps.jobs.services import SUB_SCORE_FIELDS
+from utils.storage import open_stored_file
+from .models import ParsedResume
+from .scoring import COMPONENT_FEATURES, SCORE_COMPONENTS, ScoringEngine
+from .services import ATSService
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalRescoringService:
+    """Recompute only the score components a job edit affects, from cached parsed resumes"""
+
+    def __init__(self, job):
+        self.job = job
+        self.engine = ScoringEngine.for_job(job)
+        self.ats_service = ATSService()
+
+    def rescore(self, components: Sequence[str]) -> Dict[str, int]:
+        """Rescore the job's applications in keyset-paginated chunks.
+
+        Each chunk is one short bulk_update, so no long transaction holds row locks
+        against recruiters working on the same applications.
+        """
+        components = [component for component in SCORE_COMPONENTS if component in components]
+        features = [feature for component in components for feature in COMPONENT_FEATURES[component]]
+        fields = ['ats_score', 'ats_feedback', 'resume_hash'] + [SUB_SCORE_FIELDS[component] for component in components]
+        chunk_size = settings.RESCORE_CHUNK_SIZE
+
+        queryset = (
+            Application.objects.filter(job=self.job, ats_score__isnull=False)
+            .only('id', 'resume', 'resume_hash', 'ats_score', 'ats_feedback', *SUB_SCORE_FIELDS.values())
+            .order_by('pk')
+        )
+        rescored = skipped = 0
+        last_pk = None
+        while True:
+            page = queryset.filter(pk__gt=last_pk) if last_pk else queryset
+            applications = list(page[:chunk_size])
+            if not applications:
+                break
+            last_pk = applications[-1].pk
+
+            parsed = ParsedResume.objects.in_bulk({application.resume_hash for application in applications if application.resume_hash})
+            # Applications scored before resumes were cached have their file re-extracted and cached now
+            uncached = [application for application in applications if application.resume_hash not in parsed]
+            if uncached:
+                parsed.update(self._parse_files(uncached))
+            usable = [application for application in applications if application.resume_hash in parsed]
+            skipped += len(applications) - len(usable)
+            if usable:
+                self._rescore_chunk(usable, parsed, components, features)
+                Application.objects.bulk_update(usable, fields)
+                rescored += len(usable)
+
+        if rescored:
+            feature_store.invalidate(self.job.pk)
+        logger.info(f"Rescored {components} for {rescored} applications of job {self.job.pk}, skipped {skipped}")
+        return {'rescored': rescored, 'skipped': skipped}
+
+    def _parse_files(self, applications) -> Dict[str, ParsedResume]:
+        """Extract and cache the resumes of applications without a parsed record, pointing each at its record"""
+        texts = {}
+        for application in applications:
+            if not application.resume:
+                continue
+            try:
+                with open_stored_file(application.resume.name, application.resume.storage) as resume_file:
+                    text = self.ats_service.extract_text_from_resume(resume_file)
+            except Exception as e:
+                logger.warning(f"Could not read resume of application {application.pk}: {e}")
+                continue
+            if text.strip():
+                texts[application] = text
+
+        if not texts:
+            return {}
+        records = self.ats_service.get_parsed_resumes(list(texts.values()))
+        for application, record in zip(texts, records):
+            application.resume_hash = record.content_hash
+        return {record.content_hash: record for record in records}
+
+    def _rescore_chunk(self, applications, parsed, components, features):
+        records = [parsed[application.resume_hash] for application in applications]
+        rows = [
+            self.ats_service.extract_features(record.text, record.entities, self.job, record.structured, components)
+            for record in records
+        ]
+        fresh = self.engine.score_components(self.engine.to_arrays(rows, features), components)
+
+        # Unaffected components keep their stored scores and only feed the new total
+        scores = {
+            component: fresh[component] if component in fresh else np.array(
+                [getattr(application, SUB_SCORE_FIELDS[component]) or 0.0 for application in applications], dtype=np.float64,
+            )
+            for component in SCORE_COMPONENTS
+        }
+        totals = self.engine.total(scores)
+
+        for i, (application, record) in enumerate(zip(applications, records)):
+            row_scores = {component: float(scores[component][i]) for component in SCORE_COMPONENTS}
+            for component in components:
+                setattr(application, SUB_SCORE_FIELDS[component], row_scores[component])
+            application.ats_score = float(totals[i])
+            application.ats_feedback = self.ats_service._generate_feedback(row_scores, record.entities, self.job)
@@ -0,0 +1,120 @@
+# apps/ats/scanner.py
+import re
+from typing import Any, Dict, List
+
+# One alternation scanned in a single finditer pass. Each alternative is anchored by a lookbehind so
+# it can only start at a token boundary, and none nests unbounded quantifiers over overlapping
+# classes, so matching stays linear in the input length even on adversarial text.
+SCANNER_RE = re.compile(
+    r'''
+    (?P<url>
+        (?<![\w./@-])
+        (?:https?://|www\.|(?:[a-z0-9-]+\.)?(?:linkedin|github)\.com/)
+        [^\s<>"'()\[\]{},;]+
+    )
+    | (?P<email>
+        (?<![\w.%+-])
+        [\w.%+-]+@[a-z0-9-]+(?:\.[a-z0-9-]+)+
+    )
+    | (?P<stated>
+        (?<![\d.])
+        (?P<stated_years>\d{1,2})\+?[ \t]{0,3}years?[ \t]{0,3}(?:of[ \t]{1,3})?experience
+    )
+    | (?P<phone>
+        (?<![\w+])
+        \+?(?:\(\d{1,4}\)|\d{1,15}(?!\d))
+        (?:[ .\-]?(?:\(\d{1,4}\)|\d{1,15}(?!\d))){0,5}
+    )
+    | (?P<year>
+        (?<!\d)(?:19|20)\d{2}(?!\d)
+    )
+    ''',
+    re.IGNORECASE | re.VERBOSE,
+)
+
+NON_DIGIT_RE = re.compile(r'\D')
+YEAR_RE = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+TRAILING_PUNCTUATION = '.,:;!?'
+# CandidateProfile URL columns are URLField's default max_length
+URL_MAX_LENGTH = 200
+
+
+def scan_resume(text: str) -> Dict[str, Any]:
+    """Extract emails, phones, URLs, stated experience and year mentions in one traversal"""
+    emails, phones, urls = {}, {}, {}
+    years = set()
+    stated_years = []
+
+    for match in SCANNER_RE.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+
+        if kind == 'url':
+            url = value.rstrip(TRAILING_PUNCTUATION)
+            urls.setdefault(url.lower(), url)
+        elif kind == 'email':
+            email = value.rstrip(TRAILING_PUNCTUATION)
+            # The domain pattern doesn't backtrack looking for a TLD, so check it here
+            tld = email.rsplit('.', 1)[-1]
+            if len(tld) >= 2 and tld.isalpha():
+                emails.setdefault(email.lower(), email)
+        elif kind == 'stated':
+            stated_years.append(int(match.group('stated_years')))
+        elif kind == 'phone':
+            digits = NON_DIGIT_RE.sub('', value)
+            if 10 <= len(digits) <= 15:
+                phones.setdefault(digits, value)
+            else:
+                # Short digit runs such as "2015 - 2019" are dates, not phone numbers
+                years.update(int(year) for year in YEAR_RE.findall(value))
+        elif kind == 'year':
+            years.add(int(value))
+
+    url_list = list(urls.values())
+    contact = {
+        'emails': list(emails.values()),
+        'phones': list(phones.values()),
+        'urls': url_list,
+        'linkedin': _first(url_list, 'linkedin.com/'),
+        'github': _first(url_list, 'github.com/'),
+    }
+    # First match of each kind under the keys callers have always used
+    if contact['emails']:
+        contact['email'] = contact['emails'][0]
+    if contact['phones']:
+        contact['phone'] = contact['phones'][0]
+
+    return {
+        'contact': contact,
+        'stated_experience_years': max(stated_years) if stated_years else None,
+        'years': sorted(years),
+    }
+
+
+def _first(urls: List[str], needle: str) -> str:
+    return next((url for url in urls if needle in url.lower()), '')
+
+
+def normalize_url(url: str) -> str:
+    return url if url.lower().startswith(('http://', 'https://')) else f'https://{url}'
+
+
+def _fits(url: str) -> bool:
+    return len(url) <= URL_MAX_LENGTH
+
+
+def profile_links(contact: Dict[str, Any]) -> Dict[str, str]:
+    """CandidateProfile URL fields derived from scanned contact details"""
+    linkedin = normalize_url(contact['linkedin']) if contact.get('linkedin') else ''
+    # GitHub first, otherwise the first personal site that isn't LinkedIn
+    portfolio = contact.get('github') or next(
+        (url for url in contact.get('urls', []) if 'linkedin.com/' not in url.lower()), ''
+    )
+    portfolio = normalize_url(portfolio) if portfolio else ''
+
+    links = {}
+    if linkedin and _fits(linkedin):
+        links['linkedin_url'] = linkedin
+    if portfolio and _fits(portfolio):
+        links['portfolio_url'] = portfolio
+    return links
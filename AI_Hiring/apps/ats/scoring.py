@@ -0,0 +1,144 @@
+# apps/ats/scoring.py
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+import numpy as np
+from .models import ScoringProfile
+
+SCORE_COMPONENTS = ('skill_match', 'experience_match', 'education_match', 'keyword_match')
+
+# Feature columns extracted per resume; years is NaN when the resume doesn't state it
+FEATURES = (
+    'required_matched', 'required_total', 'preferred_matched', 'preferred_total',
+    'years', 'education_required', 'education_matched', 'keyword_similarity',
+)
+
+# Feature columns each component is computed from
+COMPONENT_FEATURES = {
+    'skill_match': ('required_matched', 'required_total', 'preferred_matched', 'preferred_total'),
+    'experience_match': ('years',),
+    'education_match': ('education_required', 'education_matched'),
+    'keyword_match': ('keyword_similarity',),
+}
+
+# Job fields each component reads; editing any other field leaves the component unchanged
+COMPONENT_JOB_FIELDS = {
+    'skill_match': ('skills_required', 'skills_preferred'),
+    'experience_match': ('experience_min_years', 'experience_max_years'),
+    'education_match': ('requirements',),
+    'keyword_match': ('title', 'description', 'requirements', 'responsibilities'),
+}
+
+DEFAULT_WEIGHTS = {
+    'skill_match': 0.35,
+    'experience_match': 0.30,
+    'education_match': 0.20,
+    'keyword_match': 0.15,
+}
+
+DEFAULT_RULES = {
+    'required_skill_points': 70,       # share of the skill score earned by required skills
+    'preferred_skill_points': 30,      # share earned by preferred skills
+    'experience_unknown_score': 50,    # experience score when the resume states no years
+    'experience_span_years': 5,        # upper bound above the minimum when the job sets none
+    'under_experience_penalty': 20,    # points lost per missing year
+    'over_experience_penalty': 10,     # points lost per year above the range
+    'over_experience_floor': 60,       # overqualified candidates never drop below this
+}
+
+
+class ScoringEngine:
+    """Turn batches of resume features into ATS scores with one vectorized pass"""
+
+    def __init__(self, weights: Mapping[str, float] = None, rules: Mapping[str, float] = None,
+                 experience_min_years: int = 0, experience_max_years: int = None):
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.rules = {**DEFAULT_RULES, **(rules or {})}
+        self.experience_min_years = experience_min_years
+        self.experience_max_years = experience_max_years
+
+    @classmethod
+    def for_job(cls, job) -> 'ScoringEngine':
+        """Engine configured with the job's profile, falling back to its department's profile"""
+        profile = resolve_profile(job)
+        return cls(
+            weights=profile.weights if profile else None,
+            rules=profile.rules if profile else None,
+            experience_min_years=job.experience_min_years,
+            experience_max_years=job.experience_max_years,
+        )
+
+    @staticmethod
+    def to_arrays(rows: List[Mapping[str, float]], features: Sequence[str] = FEATURES) -> Dict[str, np.ndarray]:
+        """Stack per-resume feature dicts into one float array per feature"""
+        return {
+            feature: np.fromiter((row[feature] for row in rows), dtype=np.float64, count=len(rows))
+            for feature in features
+        }
+
+    def score_batch(self, features: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Score every row at once, returning one array per component plus ``total_score``"""
+        scores = self.score_components(features)
+        scores['total_score'] = self.total(scores)
+        return scores
+
+    def score_components(self, features: Mapping[str, np.ndarray],
+                         components: Sequence[str] = SCORE_COMPONENTS) -> Dict[str, np.ndarray]:
+        """Only the requested components; features need just their COMPONENT_FEATURES columns"""
+        scorers = {
+            'skill_match': lambda: self._skill_match(features),
+            'experience_match': lambda: self._experience_match(features['years']),
+            'education_match': lambda: self._education_match(features),
+            'keyword_match': lambda: np.clip(features['keyword_similarity'], 0, 100),
+        }
+        return {component: scorers[component]() for component in components}
+
+    def total(self, scores: Mapping[str, np.ndarray]) -> np.ndarray:
+        """Weighted total from every component's scores"""
+        weights = np.array([self.weights[component] for component in SCORE_COMPONENTS], dtype=np.float64)
+        matrix = np.column_stack([scores[component] for component in SCORE_COMPONENTS])
+        # Normalised so profiles don't have to sum to exactly one
+        return np.round(matrix @ weights / weights.sum(), 2)
+
+    def _skill_match(self, features) -> np.ndarray:
+        required_points = self.rules['required_skill_points']
+        preferred_points = self.rules['preferred_skill_points']
+        required_total = features['required_total']
+        preferred_total = features['preferred_total']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            required = features['required_matched'] / required_total * required_points
+            preferred = np.where(
+                preferred_total > 0,
+                features['preferred_matched'] / preferred_total * preferred_points,
+                preferred_points,
+            )
+        return np.where(required_total > 0, np.minimum(required + preferred, 100), 100.0)
+
+    def _experience_match(self, years: np.ndarray) -> np.ndarray:
+        min_years = self.experience_min_years
+        max_years = self.experience_max_years or min_years + self.rules['experience_span_years']
+
+        under = np.maximum(0, 100 - (min_years - years) * self.rules['under_experience_penalty'])
+        over = np.maximum(self.rules['over_experience_floor'], 100 - (years - max_years) * self.rules['over_experience_penalty'])
+        scores = np.select([years < min_years, years > max_years], [under, over], 100.0)
+        return np.where(np.isnan(years), float(self.rules['experience_unknown_score']), scores)
+
+    @staticmethod
+    def _education_match(features) -> np.ndarray:
+        required = features['education_required']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matched = features['education_matched'] / required * 100
+        return np.where(required > 0, matched, 100.0)
+
+
+def affected_components(changed_fields: Iterable[str]) -> Tuple[str, ...]:
+    """Score components that read any of the changed job fields"""
+    changed = set(changed_fields)
+    return tuple(component for component in SCORE_COMPONENTS if changed & set(COMPONENT_JOB_FIELDS[component]))
+
+
+def resolve_profile(job):
+    if job.scoring_profile_id:
+        return job.scoring_profile
+    if job.department_id:
+        return ScoringProfile.objects.filter(department_id=job.department_id).order_by('-updated_at').first()
+    return None
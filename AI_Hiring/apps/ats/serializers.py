@@ -0,0 +1,29 @@
+# apps/ats/serializers.py
+from rest_framework import serializers
+from .models import ScoringProfile
+from .scoring import DEFAULT_RULES, SCORE_COMPONENTS
+
+class ScoringProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ScoringProfile
+        fields = ['id', 'name', 'department', 'weights', 'rules', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
+    
+    def validate_weights(self, value):
+        unknown = set(value) - set(SCORE_COMPONENTS)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown score components: {', '.join(sorted(unknown))}")
+        if any(not isinstance(weight, (int, float)) or weight < 0 for weight in value.values()):
+            raise serializers.ValidationError("Weights must be non-negative numbers")
+        # Omitted components keep their default weight, so only an all-zero full profile is degenerate
+        if set(value) == set(SCORE_COMPONENTS) and not any(value.values()):
+            raise serializers.ValidationError("At least one weight must be positive")
+        return value
+    
+    def validate_rules(self, value):
+        unknown = set(value) - set(DEFAULT_RULES)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown rules: {', '.join(sorted(unknown))}")
+        if any(not isinstance(rule, (int, float)) for rule in value.values()):
+            raise serializers.ValidationError("Rules must be numbers")
+        return value
@@ -1,9 +1,21 @@
-import re
+import copy
 import json
-from typing import Dict, List, Any
+import math
+import uuid
+from typing import Dict, List, Any, Sequence
+import numpy as np
 import PyPDF2
 import docx
 from django.conf import settings
+from apps.applications import feature_store
+from utils.instrumentation import span
+from utils.profiling import sampled_profile
+from utils.storage import open_stored_file
+from .dedup import DedupService
+from .models import ParsedResume
+from .parsing import PARSER_VERSION, meets_education_requirement, parse_resume
+from .scanner import scan_resume
+from .scoring import FEATURES, SCORE_COMPONENTS, ScoringEngine
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,6 +54,9 @@ except ImportError:
     OPENAI_AVAILABLE = False
     logger.warning("OpenAI not available. Some features will be disabled.")
 
+# Entities from spaCy/OpenAI, the only extraction worth sharing between near-duplicate resumes
+NLP_ENTITY_KEYS = ('experience', 'certifications')
+
 class ATSService:
     def __init__(self):
         if OPENAI_AVAILABLE and hasattr(settings, 'OPENAI_API_KEY') and settings.OPENAI_API_KEY:
@@ -54,6 +69,7 @@ class ATSService:
         else:
             self.tfidf = None
     
+    @span('ats.extract_text')
     def extract_text_from_resume(self, resume_file) -> str:
         """Extract text from PDF or DOCX resume"""
         text = ""
@@ -78,33 +94,10 @@ class ATSService:
         
         return text
     
+    @span('ats.entities')
     def extract_resume_entities(self, resume_text: str) -> Dict[str, Any]:
         """Extract entities from resume using available NLP tools"""
-        entities = {
-            'skills': [],
-            'education': [],
-            'experience': [],
-            'certifications': [],
-            'contact': {}
-        }
-        
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, resume_text)
-        if emails:
-            entities['contact']['email'] = emails[0]
-        
-        # Extract phone
-        phone_pattern = r'[\+\d]?[\d\s\(\)\-]{10,}'
-        phones = re.findall(phone_pattern, resume_text)
-        if phones:
-            entities['contact']['phone'] = phones[0].strip()
-        
-        # Extract skills using keyword matching
-        skill_keywords = self._get_skill_keywords()
-        for skill in skill_keywords:
-            if skill.lower() in resume_text.lower():
-                entities['skills'].append(skill)
+        entities = self._rule_based_entities(resume_text)
         
         # Use spaCy if available
         if SPACY_AVAILABLE and nlp:
@@ -125,85 +118,206 @@ class ATSService:
         
         return entities
     
-    def calculate_ats_score(self, application, job) -> Dict[str, Any]:
+    def _rule_based_entities(self, resume_text: str) -> Dict[str, Any]:
+        """Scanner fields and keyword-matched skills, cheap enough to derive for every copy of a resume"""
+        entities = {
+            'skills': [],
+            'education': [],
+            'experience': [],
+            'certifications': [],
+            'contact': {}
+        }
+        
+        self._apply_scan(entities, resume_text)
+        
+        # Extract skills using keyword matching
+        skill_keywords = self._get_skill_keywords()
+        resume_lower = resume_text.lower()
+        for skill in skill_keywords:
+            if skill.lower() in resume_lower:
+                entities['skills'].append(skill)
+        
+        return entities
+    
+    @staticmethod
+    def _apply_scan(entities: Dict[str, Any], resume_text: str):
+        """Fill the contact, stated experience and year fields from one scanner pass"""
+        scan = scan_resume(resume_text)
+        entities['contact'] = scan['contact']
+        entities['stated_experience_years'] = scan['stated_experience_years']
+        entities['years_mentioned'] = scan['years']
+    
+    def extract_contact(self, resume_text: str) -> Dict[str, Any]:
+        """Extract every email, phone and profile URL from resume text"""
+        return scan_resume(resume_text)['contact']
+    
+    def calculate_ats_score(self, application, job, resume_text: str = None) -> Dict[str, Any]:
         """Calculate comprehensive ATS score"""
-        try:
-            resume_text = self.extract_text_from_resume(application.resume)
-            resume_entities = self.extract_resume_entities(resume_text)
-            
-            scores = {
-                'skill_match': self._calculate_skill_match(resume_entities['skills'], job.skills_required, job.skills_preferred),
-                'experience_match': self._calculate_experience_match(resume_text, job),
-                'education_match': self._calculate_education_match(resume_entities['education'], job.requirements),
-                'keyword_match': self._calculate_keyword_match(resume_text, job)
-            }
-            
-            # Calculate weighted average
-            weights = {
-                'skill_match': 0.35,
-                'experience_match': 0.30,
-                'education_match': 0.20,
-                'keyword_match': 0.15
-            }
-            
-            total_score = sum(scores[key] * weights[key] for key in scores)
+        with sampled_profile('ats_score', settings.PROFILE_SCORING_SAMPLE_RATE, application_id=application.pk) as profile:
+            try:
+                if resume_text is None:
+                    with open_stored_file(application.resume.name, application.resume.storage) as resume_file:
+                        resume_text = self.extract_text_from_resume(resume_file)
+                result = self.score_resumes(job, [resume_text])[0]
             
-            # Generate feedback
-            feedback = self._generate_feedback(scores, resume_entities, job)
+            except Exception as e:
+                logger.error(f"Error calculating ATS score: {e}")
+                result = self._fallback_result()
             
-            return {
-                'total_score': round(total_score, 2),
-                'scores': scores,
-                'feedback': feedback,
-                'entities': resume_entities
-            }
-        
-        except Exception as e:
-            logger.error(f"Error calculating ATS score: {e}")
-            return {
-                'total_score': 50.0,
-                'scores': {'skill_match': 50, 'experience_match': 50, 'education_match': 50, 'keyword_match': 50},
-                'feedback': {'error': 'Could not process resume'},
-                'entities': {}
-            }
+            if profile is not None:
+                profile.resume_hash = result.get('resume_hash', '')
+        return result
     
-    def _calculate_skill_match(self, candidate_skills: List[str], required_skills: List[str], preferred_skills: List[str]) -> float:
-        """Calculate skill match score"""
-        if not required_skills:
-            return 100.0
+    @span('ats.score')
+    def score_resumes(self, job, resume_texts: List[str]) -> List[Dict[str, Any]]:
+        """Score a batch of resumes for one job; features are extracted per resume and scored in one pass"""
+        engine = ScoringEngine.for_job(job)
         
-        candidate_skills_lower = [s.lower() for s in candidate_skills]
-        required_matched = sum(1 for skill in required_skills if skill.lower() in candidate_skills_lower)
-        preferred_matched = sum(1 for skill in preferred_skills if skill.lower() in candidate_skills_lower)
+        parsed_resumes = self.get_parsed_resumes(resume_texts)
         
-        required_score = (required_matched / len(required_skills)) * 70 if required_skills else 0
-        preferred_score = (preferred_matched / len(preferred_skills)) * 30 if preferred_skills else 30
-        
-        return min(required_score + preferred_score, 100)
+        rows, failed = [], set()
+        for i, parsed in enumerate(parsed_resumes):
+            try:
+                rows.append(self.extract_features(parsed.text, parsed.entities, job, parsed.structured))
+            except Exception as e:
+                logger.error(f"Error extracting ATS features: {e}")
+                failed.add(i)
+                rows.append(dict.fromkeys(FEATURES, 0.0))
+        
+        batch = engine.score_batch(engine.to_arrays(rows))
+        
+        results = []
+        for i, parsed in enumerate(parsed_resumes):
+            if i in failed:
+                results.append(self._fallback_result())
+                continue
+            scores = {component: float(batch[component][i]) for component in SCORE_COMPONENTS}
+            results.append({
+                'total_score': float(batch['total_score'][i]),
+                'scores': scores,
+                'feedback': self._generate_feedback(scores, parsed.entities, job),
+                'entities': parsed.entities,
+                'resume_hash': parsed.content_hash
+            })
+        return results
     
-    def _calculate_experience_match(self, resume_text: str, job) -> float:
-        """Calculate experience match score"""
-        # Extract years of experience from resume
-        years_pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'
-        matches = re.findall(years_pattern, resume_text.lower())
-        
-        if matches:
-            candidate_years = max(int(m) for m in matches)
+    @span('ats.parse')
+    def get_parsed_resumes(self, resume_texts: List[str]) -> List[ParsedResume]:
+        """Cached parse for each resume text; only texts never seen before are parsed and stored"""
+        hashes = [ParsedResume.hash_text(text) for text in resume_texts]
+        records = ParsedResume.objects.in_bulk(set(hashes))
+        
+        # Unseen resumes that are near-identical to a cached one reuse its extraction
+        dedup = DedupService()
+        signatures = {}
+        for content_hash, text in zip(hashes, resume_texts):
+            if content_hash not in records and content_hash not in signatures:
+                signature = dedup.signature(text)
+                if signature is not None:
+                    signatures[content_hash] = signature
+        twins = dedup.nearest(signatures, settings.DEDUP_REUSE_SIMILARITY) if signatures else {}
+        donors = ParsedResume.objects.filter(parser_version=PARSER_VERSION).in_bulk(set(twins.values())) if twins else {}
+        
+        new, stale = [], []
+        for content_hash, text in zip(hashes, resume_texts):
+            record = records.get(content_hash)
+            if record is None:
+                donor = donors.get(twins.get(content_hash))
+                records[content_hash] = record = self.build_parsed_resume(text, content_hash, donor)
+                new.append(record)
+            elif record.parser_version != PARSER_VERSION and record not in stale:
+                record.structured = parse_resume(record.text)
+                self._apply_scan(record.entities, record.text)
+                record.parser_version = PARSER_VERSION
+                stale.append(record)
+        
+        # Another worker may have parsed the same resume concurrently
+        ParsedResume.objects.bulk_create(new, ignore_conflicts=True)
+        if stale:
+            ParsedResume.objects.bulk_update(stale, ['entities', 'structured', 'parser_version', 'updated_at'])
+        if new:
+            dedup.index(new, signatures)
+        return [records[content_hash] for content_hash in hashes]
+    
+    def build_parsed_resume(self, resume_text: str, content_hash: str = None,
+                            donor: ParsedResume = None) -> ParsedResume:
+        """Extract entities and structured sections for a resume that isn't cached yet"""
+        # Always parsed: dates and degrees may be exactly what differs between near-identical copies
+        structured = parse_resume(resume_text)
+        if donor is not None:
+            # Near-identical text: only the NLP entities are reused, everything else comes from this copy
+            entities = self._rule_based_entities(resume_text)
+            for key in NLP_ENTITY_KEYS:
+                entities[key] = copy.deepcopy(donor.entities.get(key, []))
         else:
-            return 50.0  # Default score if experience not found
-        
-        min_years = job.experience_min_years
-        max_years = job.experience_max_years or min_years + 5
-        
-        if candidate_years < min_years:
-            return max(0, 100 - (min_years - candidate_years) * 20)
-        elif candidate_years > max_years:
-            return max(60, 100 - (candidate_years - max_years) * 10)
+            entities = self.extract_resume_entities(resume_text)
+        # The rule-based path never fills education; the section parser does
+        if not entities['education']:
+            entities['education'] = [
+                f"{degree['level']} {degree['field']}".strip() for degree in structured['education']
+            ]
+        return ParsedResume(
+            content_hash=content_hash or ParsedResume.hash_text(resume_text),
+            text=resume_text,
+            entities=entities,
+            structured=structured,
+            parser_version=PARSER_VERSION,
+        )
+    
+    def extract_features(self, resume_text: str, resume_entities: Dict[str, Any], job,
+                         structured: Dict[str, Any] = None,
+                         components: Sequence[str] = SCORE_COMPONENTS) -> Dict[str, float]:
+        """Reduce a resume to the numeric features the scoring engine consumes.
+        
+        Only the features of the given components are computed, for targeted rescoring.
+        """
+        features = {}
+        if 'skill_match' in components:
+            candidate_skills = {skill.lower() for skill in resume_entities['skills']}
+            features.update({
+                'required_matched': sum(1 for skill in job.skills_required if skill.lower() in candidate_skills),
+                'required_total': len(job.skills_required),
+                'preferred_matched': sum(1 for skill in job.skills_preferred if skill.lower() in candidate_skills),
+                'preferred_total': len(job.skills_preferred),
+            })
+        
+        if 'experience_match' in components or 'education_match' in components:
+            structured = structured or parse_resume(resume_text)
+        
+        if 'experience_match' in components:
+            # Dated positions are more reliable than a stated "N years of experience"
+            years = structured.get('experience_years')
+            if years is None:
+                years = self._experience_years(resume_text, resume_entities)
+            features['years'] = years
+        
+        if 'education_match' in components:
+            features['education_required'], features['education_matched'] = self._education_features(structured, job.requirements)
+        
+        if 'keyword_match' in components:
+            features['keyword_similarity'] = self._keyword_similarity(resume_text, job)
+        return features
+    
+    @staticmethod
+    def _fallback_result() -> Dict[str, Any]:
+        return {
+            'total_score': 50.0,
+            'scores': {'skill_match': 50, 'experience_match': 50, 'education_match': 50, 'keyword_match': 50},
+            'feedback': {'error': 'Could not process resume'},
+            'entities': {}
+        }
+    
+    def _experience_years(self, resume_text: str, resume_entities: Dict[str, Any]) -> float:
+        """Largest stated years of experience, or NaN when the resume states none"""
+        if 'stated_experience_years' in resume_entities:
+            stated = resume_entities['stated_experience_years']
         else:
-            return 100.0
+            # Entities cached before the scanner existed
+            stated = scan_resume(resume_text)['stated_experience_years']
+        return math.nan if stated is None else float(stated)
     
-    def _calculate_keyword_match(self, resume_text: str, job) -> float:
-        """Calculate keyword match using TF-IDF if available"""
+    def _keyword_similarity(self, resume_text: str, job) -> float:
+        """Keyword similarity on a 0-100 scale, using TF-IDF if available"""
         if not SKLEARN_AVAILABLE or not self.tfidf:
             # Simple keyword matching fallback
             job_keywords = [job.title.lower()] + [req.lower() for req in job.requirements[:5]]
@@ -220,23 +334,16 @@ class ATSService:
             logger.warning(f"TF-IDF calculation failed: {e}")
             return 50.0
     
-    def _calculate_education_match(self, education: List[str], requirements: List[str]) -> float:
-        """Calculate education match score"""
+    def _education_features(self, structured: Dict[str, Any], requirements: List[str]):
+        """Count the education levels a job asks for and how many the candidate's degrees satisfy"""
         req_text = ' '.join(requirements).lower()
         education_keywords = ['bachelor', 'master', 'phd', 'degree', 'diploma', 'certification']
+        required_education = [keyword for keyword in education_keywords if keyword in req_text]
         
-        required_education = []
-        for keyword in education_keywords:
-            if keyword in req_text:
-                required_education.append(keyword)
-        
-        if not required_education:
-            return 100.0
-        
-        education_text = ' '.join(education).lower()
-        matched = sum(1 for req in required_education if req in education_text)
-        
-        return (matched / len(required_education)) * 100 if required_education else 100
+        degrees = structured.get('education', [])
+        has_certifications = bool(structured.get('sections', {}).get('certifications'))
+        matched = sum(1 for req in required_education if meets_education_requirement(req, degrees, has_certifications))
+        return len(required_education), matched
     
     def _generate_feedback(self, scores: Dict[str, float], entities: Dict, job) -> Dict[str, Any]:
         """Generate detailed feedback for the application"""
@@ -263,6 +370,7 @@ class ATSService:
         
         return feedback
     
+    @span('ats.openai')
     def _extract_with_ai(self, resume_text: str, entities: Dict) -> Dict:
         """Use OpenAI to extract better information"""
         try:
@@ -310,12 +418,16 @@ class ApplicationFilterService:
         if 'max_score' in filters:
             queryset = queryset.filter(ats_score__lte=filters['max_score'])
         
-        if 'skills' in filters:
-            # Filter by required skills
-            for skill in filters['skills']:
-                queryset = queryset.filter(
-                    candidate__candidate_profile__skills__contains=[skill]
-                )
+        # Empty skill lists mean no skill filter, as in the feature store; has_any_keys=[] would match nothing
+        if filters.get('skills'):
+            # Candidates with every listed skill
+            queryset = queryset.filter(candidate__candidate_profile__skills__contains=list(filters['skills']))
+        
+        if filters.get('skills_any'):
+            queryset = queryset.filter(candidate__candidate_profile__skills__has_any_keys=list(filters['skills_any']))
+        
+        if filters.get('skills_none'):
+            queryset = queryset.exclude(candidate__candidate_profile__skills__has_any_keys=list(filters['skills_none']))
         
         if 'experience_min' in filters:
             queryset = queryset.filter(
@@ -325,15 +437,48 @@ class ApplicationFilterService:
         if 'status' in filters:
             queryset = queryset.filter(status__in=filters['status'])
         
+        if 'job' in filters:
+            queryset = queryset.filter(job_id=filters['job'])
+        
         return queryset
     
+    def ranked_ids(self, filters: Dict[str, Any], criteria: str = 'ats_score', limit: int = None):
+        """Filter and rank one job's applications in its feature store without loading rows.
+        
+        Returns None when the store can't answer: no job filter, an unsupported filter or
+        ranking, or the store is unavailable; callers then use the queryset path.
+        """
+        if 'job' not in filters or not set(filters) <= feature_store.FILTERS or criteria == 'calibrated_feedback':
+            return None
+        try:
+            store = feature_store.get_store(uuid.UUID(str(filters['job'])))
+            rows = np.flatnonzero(store.mask(filters))
+            return store.ids(store.rank(rows, criteria, limit))
+        except Exception as e:
+            logger.warning(f"Feature store unavailable, filtering in the database: {e}")
+            return None
+    
+    @staticmethod
+    def hydrate(queryset, application_ids: List) -> List:
+        """Load the given applications in the given order, dropping any outside the queryset"""
+        by_id = queryset.select_related('candidate', 'job').in_bulk(application_ids)
+        return [by_id[application_id] for application_id in application_ids if application_id in by_id]
+    
+    @staticmethod
+    def _calibrated_feedback(app):
+        summary = getattr(app, 'feedback_summary', None)
+        if summary is None or summary.calibrated_rating is None:
+            return float('-inf')
+        return summary.calibrated_rating
+    
     def rank_applications(self, applications, criteria: str = 'ats_score'):
         """Rank applications based on criteria"""
         ranking_functions = {
             'ats_score': lambda app: app.ats_score or 0,
             'experience': lambda app: getattr(app.candidate.candidate_profile, 'experience_years', 0) if hasattr(app.candidate, 'candidate_profile') else 0,
             'skill_match': lambda app: app.skill_match_score or 0,
-            'recent': lambda app: app.submitted_at
+            'recent': lambda app: app.submitted_at,
+            'calibrated_feedback': self._calibrated_feedback,
         }
         
         if criteria in ranking_functions:
@@ -0,0 +1,17 @@
+# apps/ats/tasks.py
+from celery import shared_task
+from apps.jobs.models import Job
+from .dedup import DedupService
+from .rescoring import IncrementalRescoringService
+
+
+@shared_task
+def cluster_resumes():
+    """Nightly near-duplicate clustering of every parsed resume"""
+    return DedupService().cluster()
+
+
+@shared_task
+def rescore_job(job_id, components):
+    """Recompute the given score components for a job's applications after a job edit"""
+    return IncrementalRescoringService(Job.objects.get(pk=job_id)).rescore(components)
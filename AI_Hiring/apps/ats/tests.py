@@ -1,3 +1,125 @@
-from django.test import TestCase
+import random
+import time
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase
+from apps.applications.models import Application
+from apps.jobs.models import Job
+from apps.users.models import User
+from .models import ParsedResume
+from .parsing import parse_resume
+from .rescoring import IncrementalRescoringService
+from .services import ATSService
+from .scanner import scan_resume
 
-# Create your tests here.
+
+class ParseResumeTests(SimpleTestCase):
+    def test_degree_field_extraction(self):
+        text = (
+            'Education\n'
+            'Master of Business Administration at Stanford, 2016\n'
+            'B.Sc. Computer Science & Engineering from MIT 2012\n'
+        )
+
+        education = parse_resume(text)['education']
+
+        self.assertEqual(
+            [(record['level'], record['field']) for record in education],
+            [('master', 'Business Administration'), ('bachelor', 'Computer Science & Engineering')],
+        )
+
+    def test_degree_line_with_long_whitespace_runs_is_linear(self):
+        # A lazy field pattern took minutes on these; each is well under a second now
+        for tail in ('x', '!', 'x!'):
+            started = time.perf_counter()
+            parse_resume('Bachelor of A' + ' ' * 50000 + tail)
+            self.assertLess(time.perf_counter() - started, 1.0, tail)
+
+
+class NearDuplicateParseTests(SimpleTestCase):
+    donor_text = (
+        'Jane Doe\njane@example.com\n\nExperience\nBackend Engineer at Acme, 2018 - 2020\n\n'
+        'Education\nBachelor of Science in Physics, 2017\n\nSkills\nPython, Django\n'
+    )
+
+    def test_donor_shares_only_nlp_entities(self):
+        service = ATSService()
+        donor = service.build_parsed_resume(self.donor_text)
+        donor.entities['experience'] = ['Acme']
+        text = self.donor_text.replace('2018 - 2020', '2016 - 2022').replace('Bachelor', 'Master').replace('Django', 'Kubernetes')
+
+        record = service.build_parsed_resume(text, donor=donor)
+
+        self.assertEqual(record.structured, parse_resume(text))
+        self.assertEqual(record.structured['highest_degree'], 'master')
+        self.assertEqual(record.entities['education'], ['master Physics'])
+        self.assertIn('Kubernetes', record.entities['skills'])
+        self.assertNotIn('Django', record.entities['skills'])
+        self.assertEqual(record.entities['experience'], ['Acme'])
+
+
+class IncrementalRescoringTests(TestCase):
+    def test_uncached_resume_is_extracted_from_its_file(self):
+        job = Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python', 'Django'],
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+        candidate = User.objects.create(username='jane', email='jane@example.com', role='candidate')
+        resume = default_storage.save('applications/resumes/jane.txt', ContentFile(b'Jane Doe\n\nSkills\nPython, Django\n'))
+        application = Application.objects.create(job=job, candidate=candidate, resume=resume, ats_score=10, skill_match_score=0)
+
+        result = IncrementalRescoringService(job).rescore(['skill_match'])
+
+        self.assertEqual(result, {'rescored': 1, 'skipped': 0})
+        application.refresh_from_db()
+        self.assertTrue(ParsedResume.objects.filter(content_hash=application.resume_hash).exists())
+        self.assertGreater(application.skill_match_score, 0)
+
+
+# Inputs that make backtracking patterns blow up, built at a given size
+ADVERSARIAL_INPUTS = {
+    'whitespace run': lambda size: '1' + ' ' * size + 'x',
+    'digit run': lambda size: '1' * size,
+    'digit groups': lambda size: '12 ' * (size // 3),
+    'emails without a tld': lambda size: 'a@b' * (size // 3),
+    'dotted local part': lambda size: 'a' + '.a' * (size // 2) + '@',
+    'parentheses': lambda size: '(1)' * (size // 3),
+    'url prefixes': lambda size: 'https://' * (size // 8),
+    'stated experience': lambda size: '5 years ' * (size // 8),
+}
+FUZZ_FRAGMENTS = (
+    ' ', '\t', '\n', '.', '@', '-', '+', '(', ')', '/', ':', '1', '12', '2019', 'a', 'com',
+    'www.', 'https://', 'linkedin.com/', 'years', 'experience', 'Bachelor of ', 'Experience\n',
+)
+MB = 1 << 20
+
+
+def elapsed(func, text):
+    started = time.perf_counter()
+    func(text)
+    return time.perf_counter() - started
+
+
+class ScannerFuzzTests(SimpleTestCase):
+    """1 MB adversarial inputs: each scan is bounded and grows linearly with the input"""
+
+    def test_adversarial_inputs_scan_in_linear_time(self):
+        for name, build in ADVERSARIAL_INPUTS.items():
+            for func in (scan_resume, parse_resume):
+                with self.subTest(name, func=func.__name__):
+                    full = elapsed(func, build(MB))
+                    quarter = min(elapsed(func, build(MB // 4)) for _ in range(2))
+                    self.assertLess(full, 5.0)
+                    # Linear growth gives ~4x; quadratic would give ~16x
+                    self.assertLess(full, 8 * max(quarter, 0.01))
+
+    def test_random_fragments(self):
+        rng = random.Random(39)
+        for _ in range(3):
+            text = ''.join(rng.choices(FUZZ_FRAGMENTS, k=MB // 4))
+            started = time.perf_counter()
+            result = scan_resume(text)
+            parse_resume(text)
+            self.assertLess(time.perf_counter() - started, 10.0)
+            self.assertTrue(all('@' in email for email in result['contact']['emails']))
+            self.assertTrue(all(1900 <= year < 2100 for year in result['years']))
@@ -0,0 +1,11 @@
+# apps/ats/urls.py
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import ScoringProfileViewSet
+
+router = DefaultRouter()
+router.register(r'scoring-profiles', ScoringProfileViewSet)
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
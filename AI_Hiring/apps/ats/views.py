@@ -1,3 +1,12 @@
-from django.shortcuts import render
+# apps/ats/views.py
+from rest_framework import viewsets
+from utils.db_routing import ReplicaReadMixin
+from utils.permissions import IsRecruiter
+from .models import ScoringProfile
+from .serializers import ScoringProfileSerializer
 
-# Create your views here.
+class ScoringProfileViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
+    queryset = ScoringProfile.objects.all()
+    serializer_class = ScoringProfileSerializer
+    permission_classes = [IsRecruiter]
+    filterset_fields = ['department']
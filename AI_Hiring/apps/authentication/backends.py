@@ -0,0 +1,69 @@
+# apps/authentication/backends.py
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from apps.users.models import User
+
+TOKEN_VERSION_CLAIM = 'ver'
+
+
+def token_version_cache_key(user_id):
+    return f'auth:token_version:{user_id}'
+
+
+def get_token_version(user_id):
+    """Current token version for a user, served from the cache with the database as source of truth"""
+    key = token_version_cache_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = User.objects.filter(pk=user_id).values_list('token_version', flat=True).first()
+        cache.set(key, version, settings.TOKEN_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+async def aget_token_version(user_id):
+    key = token_version_cache_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = await User.objects.filter(pk=user_id).values_list('token_version', flat=True).afirst()
+        await cache.aset(key, version, settings.TOKEN_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def is_token_current(token, version):
+    # Deleted users have no version and every token they held is revoked
+    return version is not None and token.get(TOKEN_VERSION_CLAIM, 0) >= version
+
+
+class ClaimsUser(TokenUser):
+    """Request user built from signed token claims; loads the model only when asked to"""
+
+    @cached_property
+    def role(self):
+        return self.token.get('role')
+
+    @cached_property
+    def instance(self):
+        return User.objects.get(pk=self.pk)
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """JWT authentication that trusts the token claims instead of selecting the user per request"""
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if not is_token_current(validated_token, get_token_version(user.pk)):
+            raise AuthenticationFailed('Token has been revoked', code='token_revoked')
+        return user
+
+
+class DatabaseUserMixin:
+    """For views that need the full User model instead of the token-backed user"""
+
+    def perform_authentication(self, request):
+        super().perform_authentication(request)
+        if isinstance(request.user, ClaimsUser):
+            request.user = request.user.instance
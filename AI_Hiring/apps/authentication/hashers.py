@@ -0,0 +1,47 @@
+# apps/authentication/hashers.py
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+# Hashers keep Django's algorithm names, so existing hashes still verify and
+# Django rehashes them on the next successful login whenever the configured
+# tier or cost differs from the stored one.
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with cost parameters from settings"""
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
+
+
+class TunableScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt with cost parameters from settings"""
+
+    @property
+    def work_factor(self):
+        return settings.SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        return settings.SCRYPT_BLOCK_SIZE
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with the iteration count from settings"""
+
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
@@ -0,0 +1,61 @@
+# apps/authentication/management/commands/benchmark_login.py
+import multiprocessing
+import os
+import time
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from utils.loadtest import format_table
+
+PASSWORD = 'benchmark-Passw0rd!'
+
+
+def _verify(args):
+    encoded, iterations = args
+    for _ in range(iterations):
+        check_password(PASSWORD, encoded)
+    return iterations
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password verifications per second for each hasher tier across worker processes. "
+        "Use it to size login capacity and pick PASSWORD_HASHER_TIER and its cost settings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tiers', nargs='+', default=list(settings.PASSWORD_HASHER_TIERS))
+        parser.add_argument('--processes', type=int, default=os.cpu_count())
+        parser.add_argument('--verifications', type=int, default=20, help='Verifications per process')
+
+    def handle(self, *args, **options):
+        unknown = set(options['tiers']) - set(settings.PASSWORD_HASHER_TIERS)
+        if unknown:
+            raise CommandError(f"Unknown tiers: {', '.join(sorted(unknown))}")
+
+        processes = options['processes']
+        verifications = options['verifications']
+
+        rows = []
+        # Forked workers inherit the configured settings without re-running setup
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            for tier in options['tiers']:
+                hasher = import_string(settings.PASSWORD_HASHER_TIERS[tier])()
+                encoded = make_password(PASSWORD, hasher=hasher)
+
+                started = time.perf_counter()
+                total = sum(pool.map(_verify, [(encoded, verifications)] * processes))
+                elapsed = time.perf_counter() - started
+
+                rows.append({
+                    'name': tier,
+                    'processes': processes,
+                    'verifications': total,
+                    'seconds': round(elapsed, 2),
+                    'per_sec': round(total / elapsed, 1),
+                    'per_sec_per_core': round(total / elapsed / processes, 1),
+                    'ms_per_verify': round(elapsed * 1000 * processes / total, 1),
+                })
+
+        self.stdout.write(format_table(rows))
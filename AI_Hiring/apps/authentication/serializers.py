@@ -1,7 +1,14 @@
 # apps/authentication/serializers.py
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.db import transaction
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 from apps.users.models import User, CandidateProfile, RecruiterProfile
+from .backends import get_token_version, is_token_current
+from .tasks import record_login
+from .tokens import RoleRefreshToken
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=8)
@@ -16,12 +23,17 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Passwords don't match")
         return attrs
     
+    @transaction.atomic
     def create(self, validated_data):
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
-        user = User.objects.create_user(**validated_data)
+        
+        # Hash once and insert directly rather than create_user() followed by set_password() and save()
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
         user.set_password(password)
-        user.save()
+        user.save(force_insert=True)
         
         # Create profile based on role
         if user.role == 'candidate':
@@ -61,4 +73,21 @@ class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'username', 'email', 'first_name', 'last_name', 'role', 'phone', 'is_email_verified')
-        read_only_fields = ('id', 'is_email_verified')
\ No newline at end of file
+        read_only_fields = ('id', 'is_email_verified')
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RoleRefreshToken
+    
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        record_login(self.user)
+        return data
+
+class VersionedTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refuse to refresh tokens issued before the user's token version was bumped"""
+    
+    def validate(self, attrs):
+        refresh = RefreshToken(attrs['refresh'])
+        if not is_token_current(refresh, get_token_version(refresh[api_settings.USER_ID_CLAIM])):
+            raise serializers.ValidationError('Token has been revoked')
+        return super().validate(attrs)
@@ -0,0 +1,22 @@
+# apps/authentication/tasks.py
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+@shared_task(ignore_result=True)
+def update_last_login(user_id, logged_in_at):
+    """Write last_login off the login request path"""
+    from apps.users.models import User
+    
+    # update() skips save(), signals and token version bookkeeping
+    User.objects.filter(pk=user_id).update(last_login=parse_datetime(logged_in_at))
+
+
+def record_login(user):
+    """Queue the last_login write for a successful login when enabled"""
+    if settings.RECORD_LAST_LOGIN:
+        logged_in_at = timezone.now().isoformat()
+        transaction.on_commit(lambda: update_last_login.delay(str(user.pk), logged_in_at))
@@ -1,3 +1,86 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from apps.users.models import User
+from utils.async_views import aauthenticate
+from .backends import ClaimsUser, StatelessJWTAuthentication
+from .tokens import RoleRefreshToken
 
-# Create your tests here.
+
+class WhoAmIView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({'id': str(request.user.pk), 'role': request.user.role})
+
+
+class StatelessJWTAuthenticationTests(TestCase):
+    factory = APIRequestFactory()
+
+    def setUp(self):
+        self.user = User.objects.create(username='jane', email='jane@example.com', role='recruiter')
+        self.user.set_password('secret')
+        self.user.save()
+        self.token = str(RoleRefreshToken.for_user(self.user).access_token)
+
+    def get(self):
+        request = self.factory.get('/whoami/', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        return WhoAmIView.as_view()(request)
+
+    def test_user_comes_from_token_claims(self):
+        cache.clear()
+
+        # Only the token version is read on a cold cache; the user row never is
+        with self.assertNumQueries(1):
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'id': str(self.user.pk), 'role': 'recruiter'})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get().status_code, 200)
+
+    def test_password_change_revokes_token(self):
+        self.user.set_password('changed')
+        self.user.save()
+
+        response = self.get()
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data['code'], 'token_revoked')
+
+
+class AsyncAuthenticateTests(TestCase):
+    factory = RequestFactory()
+
+    def setUp(self):
+        self.user = User.objects.create(username='jane', email='jane@example.com', role='recruiter')
+        self.token = str(RoleRefreshToken.for_user(self.user).access_token)
+
+    def request(self, token=None):
+        return self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token or self.token}')
+
+    async def test_stateless_user_from_claims(self):
+        user = await aauthenticate(self.request())
+
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual((str(user.pk), user.role), (str(self.user.pk), 'recruiter'))
+
+    async def test_revoked_or_invalid_token(self):
+        self.assertIsNone(await aauthenticate(self.request(token='not-a-token')))
+        self.assertIsNone(await aauthenticate(self.factory.get('/')))
+
+        self.user.role = 'candidate'
+        await self.user.asave()
+
+        self.assertIsNone(await aauthenticate(self.request()))
+
+    @override_settings(AUTH_STATELESS_JWT=False)
+    async def test_database_user(self):
+        user = await aauthenticate(self.request())
+
+        self.assertEqual(user, self.user)
+        self.assertIsInstance(user, User)
@@ -0,0 +1,13 @@
+# apps/authentication/tokens.py
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class RoleRefreshToken(RefreshToken):
+    """Refresh token carrying the user's role and token version so requests need no user lookup"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['role'] = user.role
+        token['ver'] = user.token_version
+        return token
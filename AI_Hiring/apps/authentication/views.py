@@ -3,8 +3,9 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken
 from .serializers import UserRegistrationSerializer, UserLoginSerializer
+from .tasks import record_login
+from .tokens import RoleRefreshToken
 
 class AuthViewSet(viewsets.GenericViewSet):
     permission_classes = [AllowAny]
@@ -14,7 +15,7 @@ class AuthViewSet(viewsets.GenericViewSet):
         serializer = UserRegistrationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            refresh = RefreshToken.for_user(user)
+            refresh = RoleRefreshToken.for_user(user)
             return Response({
                 'user_id': user.id,
                 'username': user.username,
@@ -29,7 +30,8 @@ class AuthViewSet(viewsets.GenericViewSet):
         serializer = UserLoginSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.validated_data['user']
-            refresh = RefreshToken.for_user(user)
+            record_login(user)
+            refresh = RoleRefreshToken.for_user(user)
             return Response({
                 'user_id': user.id,
                 'username': user.username,
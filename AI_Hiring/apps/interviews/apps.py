@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class InterviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.interviews'  # Fixed: Full path
\ No newline at end of file
+    name = 'apps.interviews'  # Fixed: Full path
+    
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,178 @@
+# apps/interviews/calibration.py
+import time
+from typing import Dict, List, Tuple
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Avg, F, OuterRef, Subquery
+from django.utils import timezone
+from .models import FeedbackSummary, InterviewerCalibration, InterviewFeedback
+import logging
+
+logger = logging.getLogger(__name__)
+
+FETCH_SIZE = 50000
+
+
+def fit_calibration(interviewers: np.ndarray, applications: np.ndarray, ratings: np.ndarray,
+                    iterations: int = 25, prior_weight: float = 5.0, tolerance: float = 1e-4,
+                    scale_bounds: Tuple[float, float] = (0.25, 4.0)) -> Dict[str, np.ndarray]:
+    """Fit ``rating ~= bias[interviewer] + scale[interviewer] * quality[application]`` by alternating least squares.
+
+    ``interviewers`` and ``applications`` are dense integer codes. Each half-step is a closed-form
+    regression computed for every interviewer (or application) at once with ``np.bincount``.
+    Interviewers with little history are shrunk towards the identity (bias 0, scale 1) with
+    ``prior_weight`` pseudo-observations. The fit runs on ratings centred on their mean, with quality
+    pinned to mean 0 and the rating spread, so the bias prior pulls towards "no offset at the average
+    rating" whatever an interviewer's scale; bias and quality are returned on the raw rating scale.
+    """
+    ratings = ratings.astype(np.float64)
+    n_interviewers = int(interviewers.max()) + 1
+    n_applications = int(applications.max()) + 1
+
+    interviewer_counts = np.bincount(interviewers, minlength=n_interviewers).astype(np.float64)
+    application_counts = np.bincount(applications, minlength=n_applications).astype(np.float64)
+    rating_mean = ratings.mean()
+    rating_std = max(ratings.std(), 1e-6)
+    prior = prior_weight * rating_std ** 2
+
+    centred = ratings - rating_mean
+    quality = np.bincount(applications, centred, n_applications) / application_counts
+    bias = np.zeros(n_interviewers)
+    scale = np.ones(n_interviewers)
+
+    iteration = 0
+    for iteration in range(1, iterations + 1):
+        # Pin quality to mean 0 and the rating spread so bias and scale are identifiable
+        quality_mean = np.average(quality, weights=application_counts)
+        quality_std = np.sqrt(np.average((quality - quality_mean) ** 2, weights=application_counts))
+        quality = (quality - quality_mean) / max(quality_std, 1e-6) * rating_std
+
+        # Per-interviewer simple regression of rating on application quality
+        x = quality[applications]
+        mean_x = np.bincount(interviewers, x, n_interviewers) / interviewer_counts
+        mean_y = np.bincount(interviewers, centred, n_interviewers) / interviewer_counts
+        var_x = np.bincount(interviewers, x * x, n_interviewers) / interviewer_counts - mean_x ** 2
+        cov_xy = np.bincount(interviewers, x * centred, n_interviewers) / interviewer_counts - mean_x * mean_y
+
+        new_scale = (interviewer_counts * cov_xy + prior) / (interviewer_counts * np.maximum(var_x, 0) + prior)
+        new_scale = np.clip(new_scale, *scale_bounds)
+        new_bias = interviewer_counts * (mean_y - new_scale * mean_x) / (interviewer_counts + prior_weight)
+
+        # Per-application least squares estimate of quality given the interviewer factors
+        row_scale = new_scale[interviewers]
+        quality = (
+            np.bincount(applications, row_scale * (centred - new_bias[interviewers]), n_applications)
+            / np.bincount(applications, row_scale ** 2, n_applications)
+        )
+
+        change = max(np.abs(new_bias - bias).max(), np.abs(new_scale - scale).max())
+        bias, scale = new_bias, new_scale
+        if change < tolerance:
+            break
+
+    # Back on the raw rating scale, where calibrated ratings are (rating - bias) / scale
+    return {
+        'bias': bias + (1 - scale) * rating_mean,
+        'scale': scale,
+        'quality': quality + rating_mean,
+        'interviewer_counts': interviewer_counts.astype(np.int64),
+        'iterations': iteration,
+    }
+
+
+def _factorize(values: List) -> Tuple[np.ndarray, List]:
+    """Map ids to dense integer codes, returning the codes and the id for each code"""
+    codes = {}
+    encoded = np.fromiter((codes.setdefault(value, len(codes)) for value in values), dtype=np.int64, count=len(values))
+    return encoded, list(codes)
+
+
+class CalibrationService:
+    """Load all feedback, fit interviewer calibration factors and store them"""
+
+    def load_feedback(self):
+        """Stream (interviewer, application, rating) rows straight from a server-side cursor"""
+        queryset = InterviewFeedback.objects.values_list('interviewer_id', 'interview__application_id', 'overall_rating')
+        sql, params = queryset.query.sql_with_params()
+
+        interviewer_ids, application_ids, ratings = [], [], []
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                interviewers, applications, values = zip(*rows)
+                interviewer_ids.extend(interviewers)
+                application_ids.extend(applications)
+                ratings.extend(values)
+
+        return interviewer_ids, application_ids, np.asarray(ratings, dtype=np.float64)
+
+    def run(self) -> Dict[str, object]:
+        started = time.perf_counter()
+        interviewer_ids, application_ids, ratings = self.load_feedback()
+        if not len(ratings):
+            return {'feedback': 0, 'interviewers': 0}
+        loaded = time.perf_counter()
+
+        interviewers, interviewer_keys = _factorize(interviewer_ids)
+        applications, _ = _factorize(application_ids)
+        result = fit_calibration(
+            interviewers,
+            applications,
+            ratings,
+            iterations=settings.CALIBRATION_MAX_ITERATIONS,
+            prior_weight=settings.CALIBRATION_PRIOR_WEIGHT,
+        )
+        fitted = time.perf_counter()
+
+        self.store(interviewer_keys, result)
+        stored = time.perf_counter()
+
+        stats = {
+            'feedback': len(ratings),
+            'interviewers': len(interviewer_keys),
+            'iterations': result['iterations'],
+            'load_seconds': round(loaded - started, 3),
+            'fit_seconds': round(fitted - loaded, 3),
+            'store_seconds': round(stored - fitted, 3),
+        }
+        logger.info(f"Interviewer calibration fitted: {stats}")
+        return stats
+
+    @transaction.atomic
+    def store(self, interviewer_keys: List, result: Dict[str, np.ndarray]):
+        fitted_at = timezone.now()
+        InterviewerCalibration.objects.bulk_create(
+            [
+                InterviewerCalibration(
+                    interviewer_id=interviewer_id,
+                    bias=float(bias),
+                    scale=float(scale),
+                    feedback_count=int(count),
+                    fitted_at=fitted_at,
+                )
+                for interviewer_id, bias, scale, count in zip(
+                    interviewer_keys, result['bias'], result['scale'], result['interviewer_counts']
+                )
+            ],
+            update_conflicts=True,
+            unique_fields=['interviewer'],
+            update_fields=['bias', 'scale', 'feedback_count', 'fitted_at'],
+            batch_size=1000,
+        )
+
+        # Recompute every summary's calibrated rating with one set-based update
+        calibrated = (
+            InterviewFeedback.objects
+            .filter(interview__application_id=OuterRef('application_id'))
+            .values('interview__application_id')
+            .annotate(value=Avg(
+                (F('overall_rating') - F('interviewer__interviewer_calibration__bias'))
+                / F('interviewer__interviewer_calibration__scale')
+            ))
+            .values('value')
+        )
+        FeedbackSummary.objects.update(calibrated_rating=Subquery(calibrated))
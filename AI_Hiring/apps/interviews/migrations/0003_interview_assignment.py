@@ -0,0 +1,62 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:55
+
+from django.conf import settings
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+import django.db.models.deletion
+import utils.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('interviews', '0002_initial'),
+    ]
+
+    operations = [
+        # The through model takes over the existing auto-created M2M table
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='InterviewAssignment',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('interview', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='interviews.interview')),
+                        ('interviewer', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='interview_assignments', to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'db_table': 'interviews_interviewers',
+                        'unique_together': {('interview', 'interviewer')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='interview',
+                    name='interviewers',
+                    field=models.ManyToManyField(related_name='interviews_conducted', through='interviews.InterviewAssignment', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='interviewassignment',
+            name='period',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, null=True),
+        ),
+        utils.postgres.PostgresOnlyRunSQL(
+            sql="""
+                UPDATE interviews_interviewers AS assignment
+                SET period = tstzrange(interview.scheduled_at, interview.scheduled_at + interview.duration_minutes * interval '1 minute')
+                FROM interviews AS interview
+                WHERE assignment.interview_id = interview.id
+                  AND interview.status IN ('scheduled', 'in_progress', 'completed')
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        BtreeGistExtension(),
+        utils.postgres.PostgresOnlyAddConstraint(
+            model_name='interviewassignment',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[('interviewer', '='), ('period', '&&')], name='interview_no_double_booking'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_bulk_import'),
+        ('interviews', '0003_interview_assignment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedbackSummary',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='feedback_summary', serialize=False, to='applications.application')),
+                ('feedback_count', models.PositiveIntegerField(default=0)),
+                ('overall_mean', models.FloatField(blank=True, null=True)),
+                ('overall_variance', models.FloatField(blank=True, null=True)),
+                ('dimension_means', models.JSONField(default=dict)),
+                ('dimension_variances', models.JSONField(default=dict)),
+                ('recommendation_counts', models.JSONField(default=dict)),
+                ('calibrated_scores', models.JSONField(default=dict)),
+                ('calibrated_overall', models.FloatField(blank=True, db_index=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'interview_feedback_summaries',
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_token_version'),
+        ('interviews', '0004_feedback_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewerCalibration',
+            fields=[
+                ('interviewer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='interviewer_calibration', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('bias', models.FloatField(default=0.0)),
+                ('scale', models.FloatField(default=1.0)),
+                ('feedback_count', models.PositiveIntegerField(default=0)),
+                ('fitted_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'interviewer_calibrations',
+            },
+        ),
+        migrations.AddField(
+            model_name='feedbacksummary',
+            name='calibrated_rating',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:30
+
+from django.db import migrations
+import utils.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0005_interviewer_calibration'),
+    ]
+
+    operations = [
+        # Same tstzrange column; only the Python field changes. State-only, as SQLite would rebuild the
+        # table along with the exclusion constraint it cannot express
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='interviewassignment',
+                    name='period',
+                    field=utils.postgres.PortableDateTimeRangeField(blank=True, null=True),
+                ),
+            ],
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
+from django.db import connections, models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import RangeOperators
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from datetime import timedelta
+from utils.postgres import PortableDateTimeRangeField
 import uuid
 
 User = get_user_model()
@@ -23,6 +28,9 @@ class Interview(models.Model):
         ('no_show', 'No Show'),
     ]
     
+    # Statuses that occupy the interviewers' calendars
+    BOOKED_STATUSES = ('scheduled', 'in_progress', 'completed')
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     application = models.ForeignKey('applications.Application', on_delete=models.CASCADE, related_name='interviews')
     type = models.CharField(max_length=30, choices=TYPE_CHOICES)
@@ -35,7 +43,7 @@ class Interview(models.Model):
     location = models.CharField(max_length=200, blank=True)
     
     # Participants
-    interviewers = models.ManyToManyField(User, related_name='interviews_conducted')
+    interviewers = models.ManyToManyField(User, through='InterviewAssignment', related_name='interviews_conducted')
     
     # Feedback
     feedback = models.JSONField(default=dict)
@@ -51,6 +59,44 @@ class Interview(models.Model):
     class Meta:
         db_table = 'interviews'
         ordering = ['scheduled_at']
+    
+    @property
+    def ends_at(self):
+        return self.scheduled_at + timedelta(minutes=self.duration_minutes)
+    
+    @property
+    def booked_period(self):
+        """Calendar range blocked by this interview, or None when it no longer blocks anyone"""
+        if self.status not in self.BOOKED_STATUSES:
+            return None
+        if connections[self._state.db or 'default'].vendor != 'postgresql':
+            # Nothing to store the range in; the column is null on other backends
+            return None
+        return DateTimeTZRange(self.scheduled_at, self.ends_at)
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Keep the denormalized periods in step with the schedule; the exclusion constraint checks them.
+        # Range columns exist only on PostgreSQL, so other backends track no bookings
+        if connections[self._state.db].vendor == 'postgresql':
+            self.assignments.update(period=self.booked_period)
+
+class InterviewAssignment(models.Model):
+    """Interviewer on an interview panel, with the booked period used for conflict detection"""
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='assignments')
+    interviewer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='interview_assignments', db_column='user_id')
+    period = PortableDateTimeRangeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'interviews_interviewers'
+        unique_together = ['interview', 'interviewer']
+        constraints = [
+            # Half-open ranges, so back-to-back interviews don't conflict
+            ExclusionConstraint(
+                name='interview_no_double_booking',
+                expressions=[('interviewer', RangeOperators.EQUAL), ('period', RangeOperators.OVERLAPS)],
+            ),
+        ]
 
 class InterviewFeedback(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -82,3 +128,42 @@ class InterviewFeedback(models.Model):
         db_table = 'interview_feedback'
         unique_together = ['interview', 'interviewer']
 
+
+class FeedbackSummary(models.Model):
+    """Per-application rollup of interview feedback, refreshed whenever feedback changes"""
+    DIMENSIONS = ('technical_skills', 'communication', 'problem_solving', 'cultural_fit', 'overall_rating')
+    
+    application = models.OneToOneField('applications.Application', on_delete=models.CASCADE, primary_key=True, related_name='feedback_summary')
+    feedback_count = models.PositiveIntegerField(default=0)
+    
+    # Raw statistics across the application's interviewers
+    overall_mean = models.FloatField(null=True, blank=True)
+    overall_variance = models.FloatField(null=True, blank=True)
+    dimension_means = models.JSONField(default=dict)
+    dimension_variances = models.JSONField(default=dict)
+    recommendation_counts = models.JSONField(default=dict)
+    
+    # Ratings expressed relative to each interviewer's own rating history
+    calibrated_scores = models.JSONField(default=dict)
+    calibrated_overall = models.FloatField(null=True, blank=True, db_index=True)
+    # Mean overall rating corrected by each interviewer's fitted bias and scale
+    calibrated_rating = models.FloatField(null=True, blank=True, db_index=True)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'interview_feedback_summaries'
+
+class InterviewerCalibration(models.Model):
+    """Fitted rating bias and scale for an interviewer: rating ~= bias + scale * candidate quality"""
+    interviewer = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='interviewer_calibration')
+    bias = models.FloatField(default=0.0)
+    scale = models.FloatField(default=1.0)
+    feedback_count = models.PositiveIntegerField(default=0)
+    fitted_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'interviewer_calibrations'
+    
+    def calibrate(self, rating):
+        return (rating - self.bias) / self.scale
@@ -1,13 +1,149 @@
 # apps/interviews/serializers.py
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
-from .models import Interview, InterviewFeedback
+from apps.applications.models import Application
+from apps.users.models import User
+from .models import FeedbackSummary, Interview, InterviewAssignment, InterviewFeedback
+from .services import SchedulingService
 
 class InterviewSerializer(serializers.ModelSerializer):
+    # Declared explicitly since DRF leaves M2M fields with a through model read-only
+    interviewers = serializers.PrimaryKeyRelatedField(many=True, queryset=User.objects.all())
+
     class Meta:
         model = Interview
         fields = '__all__'
 
+    def validate(self, attrs):
+        instance = self.instance
+        status = attrs.get('status', instance.status if instance else 'scheduled')
+        if status not in Interview.BOOKED_STATUSES:
+            return attrs
+
+        scheduled_at = attrs.get('scheduled_at', instance.scheduled_at if instance else None)
+        duration = attrs.get('duration_minutes', instance.duration_minutes if instance else 60)
+        if 'interviewers' in attrs:
+            interviewer_ids = [user.pk for user in attrs['interviewers']]
+        else:
+            interviewer_ids = list(instance.assignments.values_list('interviewer_id', flat=True)) if instance else []
+
+        conflicts = SchedulingService().find_conflicts(
+            interviewer_ids,
+            scheduled_at,
+            scheduled_at + timedelta(minutes=duration),
+            exclude=[instance.pk] if instance else None,
+        )
+        if conflicts:
+            raise serializers.ValidationError({
+                'interviewers': [f'Interviewer {pk} is already booked at this time' for pk in conflicts]
+            })
+        return attrs
+
+    def create(self, validated_data):
+        interviewers = validated_data.pop('interviewers')
+        return self._save(Interview(**validated_data), interviewers)
+
+    def update(self, instance, validated_data):
+        interviewers = validated_data.pop('interviewers', None)
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        return self._save(instance, interviewers)
+
+    def _save(self, interview, interviewers):
+        # The exclusion constraint is the final word when two bookings race past validation
+        try:
+            with transaction.atomic():
+                interview.save()
+                if interviewers is not None:
+                    interview.assignments.all().delete()
+                    InterviewAssignment.objects.bulk_create([
+                        InterviewAssignment(interview=interview, interviewer=user, period=interview.booked_period)
+                        for user in interviewers
+                    ])
+        except IntegrityError:
+            raise serializers.ValidationError({'interviewers': ['An interviewer was booked for this time in the meantime']})
+        return interview
+
 class InterviewFeedbackSerializer(serializers.ModelSerializer):
     class Meta:
         model = InterviewFeedback
         fields = '__all__'
+        read_only_fields = ['interview', 'interviewer']
+
+class FeedbackSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = FeedbackSummary
+        fields = [
+            'application', 'feedback_count', 'overall_mean', 'overall_variance',
+            'dimension_means', 'dimension_variances', 'recommendation_counts',
+            'calibrated_scores', 'calibrated_overall', 'calibrated_rating', 'updated_at'
+        ]
+
+class SlotSearchSerializer(serializers.Serializer):
+    interviewers = serializers.PrimaryKeyRelatedField(many=True, queryset=User.objects.all())
+    duration_minutes = serializers.IntegerField(min_value=5, max_value=8 * 60, default=60)
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    panel_size = serializers.IntegerField(min_value=1, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+    def validate(self, attrs):
+        if attrs['end'] <= attrs['start']:
+            raise serializers.ValidationError("end must be after start")
+        if attrs['end'] - attrs['start'] > timedelta(days=settings.SCHEDULING_MAX_WINDOW_DAYS):
+            raise serializers.ValidationError(f"Search window is limited to {settings.SCHEDULING_MAX_WINDOW_DAYS} days")
+        if attrs.get('panel_size', 0) > len(attrs['interviewers']):
+            raise serializers.ValidationError("panel_size cannot exceed the number of interviewers")
+        return attrs
+
+class BulkInterviewItemSerializer(serializers.Serializer):
+    id = serializers.UUIDField(required=False, help_text='Existing interview to reschedule')
+    application = serializers.UUIDField(required=False)
+    type = serializers.ChoiceField(choices=Interview.TYPE_CHOICES, required=False)
+    scheduled_at = serializers.DateTimeField()
+    duration_minutes = serializers.IntegerField(min_value=5, max_value=8 * 60, required=False)
+    meeting_link = serializers.URLField(required=False, allow_blank=True)
+    location = serializers.CharField(max_length=200, required=False, allow_blank=True)
+    interviewers = serializers.ListField(child=serializers.UUIDField(), required=False)
+
+    def validate(self, attrs):
+        if 'id' not in attrs and not {'application', 'type', 'interviewers'} <= attrs.keys():
+            raise serializers.ValidationError("New interviews need application, type and interviewers")
+        if 'id' in attrs and 'application' in attrs:
+            raise serializers.ValidationError({'application': ["An interview cannot be moved to another application"]})
+        return attrs
+
+class BulkInterviewSerializer(serializers.Serializer):
+    interviews = BulkInterviewItemSerializer(many=True, allow_empty=False, max_length=settings.INTERVIEW_BULK_MAX_ITEMS)
+
+    def validate_interviews(self, items):
+        """Resolve every referenced interview, application and interviewer with one query each"""
+        interview_ids = {item['id'] for item in items if 'id' in item}
+        application_ids = {item['application'] for item in items if 'application' in item}
+        user_ids = {pk for item in items for pk in item.get('interviewers', [])}
+
+        interviews = Interview.objects.in_bulk(interview_ids)
+        applications = Application.objects.in_bulk(application_ids)
+        users = User.objects.in_bulk(user_ids)
+
+        missing = (
+            [f'Interview {pk} not found' for pk in interview_ids - interviews.keys()]
+            + [f'Application {pk} not found' for pk in application_ids - applications.keys()]
+            + [f'User {pk} not found' for pk in user_ids - users.keys()]
+        )
+        if missing:
+            raise serializers.ValidationError(missing)
+
+        resolved = []
+        for item in items:
+            item = dict(item)
+            if 'id' in item:
+                item['interview'] = interviews[item.pop('id')]
+            if 'application' in item:
+                item['application'] = applications[item['application']]
+            if 'interviewers' in item:
+                item['interviewers'] = [users[pk] for pk in item['interviewers']]
+            resolved.append(item)
+        return resolved
@@ -0,0 +1,358 @@
+# apps/interviews/services.py
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from math import sqrt
+from statistics import fmean, pvariance
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, F
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.utils import timezone
+from utils.postgres import is_postgres
+from .models import FeedbackSummary, Interview, InterviewAssignment, InterviewerCalibration, InterviewFeedback
+import logging
+
+logger = logging.getLogger(__name__)
+
+Interval = Tuple[datetime, datetime]
+
+
+class SchedulingConflict(ValueError):
+    """Raised when a booking would overlap an interviewer's existing interviews"""
+
+    def __init__(self, conflicts: List[Dict[str, object]]):
+        super().__init__('Interviewers are double-booked')
+        self.conflicts = conflicts
+
+
+class IntervalIndex:
+    """Sorted, merged busy intervals per interviewer answering overlap queries with bisect"""
+
+    def __init__(self, intervals: Dict[object, Iterable[Interval]]):
+        self.starts = {}
+        self.ends = {}
+        for interviewer_id, busy in intervals.items():
+            merged = self._merge(busy)
+            self.starts[interviewer_id] = [start for start, _ in merged]
+            self.ends[interviewer_id] = [end for _, end in merged]
+
+    @staticmethod
+    def _merge(intervals: Iterable[Interval]) -> List[Interval]:
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def is_free(self, interviewer_id, start: datetime, end: datetime) -> bool:
+        """Whether [start, end) overlaps none of the interviewer's busy intervals"""
+        starts = self.starts.get(interviewer_id)
+        if not starts:
+            return True
+        # Merged intervals are disjoint, so only the last one starting before `end` can overlap
+        i = bisect_left(starts, end) - 1
+        return i < 0 or self.ends[interviewer_id][i] <= start
+
+    def next_free(self, interviewer_id, start: datetime) -> datetime:
+        """Earliest time at or after `start` when the interviewer isn't busy"""
+        starts = self.starts.get(interviewer_id)
+        if not starts:
+            return start
+        i = bisect_right(starts, start) - 1
+        if i >= 0 and self.ends[interviewer_id][i] > start:
+            return self.ends[interviewer_id][i]
+        return start
+
+
+class SchedulingService:
+    """Find free interview slots for a panel and detect double bookings"""
+
+    def __init__(self):
+        self.step = timedelta(minutes=settings.SCHEDULING_SLOT_STEP_MINUTES)
+        self.workday_start = settings.SCHEDULING_WORKDAY_START_HOUR
+        self.workday_end = settings.SCHEDULING_WORKDAY_END_HOUR
+
+    def build_index(self, interviewer_ids: List, start: datetime, end: datetime,
+                    exclude: Optional[List] = None) -> IntervalIndex:
+        """Load every booked period overlapping the window in a single query"""
+        if not is_postgres():
+            # Range columns exist only on PostgreSQL; like Interview.save, other backends track no bookings
+            return IntervalIndex({})
+        assignments = InterviewAssignment.objects.filter(
+            interviewer_id__in=interviewer_ids,
+            period__overlap=DateTimeTZRange(start, end),
+        )
+        if exclude:
+            assignments = assignments.exclude(interview_id__in=exclude)
+
+        intervals = defaultdict(list)
+        for interviewer_id, period in assignments.values_list('interviewer_id', 'period'):
+            intervals[interviewer_id].append((period.lower, period.upper))
+        return IntervalIndex(intervals)
+
+    def find_conflicts(self, interviewer_ids: List, start: datetime, end: datetime,
+                       exclude: Optional[List] = None) -> List:
+        """Interviewers already booked during [start, end)"""
+        index = self.build_index(interviewer_ids, start, end, exclude)
+        return [pk for pk in interviewer_ids if not index.is_free(pk, start, end)]
+
+    def bulk_schedule(self, items: List[Dict[str, object]]) -> List[Interview]:
+        """Create or reschedule a batch of interviews in one transaction.
+
+        Items carrying an ``interview`` are reschedules; the rest are new interviews.
+        Interviews and panel assignments are each written with a single bulk query.
+        """
+        rescheduled = [item['interview'] for item in items if item.get('interview')]
+        current_panels = defaultdict(list)
+        for interview_id, interviewer_id in InterviewAssignment.objects.filter(
+            interview__in=rescheduled
+        ).values_list('interview_id', 'interviewer_id'):
+            current_panels[interview_id].append(interviewer_id)
+
+        interviews, panels = [], []
+        for item in items:
+            interview = item.get('interview') or Interview()
+            interview.updated_at = timezone.now()
+            for field, value in item.items():
+                if field not in ('interview', 'interviewers'):
+                    setattr(interview, field, value)
+            if interview.status not in Interview.BOOKED_STATUSES:
+                interview.status = 'scheduled'
+            interviews.append(interview)
+            if 'interviewers' in item:
+                panels.append([user.pk for user in item['interviewers']])
+            else:
+                panels.append(current_panels[interview.pk])
+
+        self._check_batch_conflicts(interviews, panels, exclude=[interview.pk for interview in rescheduled])
+
+        try:
+            with transaction.atomic():
+                Interview.objects.bulk_create([i for i in interviews if i._state.adding])
+                Interview.objects.bulk_update(rescheduled, [
+                    'type', 'status', 'scheduled_at', 'duration_minutes', 'meeting_link', 'location', 'updated_at',
+                ])
+
+                # Replace panels wholesale so periods are rewritten in the same pass
+                InterviewAssignment.objects.filter(interview__in=rescheduled).delete()
+                InterviewAssignment.objects.bulk_create([
+                    InterviewAssignment(interview=interview, interviewer_id=interviewer_id, period=interview.booked_period)
+                    for interview, panel in zip(interviews, panels)
+                    for interviewer_id in panel
+                ])
+        except IntegrityError:
+            # Another booking won the race after the conflict check
+            raise SchedulingConflict([])
+        return interviews
+
+    def _check_batch_conflicts(self, interviews: List[Interview], panels: List[List], exclude: List):
+        """Check every booking against stored interviews and against the rest of the batch"""
+        interviewer_ids = list({pk for panel in panels for pk in panel})
+        if not interviewer_ids:
+            return
+        # Rescheduled interviews may overlap their own previous slot
+        index = self.build_index(
+            interviewer_ids,
+            min(i.scheduled_at for i in interviews),
+            max(i.ends_at for i in interviews),
+            exclude=exclude,
+        )
+
+        conflicts = []
+        batch = defaultdict(list)
+        for position, (interview, panel) in enumerate(zip(interviews, panels)):
+            for interviewer_id in panel:
+                batch[interviewer_id].append((interview.scheduled_at, interview.ends_at, position))
+                if not index.is_free(interviewer_id, interview.scheduled_at, interview.ends_at):
+                    conflicts.append({'index': position, 'interviewer': interviewer_id})
+
+        for interviewer_id, bookings in batch.items():
+            bookings.sort()
+            for (_, previous_end, _), (start, _, position) in zip(bookings, bookings[1:]):
+                if start < previous_end:
+                    conflicts.append({'index': position, 'interviewer': interviewer_id})
+
+        if conflicts:
+            raise SchedulingConflict(conflicts)
+
+    def find_slots(self, interviewer_ids: List, duration_minutes: int, start: datetime, end: datetime,
+                   panel_size: Optional[int] = None, limit: int = 10) -> List[Dict[str, object]]:
+        """Return up to `limit` slots in [start, end) where `panel_size` of the interviewers are free.
+
+        Without a panel size every interviewer must be available.
+        """
+        panel_size = panel_size or len(interviewer_ids)
+        duration = timedelta(minutes=duration_minutes)
+        index = self.build_index(interviewer_ids, start, end)
+
+        slots = []
+        slot_start = self._align(max(start, timezone.now()))
+        while slot_start + duration <= end and len(slots) < limit:
+            slot_end = slot_start + duration
+            if not self._within_workday(slot_start, slot_end):
+                slot_start = self._next_workday_start(slot_start)
+                continue
+
+            free = [pk for pk in interviewer_ids if index.is_free(pk, slot_start, slot_end)]
+            if len(free) >= panel_size:
+                slots.append({'start': slot_start, 'end': slot_end, 'interviewers': free[:panel_size]})
+                slot_start += duration
+            else:
+                # Skip ahead to the earliest moment another interviewer frees up
+                busy = [index.next_free(pk, slot_start) for pk in interviewer_ids if pk not in free]
+                slot_start = self._align(max(slot_start + self.step, min(busy)))
+        return slots
+
+    def _align(self, moment: datetime) -> datetime:
+        """Round up to the next slot boundary"""
+        moment = moment.replace(second=0, microsecond=0)
+        step_minutes = int(self.step.total_seconds() // 60)
+        remainder = (moment.hour * 60 + moment.minute) % step_minutes
+        return moment + timedelta(minutes=step_minutes - remainder) if remainder else moment
+
+    def _within_workday(self, start: datetime, end: datetime) -> bool:
+        local_start, local_end = timezone.localtime(start), timezone.localtime(end)
+        if local_start.weekday() >= 5 or local_start.date() != local_end.date():
+            return False
+        day_start = local_start.replace(hour=self.workday_start, minute=0)
+        day_end = local_start.replace(hour=self.workday_end, minute=0)
+        return day_start <= local_start and local_end <= day_end
+
+    def _next_workday_start(self, moment: datetime) -> datetime:
+        local = timezone.localtime(moment)
+        day_start = local.replace(hour=self.workday_start, minute=0, second=0, microsecond=0)
+        if local < day_start and local.weekday() < 5:
+            return day_start
+        day_start += timedelta(days=1)
+        while day_start.weekday() >= 5:
+            day_start += timedelta(days=1)
+        return day_start
+
+
+class FeedbackAggregationService:
+    """Keep per-application feedback summaries current as feedback is written"""
+
+    dimensions = FeedbackSummary.DIMENSIONS
+
+    def refresh(self, application_id) -> Optional[FeedbackSummary]:
+        """Recompute one application's summary from its own feedback rows"""
+        return next(iter(self.refresh_many([application_id]).values()), None)
+
+    def refresh_interviewer(self, interviewer_id, exclude=None) -> Dict[object, FeedbackSummary]:
+        """Recompute every application the interviewer rated.
+
+        A new rating moves the interviewer's baseline, which every other calibrated score of theirs is relative to.
+        """
+        application_ids = set(
+            InterviewFeedback.objects.filter(interviewer_id=interviewer_id)
+            .exclude(interview__application_id=exclude)
+            .values_list('interview__application_id', flat=True)
+        )
+        return self.refresh_many(application_ids)
+
+    def refresh_many(self, application_ids) -> Dict[object, FeedbackSummary]:
+        """Recompute several applications' summaries with one query per table"""
+        application_ids = set(application_ids)
+        entries = defaultdict(list)
+        for entry in (
+            InterviewFeedback.objects.filter(interview__application_id__in=application_ids)
+            .values('interview__application_id', 'interviewer_id', 'recommendation', *self.dimensions)
+        ):
+            entries[entry.pop('interview__application_id')].append(entry)
+
+        # Also covers the applications themselves having been deleted
+        FeedbackSummary.objects.filter(application_id__in=application_ids - entries.keys()).delete()
+        if not entries:
+            return {}
+
+        interviewer_ids = {entry['interviewer_id'] for rows in entries.values() for entry in rows}
+        baselines = self._interviewer_baselines(interviewer_ids)
+        calibrations = InterviewerCalibration.objects.in_bulk(interviewer_ids)
+        summaries = [
+            self._summarize(application_id, rows, baselines, calibrations)
+            for application_id, rows in entries.items()
+        ]
+        FeedbackSummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=['application'],
+            update_fields=[
+                'feedback_count', 'overall_mean', 'overall_variance', 'dimension_means', 'dimension_variances',
+                'recommendation_counts', 'calibrated_scores', 'calibrated_overall', 'calibrated_rating', 'updated_at',
+            ],
+            batch_size=1000,
+        )
+        return {summary.application_id: summary for summary in summaries}
+
+    def _summarize(self, application_id, entries, baselines, calibrations) -> FeedbackSummary:
+        means, variances, calibrated = {}, {}, {}
+        for dimension in self.dimensions:
+            ratings = [(entry['interviewer_id'], entry[dimension]) for entry in entries if entry[dimension] is not None]
+            if not ratings:
+                continue
+            values = [rating for _, rating in ratings]
+            means[dimension] = round(fmean(values), 3)
+            variances[dimension] = round(pvariance(values), 3)
+
+            z_scores = [
+                z for z in (self._z_score(rating, baselines.get((interviewer_id, dimension))) for interviewer_id, rating in ratings)
+                if z is not None
+            ]
+            if z_scores:
+                calibrated[dimension] = round(fmean(z_scores), 3)
+
+        return FeedbackSummary(
+            application_id=application_id,
+            feedback_count=len(entries),
+            overall_mean=means.get('overall_rating'),
+            overall_variance=variances.get('overall_rating'),
+            dimension_means=means,
+            dimension_variances=variances,
+            recommendation_counts=dict(Counter(entry['recommendation'] for entry in entries)),
+            calibrated_scores=calibrated,
+            calibrated_overall=calibrated.get('overall_rating'),
+            calibrated_rating=self._calibrated_rating(entries, calibrations),
+        )
+
+    @staticmethod
+    def _calibrated_rating(entries, calibrations) -> Optional[float]:
+        """Mean overall rating corrected with the nightly fitted interviewer factors"""
+        ratings = [
+            calibrations[entry['interviewer_id']].calibrate(entry['overall_rating'])
+            for entry in entries if entry['interviewer_id'] in calibrations
+        ]
+        return round(fmean(ratings), 3) if ratings else None
+
+    def _interviewer_baselines(self, interviewer_ids) -> Dict[Tuple, Tuple[float, float]]:
+        """Mean and standard deviation of every interviewer's ratings, in one grouped query"""
+        if not interviewer_ids:
+            return {}
+        aggregates = {}
+        for dimension in self.dimensions:
+            # Deviation from the mean square: SQLite's StdDev chokes on the nulls of unrated dimensions
+            aggregates[f'{dimension}_mean'] = Avg(dimension)
+            aggregates[f'{dimension}_square'] = Avg(F(dimension) * F(dimension))
+        rows = (
+            InterviewFeedback.objects.filter(interviewer_id__in=interviewer_ids)
+            .values('interviewer_id')
+            .annotate(**aggregates)
+        )
+        baselines = {}
+        for row in rows:
+            for dimension in self.dimensions:
+                mean, square = row[f'{dimension}_mean'], row[f'{dimension}_square']
+                std = sqrt(max(square - mean * mean, 0.0)) if mean is not None else None
+                baselines[(row['interviewer_id'], dimension)] = (mean, std)
+        return baselines
+
+    @staticmethod
+    def _z_score(rating, baseline) -> Optional[float]:
+        # Interviewers without spread in their history can't be calibrated yet
+        if not baseline or baseline[0] is None or not baseline[1]:
+            return None
+        mean, std = baseline
+        return (rating - mean) / std
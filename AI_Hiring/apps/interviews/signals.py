@@ -0,0 +1,24 @@
+# apps/interviews/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Interview, InterviewFeedback
+from .services import FeedbackAggregationService
+from .tasks import refresh_interviewer_summaries
+
+
+@receiver(post_save, sender=InterviewFeedback)
+@receiver(post_delete, sender=InterviewFeedback)
+def refresh_feedback_summary(sender, instance, **kwargs):
+    application_id = Interview.objects.filter(pk=instance.interview_id).values_list('application_id', flat=True).first()
+    if application_id is None:
+        return
+    interviewer_id = instance.interviewer_id
+
+    def refresh():
+        FeedbackAggregationService().refresh(application_id)
+        # The interviewer's baseline moved, so their other applications' calibrated scores did too
+        refresh_interviewer_summaries.delay(str(interviewer_id), exclude=str(application_id))
+
+    # Refresh once the feedback write is committed so the summary sees it
+    transaction.on_commit(refresh)
@@ -0,0 +1,16 @@
+# apps/interviews/tasks.py
+from celery import shared_task
+from .calibration import CalibrationService
+from .services import FeedbackAggregationService
+
+
+@shared_task
+def calibrate_interviewers():
+    """Nightly refit of interviewer bias and scale from all feedback"""
+    return CalibrationService().run()
+
+
+@shared_task
+def refresh_interviewer_summaries(interviewer_id, exclude=None):
+    """Bring the calibrated scores of an interviewer's applications in line with their new baseline"""
+    return len(FeedbackAggregationService().refresh_interviewer(interviewer_id, exclude=exclude))
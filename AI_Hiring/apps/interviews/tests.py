@@ -1,3 +1,290 @@
-from django.test import TestCase
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock, skipUnless
+import numpy as np
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from apps.applications.models import Application
+from apps.jobs.models import Job
+from apps.users.models import User
+from utils.postgres import is_postgres
+from .calibration import fit_calibration
+from .models import FeedbackSummary, Interview, InterviewAssignment, InterviewFeedback
+from .services import IntervalIndex, SchedulingService
 
-# Create your tests here.
+
+def at(day, hour, minute=0, second=0):
+    # January 2030: the 7th is a Monday, the 12th a Saturday
+    return datetime(2030, 1, day, hour, minute, second, tzinfo=dt_timezone.utc)
+
+
+class FitCalibrationTests(SimpleTestCase):
+    def setUp(self):
+        # Two interviewers rate the same ten applications around the same mean, one on a doubled scale
+        quality = np.linspace(1, 5, 10)
+        self.applications = np.tile(np.arange(10), 2)
+        self.interviewers = np.repeat([0, 1], 10)
+        self.ratings = np.concatenate([quality, 3 + 2 * (quality - 3)])
+
+    def test_scale_difference_is_not_fitted_as_bias(self):
+        result = fit_calibration(self.interviewers, self.applications, self.ratings)
+
+        # Neither interviewer is offset at the average rating, whatever the fitted scales
+        offset_at_mean = result['bias'] + (result['scale'] - 1) * self.ratings.mean()
+        np.testing.assert_allclose(offset_at_mean, 0, atol=1e-6)
+        self.assertGreater(result['scale'][1], result['scale'][0])
+
+    def test_zero_iterations_returns_identity(self):
+        result = fit_calibration(self.interviewers, self.applications, self.ratings, iterations=0)
+
+        self.assertEqual(result['iterations'], 0)
+        np.testing.assert_array_equal(result['bias'], [0, 0])
+        np.testing.assert_array_equal(result['scale'], [1, 1])
+        np.testing.assert_allclose(result['quality'], self.ratings.reshape(2, 10).mean(axis=0))
+
+
+class IntervalIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = IntervalIndex({'a': [(at(7, 9), at(7, 10)), (at(7, 9, 30), at(7, 11)), (at(7, 13), at(7, 14))]})
+
+    def test_is_free(self):
+        self.assertFalse(self.index.is_free('a', at(7, 10, 45), at(7, 11, 15)))
+        self.assertFalse(self.index.is_free('a', at(7, 12), at(7, 15)))
+        # Periods are half-open, so back-to-back bookings don't overlap
+        self.assertTrue(self.index.is_free('a', at(7, 11), at(7, 12)))
+        self.assertTrue(self.index.is_free('a', at(7, 8), at(7, 9)))
+        self.assertTrue(self.index.is_free('b', at(7, 9), at(7, 10)))
+
+    def test_next_free(self):
+        # Overlapping bookings are merged, so 9:15 is busy until 11:00
+        self.assertEqual(self.index.next_free('a', at(7, 9, 15)), at(7, 11))
+        self.assertEqual(self.index.next_free('a', at(7, 12)), at(7, 12))
+        self.assertEqual(self.index.next_free('b', at(7, 9)), at(7, 9))
+
+
+class SchedulingServiceTests(SimpleTestCase):
+    def setUp(self):
+        self.service = SchedulingService()
+
+    def test_align_rounds_up_to_slot_boundary(self):
+        self.assertEqual(self.service._align(at(7, 9, 1)), at(7, 9, 15))
+        self.assertEqual(self.service._align(at(7, 9, 15, 30)), at(7, 9, 15))
+        self.assertEqual(self.service._align(at(7, 9, 50)), at(7, 10))
+
+    def test_within_workday(self):
+        self.assertTrue(self.service._within_workday(at(7, 17), at(7, 18)))
+        self.assertFalse(self.service._within_workday(at(7, 17, 30), at(7, 18, 30)))
+        self.assertFalse(self.service._within_workday(at(7, 8, 45), at(7, 9, 45)))
+        self.assertFalse(self.service._within_workday(at(12, 10), at(12, 11)))
+
+    def find_slots(self, busy, **kwargs):
+        with mock.patch.object(SchedulingService, 'build_index', return_value=IntervalIndex(busy)):
+            return self.service.find_slots(['a', 'b'], 60, kwargs.pop('start', at(7, 9)), at(7, 18), **kwargs)
+
+    def test_find_slots_skips_ahead_past_busy_interviewers(self):
+        slots = self.find_slots({'a': [(at(7, 9), at(7, 12))], 'b': [(at(7, 10), at(7, 11))]}, limit=2)
+
+        self.assertEqual([(slot['start'], slot['end']) for slot in slots], [(at(7, 12), at(7, 13)), (at(7, 13), at(7, 14))])
+        self.assertEqual(slots[0]['interviewers'], ['a', 'b'])
+
+    def test_find_slots_with_partial_panel(self):
+        slots = self.find_slots({'a': [(at(7, 9), at(7, 12))]}, panel_size=1, limit=1)
+
+        self.assertEqual(slots, [{'start': at(7, 9), 'end': at(7, 10), 'interviewers': ['b']}])
+
+    def test_find_slots_moves_to_next_workday(self):
+        slots = self.find_slots({}, start=at(4, 17, 30), limit=1)
+
+        # Friday 17:30 leaves no full hour, so the first slot is Monday morning
+        self.assertEqual(slots[0]['start'], at(7, 9))
+
+
+class InterviewApiTestCase(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create(username='recruiter', email='recruiter@example.com', role='recruiter')
+        self.interviewer = User.objects.create(username='interviewer', email='interviewer@example.com', role='interviewer')
+        candidate = User.objects.create(username='candidate', email='candidate@example.com', role='candidate')
+        job = Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python'],
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+        self.application = Application.objects.create(job=job, candidate=candidate, status='interview')
+        self.client = APIClient()
+        self.client.force_authenticate(self.recruiter)
+
+
+class InterviewBookingTests(InterviewApiTestCase):
+
+    def book(self, scheduled_at):
+        return self.client.post('/api/interviews/', {
+            'application': str(self.application.id),
+            'type': 'technical',
+            'scheduled_at': scheduled_at.isoformat(),
+            'duration_minutes': 60,
+            'interviewers': [str(self.interviewer.id)],
+        }, format='json')
+
+    def test_create_interview(self):
+        response = self.book(at(7, 10))
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(Interview.objects.get().assignments.get().interviewer, self.interviewer)
+
+    @skipUnless(is_postgres(), 'Booked periods are range columns, which only PostgreSQL has')
+    def test_double_booking_is_rejected(self):
+        self.assertEqual(self.book(at(7, 10)).status_code, 201)
+
+        response = self.book(at(7, 10, 30))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('interviewers', response.json())
+        self.assertEqual(self.book(at(7, 11)).status_code, 201)
+
+    @skipUnless(is_postgres(), 'Booked periods are range columns, which only PostgreSQL has')
+    def test_exclusion_constraint_blocks_overlapping_periods(self):
+        self.assertEqual(self.book(at(7, 10)).status_code, 201)
+        interview = Interview.objects.create(
+            application=self.application, type='final', scheduled_at=at(7, 10, 30), duration_minutes=60,
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            InterviewAssignment.objects.create(interview=interview, interviewer=self.interviewer, period=interview.booked_period)
+
+
+class BulkScheduleTests(InterviewApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.second_interviewer = User.objects.create(username='second', email='second@example.com', role='interviewer')
+
+    def item(self, scheduled_at, *interviewers):
+        return {
+            'application': str(self.application.id),
+            'type': 'technical',
+            'scheduled_at': scheduled_at.isoformat(),
+            'duration_minutes': 60,
+            'interviewers': [str(user.id) for user in interviewers],
+        }
+
+    def bulk(self, *items):
+        return self.client.post('/api/interviews/bulk/', {'interviews': list(items)}, format='json')
+
+    @mock.patch('apps.interviews.views.EmailService.send_interview_invitations')
+    def test_creates_batch_and_sends_one_invitation_task(self, send_invitations):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.bulk(
+                self.item(at(7, 10), self.interviewer),
+                self.item(at(7, 10), self.second_interviewer),
+                self.item(at(7, 11), self.interviewer, self.second_interviewer),
+            )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(Interview.objects.count(), 3)
+        self.assertEqual(InterviewAssignment.objects.count(), 4)
+        send_invitations.delay.assert_called_once()
+        self.assertCountEqual(send_invitations.delay.call_args.args[0], [str(pk) for pk in Interview.objects.values_list('id', flat=True)])
+
+    @mock.patch('apps.interviews.views.EmailService.send_interview_invitations')
+    def test_overlap_within_batch_is_rejected(self, send_invitations):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.bulk(
+                self.item(at(7, 10), self.interviewer),
+                self.item(at(7, 10, 30), self.interviewer, self.second_interviewer),
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['conflicts'], [{'index': '1', 'interviewer': str(self.interviewer.id)}])
+        self.assertFalse(Interview.objects.exists())
+        send_invitations.delay.assert_not_called()
+
+    @mock.patch('apps.interviews.views.EmailService.send_interview_invitations')
+    def test_reschedule_keeps_panel_and_application(self, send_invitations):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bulk(self.item(at(7, 10), self.interviewer))
+        interview = Interview.objects.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.bulk({'id': str(interview.id), 'scheduled_at': at(8, 14).isoformat()})
+
+        self.assertEqual(response.status_code, 201, response.content)
+        interview.refresh_from_db()
+        self.assertEqual(interview.scheduled_at, at(8, 14))
+        self.assertEqual(list(interview.assignments.values_list('interviewer', flat=True)), [self.interviewer.id])
+
+    def test_reschedule_cannot_change_application(self):
+        response = self.bulk({
+            'id': str(Interview.objects.create(application=self.application, type='technical', scheduled_at=at(7, 10)).id),
+            'application': str(self.application.id),
+            'scheduled_at': at(8, 14).isoformat(),
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('application', response.json()['interviews'][0])
+
+
+class FeedbackSummaryTests(TestCase):
+    def setUp(self):
+        self.job = Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python'],
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+        self.alice = User.objects.create(username='alice', email='alice@example.com', role='interviewer')
+        self.bob = User.objects.create(username='bob', email='bob@example.com', role='interviewer')
+
+    def interview(self):
+        candidate = User.objects.create(username=f'candidate{Application.objects.count()}', role='candidate')
+        application = Application.objects.create(job=self.job, candidate=candidate, status='interview')
+        return Interview.objects.create(application=application, type='technical', scheduled_at=at(7, 10))
+
+    def rate(self, interview, interviewer, overall, recommendation='yes'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return InterviewFeedback.objects.create(
+                interview=interview, interviewer=interviewer, overall_rating=overall,
+                technical_skills=overall, recommendation=recommendation,
+            )
+
+    def summary(self, interview):
+        return FeedbackSummary.objects.get(application_id=interview.application_id)
+
+    def test_summary_statistics(self):
+        interview = self.interview()
+        self.rate(interview, self.alice, 2)
+        self.rate(interview, self.bob, 4)
+
+        summary = self.summary(interview)
+        self.assertEqual(summary.feedback_count, 2)
+        self.assertEqual(summary.overall_mean, 3.0)
+        self.assertEqual(summary.overall_variance, 1.0)
+        self.assertEqual(summary.dimension_means, {'technical_skills': 3.0, 'overall_rating': 3.0})
+        self.assertEqual(summary.recommendation_counts, {'yes': 2})
+        # Neither interviewer has any spread in their history yet
+        self.assertEqual(summary.calibrated_scores, {})
+        self.assertIsNone(summary.calibrated_overall)
+
+    def test_signals_follow_saves_and_deletes(self):
+        interview = self.interview()
+        feedback = self.rate(interview, self.alice, 2, recommendation='no')
+
+        feedback.overall_rating = 5
+        feedback.recommendation = 'strong_yes'
+        with self.captureOnCommitCallbacks(execute=True):
+            feedback.save()
+        summary = self.summary(interview)
+        self.assertEqual(summary.overall_mean, 5.0)
+        self.assertEqual(summary.recommendation_counts, {'strong_yes': 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            feedback.delete()
+        self.assertFalse(FeedbackSummary.objects.exists())
+
+    def test_new_rating_recalibrates_interviewers_other_applications(self):
+        first, second, third = self.interview(), self.interview(), self.interview()
+        self.rate(first, self.alice, 2)
+        self.rate(second, self.alice, 4)
+        self.assertEqual(self.summary(first).calibrated_overall, -1.0)
+
+        self.rate(third, self.alice, 9)
+
+        # Alice's history is now 2, 4 and 9: mean 5, population deviation sqrt(26 / 3)
+        self.assertEqual(self.summary(first).calibrated_overall, round(-3 / (26 / 3) ** 0.5, 3))
+        self.assertEqual(self.summary(second).calibrated_overall, round(-1 / (26 / 3) ** 0.5, 3))
@@ -1,10 +1,70 @@
 # apps/interviews/views.py
-from rest_framework import viewsets
+from django.db import transaction
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from .models import Interview
-from .serializers import InterviewSerializer
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from apps.notifications.services import EmailService
+from utils.permissions import IsInterviewer, IsRecruiter
+from .models import Interview, InterviewFeedback
+from .serializers import BulkInterviewSerializer, InterviewFeedbackSerializer, InterviewSerializer, SlotSearchSerializer
+from .services import SchedulingConflict, SchedulingService
 
 class InterviewViewSet(viewsets.ModelViewSet):
     queryset = Interview.objects.all()
     serializer_class = InterviewSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
+
+    @action(detail=False, methods=['post'], url_path='find-slots', permission_classes=[IsRecruiter])
+    def find_slots(self, request):
+        """Find slots where the requested panel is free"""
+        serializer = SlotSearchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        slots = SchedulingService().find_slots(
+            [user.pk for user in data['interviewers']],
+            data['duration_minutes'],
+            data['start'],
+            data['end'],
+            panel_size=data.get('panel_size'),
+            limit=data['limit'],
+        )
+        return Response({'count': len(slots), 'slots': slots})
+
+    @action(detail=False, methods=['post'], permission_classes=[IsRecruiter])
+    def bulk(self, request):
+        """Create or reschedule a batch of interviews and send one batch of invitations"""
+        serializer = BulkInterviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            with transaction.atomic():
+                interviews = SchedulingService().bulk_schedule(serializer.validated_data['interviews'])
+                interview_ids = [str(interview.id) for interview in interviews]
+                transaction.on_commit(lambda: EmailService.send_interview_invitations.delay(interview_ids))
+        except SchedulingConflict as e:
+            raise ValidationError({'conflicts': e.conflicts or ['An interviewer was booked for one of these times in the meantime']})
+
+        interviews = Interview.objects.filter(id__in=interview_ids).prefetch_related('interviewers')
+        return Response(
+            {'count': len(interview_ids), 'interviews': InterviewSerializer(interviews, many=True).data},
+            status=status.HTTP_201_CREATED
+        )
+
+    @action(detail=True, methods=['post'], permission_classes=[IsInterviewer])
+    def feedback(self, request, pk=None):
+        """Submit or update the requesting interviewer's feedback"""
+        interview = self.get_object()
+        if not interview.assignments.filter(interviewer_id=request.user.pk).exists():
+            return Response(
+                {'error': 'Only interviewers on the panel can leave feedback'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        existing = InterviewFeedback.objects.filter(interview=interview, interviewer_id=request.user.pk).first()
+        serializer = InterviewFeedbackSerializer(existing, data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(interview=interview, interviewer_id=request.user.pk)
+        return Response(serializer.data, status=status.HTTP_200_OK if existing else status.HTTP_201_CREATED)
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.jobs'  # Fixed: Full path
\ No newline at end of file
+    name = 'apps.jobs'  # Fixed: Full path
+    
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,22 @@
+# apps/jobs/async_views.py
+from utils.async_views import async_api_view, apaginate, api_response, not_found
+from .models import Job
+from .serializers import JobSerializer
+
+
+@async_api_view
+async def job_list(request, user):
+    """Async job board listing for ASGI deployments"""
+    queryset = Job.objects.with_listing_data().order_by('-created_at')
+    return await apaginate(request, queryset, lambda jobs: JobSerializer(jobs, many=True).data)
+
+
+@async_api_view
+async def job_detail(request, user, pk):
+    """Async job detail for ASGI deployments"""
+    try:
+        job = await Job.objects.with_listing_data().aget(pk=pk)
+    except Job.DoesNotExist:
+        return not_found()
+
+    return api_response(JobSerializer(job).data)
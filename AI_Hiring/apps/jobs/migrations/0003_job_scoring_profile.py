@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ats', '0001_initial'),
+        ('jobs', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='scoring_profile',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='ats.scoringprofile'),
+        ),
+    ]
@@ -2,10 +2,15 @@
 
 from django.db import models
 from django.contrib.auth import get_user_model
+from apps.ats.scoring import COMPONENT_JOB_FIELDS
+import copy
 import uuid
 
 User = get_user_model()
 
+# Job fields read by ATS scoring; editing them schedules a targeted rescore
+SCORING_INPUT_FIELDS = sorted({field for fields in COMPONENT_JOB_FIELDS.values() for field in fields})
+
 class Department(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=100, unique=True)
@@ -18,6 +23,11 @@ class Department(models.Model):
     class Meta:
         db_table = 'departments'
 
+class JobQuerySet(models.QuerySet):
+    def with_listing_data(self):
+        """Everything JobSerializer needs, loaded in a single query"""
+        return self.select_related('department').annotate(applications_total=models.Count('applications'))
+
 class Job(models.Model):
     STATUS_CHOICES = [
         ('draft', 'Draft'),
@@ -71,11 +81,35 @@ class Job(models.Model):
     # ATS Configuration
     auto_reject_threshold = models.IntegerField(default=40)
     auto_shortlist_threshold = models.IntegerField(default=70)
+    scoring_profile = models.ForeignKey('ats.ScoringProfile', on_delete=models.SET_NULL, null=True, blank=True, related_name='jobs')
     screening_questions = models.JSONField(default=list)
     
+    objects = JobQuerySet.as_manager()
+    
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Copies, so in-place edits of the JSON list fields still compare unequal on save
+        instance._loaded_scoring_inputs = {
+            field: copy.deepcopy(getattr(instance, field)) for field in SCORING_INPUT_FIELDS if field in field_names
+        }
+        return instance
+    
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_scoring_inputs', {})
+        # Read by the post_save handler that schedules rescoring
+        update_fields = kwargs.get('update_fields')
+        self.changed_scoring_inputs = [
+            field for field, value in loaded.items()
+            if getattr(self, field) != value and (update_fields is None or field in update_fields)
+        ]
+        super().save(*args, **kwargs)
+        for field in self.changed_scoring_inputs:
+            loaded[field] = copy.deepcopy(getattr(self, field))
+    
     class Meta:
         db_table = 'jobs'
         indexes = [
@@ -1,5 +1,7 @@
 # apps/jobs/serializers.py
 from rest_framework import serializers
+from apps.ats.models import ScoringProfile
+from apps.ats.serializers import ScoringProfileSerializer
 from .models import Job, Department
 
 class DepartmentSerializer(serializers.ModelSerializer):
@@ -18,7 +20,7 @@ class JobSerializer(serializers.ModelSerializer):
             'requirements', 'responsibilities', 'skills_required', 'skills_preferred',
             'job_type', 'experience_level', 'experience_min_years', 'experience_max_years',
             'salary_min', 'salary_max', 'location', 'is_remote', 'openings',
-            'status', 'created_at', 'deadline', 'applications_count'
+            'status', 'created_at', 'deadline', 'applications_count', 'scoring_profile'
         ]
         read_only_fields = ['id', 'created_at', 'applications_count']
     
@@ -26,4 +28,24 @@ class JobSerializer(serializers.ModelSerializer):
         return obj.department.name if obj.department else None
     
     def get_applications_count(self, obj):
+        # Querysets annotated with applications_total avoid a COUNT per job
+        if hasattr(obj, 'applications_total'):
+            return obj.applications_total
         return obj.applications.count()
+
+
+class ThresholdSimulationSerializer(serializers.Serializer):
+    reject_threshold = serializers.IntegerField(min_value=0, max_value=100)
+    shortlist_threshold = serializers.IntegerField(min_value=0, max_value=100)
+    weights = serializers.DictField(child=serializers.FloatField(min_value=0), required=False)
+    scoring_profile = serializers.PrimaryKeyRelatedField(queryset=ScoringProfile.objects.all(), required=False)
+    
+    def validate_weights(self, value):
+        return ScoringProfileSerializer().validate_weights(value)
+    
+    def validate(self, attrs):
+        if attrs['reject_threshold'] > attrs['shortlist_threshold']:
+            raise serializers.ValidationError("reject_threshold cannot exceed shortlist_threshold")
+        if 'weights' in attrs and 'scoring_profile' in attrs:
+            raise serializers.ValidationError("Provide either weights or scoring_profile, not both")
+        return attrs
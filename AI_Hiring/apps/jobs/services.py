@@ -0,0 +1,162 @@
+# apps/jobs/services.py
+from collections import defaultdict
+from typing import Dict, Mapping, Optional
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, Exists, F, FloatField, OuterRef, Q, Value
+from django.db.models.functions import Floor, Round
+from apps.applications import feature_store
+from apps.applications.models import Application, ApplicationStatusHistory
+from apps.ats.models import ScoringProfile
+from apps.ats.scoring import DEFAULT_WEIGHTS, SCORE_COMPONENTS
+from .models import Job
+
+AUTO_STATUSES = ('rejected', 'under_review', 'shortlisted')
+THRESHOLD_CHANGE_REASON = 'ATS thresholds changed'
+
+SUB_SCORE_FIELDS = {
+    'skill_match': 'skill_match_score',
+    'experience_match': 'experience_match_score',
+    'education_match': 'education_match_score',
+    'keyword_match': 'keyword_match_score',
+}
+
+
+class ThresholdSimulationService:
+    """What-if analysis for a job's auto-reject/shortlist thresholds and scoring weights"""
+
+    def __init__(self, job: Job):
+        self.job = job
+
+    def auto_decided(self):
+        """Applications whose status still reflects the automatic ATS decision.
+
+        Anything a recruiter has moved by hand has status history and is left alone.
+        """
+        manual_changes = ApplicationStatusHistory.objects.filter(application=OuterRef('pk')).exclude(reason=THRESHOLD_CHANGE_REASON)
+        return (
+            Application.objects.filter(job=self.job, ats_score__isnull=False, status__in=AUTO_STATUSES)
+            .exclude(Q(status='rejected') & ~Q(rejection_reason=Application.AUTO_REJECTION_REASON))
+            .exclude(Exists(manual_changes))
+        )
+
+    def score_expression(self, weights: Optional[Mapping[str, float]]):
+        """Stored total, or the total recomputed from stored sub-scores under new weights"""
+        if weights is None:
+            return F('ats_score')
+        weights = {**DEFAULT_WEIGHTS, **weights}
+        total_weight = sum(weights[component] for component in SCORE_COMPONENTS)
+        weighted = sum(
+            F(SUB_SCORE_FIELDS[component]) * Value(weights[component] / total_weight)
+            for component in SCORE_COMPONENTS
+        )
+        return Round(weighted, 2, output_field=FloatField())
+
+    def histogram(self, weights: Optional[Mapping[str, float]] = None) -> np.ndarray:
+        """Counts of auto-decided applications per (integer score bucket, current status)"""
+        rows = (
+            self.auto_decided()
+            .annotate(bucket=Floor(self.score_expression(weights)))
+            .values('bucket', 'status')
+            .annotate(total=Count('id'))
+        )
+        # Thresholds are integers, so score < threshold exactly when floor(score) < threshold
+        counts = np.zeros((len(AUTO_STATUSES), 101), dtype=np.int64)
+        for row in rows:
+            if row['bucket'] is None:
+                continue
+            counts[AUTO_STATUSES.index(row['status']), int(min(max(row['bucket'], 0), 100))] += row['total']
+        return counts
+
+    def simulate(self, reject_threshold: int, shortlist_threshold: int,
+                 weights: Optional[Mapping[str, float]] = None) -> Dict[str, object]:
+        counts = self.histogram(weights)
+        # Prefix sums give the number of applications below any threshold in O(1)
+        below = np.concatenate([np.zeros((len(AUTO_STATUSES), 1), dtype=np.int64), counts.cumsum(axis=1)], axis=1)
+        reject_cut = min(max(reject_threshold, 0), 101)
+        shortlist_cut = min(max(shortlist_threshold, reject_cut), 101)
+
+        transitions = []
+        proposed = defaultdict(int)
+        for i, current in enumerate(AUTO_STATUSES):
+            moved = {
+                'rejected': int(below[i, reject_cut]),
+                'under_review': int(below[i, shortlist_cut] - below[i, reject_cut]),
+                'shortlisted': int(below[i, -1] - below[i, shortlist_cut]),
+            }
+            for target, total in moved.items():
+                proposed[target] += total
+                if total and target != current:
+                    transitions.append({'from': current, 'to': target, 'count': total})
+
+        totals = counts.sum(axis=0)
+        return {
+            'eligible': int(counts.sum()),
+            'current': {status: int(counts[i].sum()) for i, status in enumerate(AUTO_STATUSES)},
+            'proposed': {status: proposed[status] for status in AUTO_STATUSES},
+            'transitions': transitions,
+            'histogram': [{'score': score, 'count': int(total)} for score, total in enumerate(totals) if total],
+        }
+
+    @staticmethod
+    def own_profile(job: Job) -> Optional[ScoringProfile]:
+        """The job's profile when no department or other job relies on it, so it can be edited in place"""
+        profile = job.scoring_profile
+        if profile is None or profile.department_id is not None or profile.jobs.exclude(pk=job.pk).exists():
+            return None
+        return profile
+
+    @transaction.atomic
+    def apply(self, reject_threshold: int, shortlist_threshold: int, changed_by_id,
+              weights: Optional[Mapping[str, float]] = None,
+              scoring_profile: Optional[ScoringProfile] = None) -> Dict[str, int]:
+        """Persist the thresholds (and profile) and move affected applications in set-based updates"""
+        job = Job.objects.select_for_update().get(pk=self.job.pk)
+
+        if weights is not None and scoring_profile is None:
+            scoring_profile = self.own_profile(job)
+            if scoring_profile is None:
+                # Job-only: a department profile would become the fallback for the department's other jobs
+                scoring_profile = ScoringProfile(name=f'{job.title} profile')
+            scoring_profile.weights = dict(weights)
+            scoring_profile.save()
+        if scoring_profile is not None:
+            weights = scoring_profile.weights
+            job.scoring_profile = scoring_profile
+            # Every scored application gets the new total, whatever its status
+            Application.objects.filter(job=job, ats_score__isnull=False).update(ats_score=self.score_expression(weights))
+
+        job.auto_reject_threshold = reject_threshold
+        job.auto_shortlist_threshold = shortlist_threshold
+        job.save(update_fields=['auto_reject_threshold', 'auto_shortlist_threshold', 'scoring_profile', 'updated_at'])
+        self.job = job
+
+        targets = {
+            'rejected': Q(ats_score__lt=reject_threshold),
+            'under_review': Q(ats_score__gte=reject_threshold, ats_score__lt=shortlist_threshold),
+            'shortlisted': Q(ats_score__gte=shortlist_threshold),
+        }
+        reasons = {'rejected': Application.AUTO_REJECTION_REASON}
+
+        moved = {}
+        for target, condition in targets.items():
+            affected = self.auto_decided().filter(condition).exclude(status=target)
+            rows = list(affected.select_for_update().values_list('id', 'status'))
+            if not rows:
+                continue
+            ApplicationStatusHistory.objects.bulk_create([
+                ApplicationStatusHistory(
+                    application_id=application_id,
+                    from_status=status,
+                    to_status=target,
+                    changed_by_id=changed_by_id,
+                    reason=THRESHOLD_CHANGE_REASON,
+                )
+                for application_id, status in rows
+            ])
+            moved[target] = Application.objects.filter(id__in=[application_id for application_id, _ in rows]).update(
+                status=target, rejection_reason=reasons.get(target, ''),
+            )
+        # Set-based updates skip the signals that keep the feature store fresh
+        feature_store.invalidate_on_commit([job.pk])
+        return moved
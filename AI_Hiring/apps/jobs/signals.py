@@ -0,0 +1,17 @@
+# apps/jobs/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from apps.ats.scoring import affected_components
+from apps.ats.tasks import rescore_job
+from .models import Job
+
+
+@receiver(post_save, sender=Job)
+def schedule_rescore(sender, instance, created, **kwargs):
+    if created:
+        return
+    components = affected_components(getattr(instance, 'changed_scoring_inputs', ()))
+    if components:
+        job_id = str(instance.pk)
+        transaction.on_commit(lambda: rescore_job.delay(job_id, list(components)))
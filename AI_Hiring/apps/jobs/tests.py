@@ -1,3 +1,125 @@
 from django.test import TestCase
+from apps.applications.models import Application, ApplicationStatusHistory
+from apps.ats.models import ScoringProfile
+from apps.ats.scoring import resolve_profile
+from apps.users.models import User
+from .models import Department, Job
+from .services import THRESHOLD_CHANGE_REASON, ThresholdSimulationService
 
-# Create your tests here.
+
+class ThresholdApplyTests(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(name='Engineering')
+        self.recruiter = User.objects.create(username='recruiter', email='recruiter@example.com', role='recruiter')
+
+    def create_job(self, title):
+        return Job.objects.create(
+            title=title, description='Python services', skills_required=['Python'], department=self.department,
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+
+    def test_weights_profile_stays_with_its_job(self):
+        job = self.create_job('Backend Engineer')
+        other = self.create_job('Data Engineer')
+
+        ThresholdSimulationService(job).apply(40, 70, self.recruiter.pk, weights={'skill_match': 0.6})
+
+        job.refresh_from_db()
+        self.assertEqual(resolve_profile(job).weights, {'skill_match': 0.6})
+        self.assertIsNone(resolve_profile(other))
+
+    def test_repeated_weights_update_the_jobs_own_profile(self):
+        job = self.create_job('Backend Engineer')
+        ThresholdSimulationService(job).apply(40, 70, self.recruiter.pk, weights={'skill_match': 0.6})
+        profile = Job.objects.get(pk=job.pk).scoring_profile
+
+        ThresholdSimulationService(job).apply(40, 70, self.recruiter.pk, weights={'skill_match': 0.8})
+
+        self.assertEqual(ScoringProfile.objects.get().pk, profile.pk)
+        self.assertEqual(resolve_profile(Job.objects.get(pk=job.pk)).weights, {'skill_match': 0.8})
+
+    def test_shared_profile_is_not_edited(self):
+        shared = ScoringProfile.objects.create(name='Shared', weights={'skill_match': 0.5})
+        job = self.create_job('Backend Engineer')
+        other = self.create_job('Data Engineer')
+        Job.objects.filter(pk__in=[job.pk, other.pk]).update(scoring_profile=shared)
+
+        ThresholdSimulationService(Job.objects.get(pk=job.pk)).apply(40, 70, self.recruiter.pk, weights={'skill_match': 0.9})
+
+        shared.refresh_from_db()
+        self.assertEqual(shared.weights, {'skill_match': 0.5})
+        self.assertEqual(resolve_profile(Job.objects.get(pk=job.pk)).weights, {'skill_match': 0.9})
+        self.assertEqual(resolve_profile(Job.objects.get(pk=other.pk)).pk, shared.pk)
+
+
+class ThresholdSimulationTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create(username='recruiter', email='recruiter@example.com', role='recruiter')
+        self.job = Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python'],
+            job_type='full_time', experience_level='mid', location='Remote',
+            auto_reject_threshold=40, auto_shortlist_threshold=70,
+        )
+        self.rejected = self.create_application(30, 'rejected', Application.AUTO_REJECTION_REASON)
+        self.review = self.create_application(55, 'under_review')
+        self.shortlisted = self.create_application(80, 'shortlisted')
+        # Rejected by a recruiter, so the thresholds no longer decide it
+        self.manual = self.create_application(50, 'rejected', 'Not a culture fit')
+
+    def create_application(self, score, status, rejection_reason=''):
+        candidate = User.objects.create(username=f'candidate{score}', email=f'candidate{score}@example.com', role='candidate')
+        return Application.objects.create(
+            job=self.job, candidate=candidate, status=status, rejection_reason=rejection_reason, ats_score=score,
+            skill_match_score=score, experience_match_score=score, education_match_score=score, keyword_match_score=score,
+        )
+
+    def test_simulate_counts_transitions(self):
+        result = ThresholdSimulationService(self.job).simulate(60, 90)
+
+        self.assertEqual(result['eligible'], 3)
+        self.assertEqual(result['current'], {'rejected': 1, 'under_review': 1, 'shortlisted': 1})
+        self.assertEqual(result['proposed'], {'rejected': 2, 'under_review': 1, 'shortlisted': 0})
+        self.assertEqual(result['transitions'], [
+            {'from': 'under_review', 'to': 'rejected', 'count': 1},
+            {'from': 'shortlisted', 'to': 'under_review', 'count': 1},
+        ])
+        self.assertEqual(result['histogram'], [{'score': 30, 'count': 1}, {'score': 55, 'count': 1}, {'score': 80, 'count': 1}])
+
+    def test_apply_moves_applications_with_history(self):
+        moved = ThresholdSimulationService(self.job).apply(60, 90, self.recruiter.pk)
+
+        self.assertEqual(moved, {'rejected': 1, 'under_review': 1})
+        statuses = dict(Application.objects.values_list('id', 'status'))
+        self.assertEqual(statuses[self.review.id], 'rejected')
+        self.assertEqual(statuses[self.shortlisted.id], 'under_review')
+        self.assertEqual(statuses[self.manual.id], 'rejected')
+        self.assertEqual(Application.objects.get(pk=self.review.pk).rejection_reason, Application.AUTO_REJECTION_REASON)
+        self.assertCountEqual(
+            ApplicationStatusHistory.objects.values_list('application_id', 'from_status', 'to_status', 'changed_by', 'reason'),
+            [
+                (self.review.id, 'under_review', 'rejected', self.recruiter.pk, THRESHOLD_CHANGE_REASON),
+                (self.shortlisted.id, 'shortlisted', 'under_review', self.recruiter.pk, THRESHOLD_CHANGE_REASON),
+            ],
+        )
+
+        # Threshold moves don't count as manual decisions, so moving back restores the original statuses
+        ThresholdSimulationService(self.job).apply(40, 70, self.recruiter.pk)
+        self.assertEqual(Application.objects.get(pk=self.shortlisted.pk).status, 'shortlisted')
+        self.assertEqual(Application.objects.get(pk=self.review.pk).rejection_reason, '')
+
+
+class ScoringInputChangeTests(TestCase):
+    def test_in_place_list_edit_is_detected(self):
+        Job.objects.create(
+            title='Backend Engineer', description='Python services', skills_required=['Python'],
+            job_type='full_time', experience_level='mid', location='Remote',
+        )
+        job = Job.objects.get()
+
+        job.skills_required.append('Django')
+        job.save()
+        self.assertEqual(job.changed_scoring_inputs, ['skills_required'])
+
+        # The saved value is the new baseline
+        job.save()
+        self.assertEqual(job.changed_scoring_inputs, [])
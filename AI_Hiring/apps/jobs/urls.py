@@ -2,11 +2,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import JobViewSet, DepartmentViewSet
+from .async_views import job_list, job_detail
 
 router = DefaultRouter()
 router.register(r'jobs', JobViewSet)
 router.register(r'departments', DepartmentViewSet)
 
 urlpatterns = [
+    path('async/jobs/', job_list, name='job-list-async'),
+    path('async/jobs/<uuid:pk>/', job_detail, name='job-detail-async'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,15 +1,49 @@
 # apps/jobs/views.py
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from utils.db_routing import ReplicaReadMixin
+from utils.permissions import IsRecruiter
 from .models import Job, Department
-from .serializers import JobSerializer, DepartmentSerializer
+from .serializers import JobSerializer, DepartmentSerializer, ThresholdSimulationSerializer
+from .services import ThresholdSimulationService
 
-class JobViewSet(viewsets.ModelViewSet):
-    queryset = Job.objects.all()
+class JobViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
+    queryset = Job.objects.with_listing_data()
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
+    
+    @action(detail=True, methods=['post'], permission_classes=[IsRecruiter])
+    def simulate_thresholds(self, request, pk=None):
+        """Preview how proposed thresholds or weights would redistribute existing applications"""
+        job = self.get_object()
+        serializer = ThresholdSimulationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        weights = data['scoring_profile'].weights if 'scoring_profile' in data else data.get('weights')
+        result = ThresholdSimulationService(job).simulate(data['reject_threshold'], data['shortlist_threshold'], weights)
+        return Response(result)
+    
+    @action(detail=True, methods=['post'], permission_classes=[IsRecruiter])
+    def apply_thresholds(self, request, pk=None):
+        """Save thresholds and weights and move automatically decided applications accordingly"""
+        job = self.get_object()
+        serializer = ThresholdSimulationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        moved = ThresholdSimulationService(job).apply(
+            data['reject_threshold'],
+            data['shortlist_threshold'],
+            changed_by_id=request.user.pk,
+            weights=data.get('weights'),
+            scoring_profile=data.get('scoring_profile'),
+        )
+        return Response({'moved': moved, 'total': sum(moved.values())})
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
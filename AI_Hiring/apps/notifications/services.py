@@ -1,4 +1,4 @@
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import send_mail, get_connection, EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.conf import settings
@@ -7,6 +7,53 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def _interview_invitation_messages(interview):
+    """Build the candidate and interviewer invitation emails for an interview"""
+    interviewers = list(interview.interviewers.all())
+    context = {
+        'candidate_name': interview.application.candidate.get_full_name(),
+        'job_title': interview.application.job.title,
+        'interview_type': interview.get_type_display(),
+        'scheduled_at': interview.scheduled_at,
+        'duration': interview.duration_minutes,
+        'meeting_link': interview.meeting_link,
+        'location': interview.location,
+        'interviewers': [i.get_full_name() for i in interviewers]
+    }
+    
+    html_content = render_to_string('emails/interview_invitation.html', context)
+    text_content = strip_tags(html_content)
+    
+    # Candidate invitation
+    candidate_email = EmailMultiAlternatives(
+        subject=f'Interview Invitation - {interview.application.job.title}',
+        body=text_content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[interview.application.candidate.email]
+    )
+    candidate_email.attach_alternative(html_content, "text/html")
+    messages = [candidate_email]
+    
+    # Interviewer notifications
+    for interviewer in interviewers:
+        interviewer_context = context.copy()
+        interviewer_context['is_interviewer'] = True
+        interviewer_context['interviewer_name'] = interviewer.get_full_name()
+        
+        html_content = render_to_string('emails/interview_invitation.html', interviewer_context)
+        text_content = strip_tags(html_content)
+        
+        interviewer_email = EmailMultiAlternatives(
+            subject=f'Interview Scheduled - {interview.application.candidate.get_full_name()}',
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[interviewer.email]
+        )
+        interviewer_email.attach_alternative(html_content, "text/html")
+        messages.append(interviewer_email)
+    
+    return messages
+
 class EmailService:
     """Service for sending email notifications"""
     
@@ -97,54 +144,38 @@ class EmailService:
         
         try:
             interview = Interview.objects.get(id=interview_id)
+            for message in _interview_invitation_messages(interview):
+                message.send()
             
-            context = {
-                'candidate_name': interview.application.candidate.get_full_name(),
-                'job_title': interview.application.job.title,
-                'interview_type': interview.get_type_display(),
-                'scheduled_at': interview.scheduled_at,
-                'duration': interview.duration_minutes,
-                'meeting_link': interview.meeting_link,
-                'location': interview.location,
-                'interviewers': [i.get_full_name() for i in interview.interviewers.all()]
-            }
+            logger.info(f"Interview invitation sent for interview {interview_id}")
+            return True
             
-            html_content = render_to_string('emails/interview_invitation.html', context)
-            text_content = strip_tags(html_content)
+        except Exception as e:
+            logger.error(f"Failed to send interview invitation: {str(e)}")
+            return False
+    
+    @staticmethod
+    @shared_task
+    def send_interview_invitations(interview_ids):
+        """Send invitations for a batch of interviews over a single mail connection"""
+        from apps.interviews.models import Interview
+        
+        try:
+            interviews = Interview.objects.filter(id__in=interview_ids).select_related(
+                'application__job', 'application__candidate'
+            ).prefetch_related('interviewers')
             
-            # Send to candidate
-            candidate_email = EmailMultiAlternatives(
-                subject=f'Interview Invitation - {interview.application.job.title}',
-                body=text_content,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[interview.application.candidate.email]
-            )
-            candidate_email.attach_alternative(html_content, "text/html")
-            candidate_email.send()
-            
-            # Send to interviewers
-            for interviewer in interview.interviewers.all():
-                interviewer_context = context.copy()
-                interviewer_context['is_interviewer'] = True
-                interviewer_context['interviewer_name'] = interviewer.get_full_name()
-                
-                html_content = render_to_string('emails/interview_invitation.html', interviewer_context)
-                text_content = strip_tags(html_content)
-                
-                interviewer_email = EmailMultiAlternatives(
-                    subject=f'Interview Scheduled - {interview.application.candidate.get_full_name()}',
-                    body=text_content,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    to=[interviewer.email]
-                )
-                interviewer_email.attach_alternative(html_content, "text/html")
-                interviewer_email.send()
+            messages = []
+            for interview in interviews:
+                messages.extend(_interview_invitation_messages(interview))
             
-            logger.info(f"Interview invitation sent for interview {interview_id}")
+            sent = get_connection().send_messages(messages)
+            
+            logger.info(f"Sent {sent} interview invitation emails for {len(interview_ids)} interviews")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send interview invitation: {str(e)}")
+            logger.error(f"Failed to send interview invitations: {str(e)}")
             return False
     
     @staticmethod
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.users'  # Fixed: Full path
\ No newline at end of file
+    name = 'apps.users'  # Fixed: Full path
+    
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:39
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import utils.postgres
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_token_version'),
+    ]
+
+    operations = [
+        utils.postgres.PostgresOnlyAddIndex(
+            model_name='candidateprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills'], name='candidate_skills_gin'),
+        ),
+    ]
@@ -1,7 +1,12 @@
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 import uuid
 
+# Changing any of these invalidates previously issued tokens
+TOKEN_CLAIM_FIELDS = ('password', 'role', 'is_active')
+
 class User(AbstractUser):
     USER_ROLE_CHOICES = [
         ('admin', 'Admin'),
@@ -17,11 +22,45 @@ class User(AbstractUser):
     date_of_birth = models.DateField(null=True, blank=True)
     profile_picture = models.ImageField(upload_to='profiles/', null=True, blank=True)
     is_email_verified = models.BooleanField(default=False)
+    token_version = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'users'
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_claims = {
+            field: getattr(instance, field) for field in TOKEN_CLAIM_FIELDS if field in field_names
+        }
+        return instance
+    
+    def check_password(self, raw_password):
+        """Django's check, flagging the hash upgrade it saves so that save keeps existing tokens valid"""
+        def setter(raw_password):
+            self.set_password(raw_password)
+            # Password hash upgraded: don't need to reset the password
+            self._password = None
+            self._rehashing = True
+            try:
+                self.save(update_fields=['password'])
+            finally:
+                self._rehashing = False
+
+        return check_password(raw_password, self.password, setter)
+    
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_claims', {})
+        # A rehash on login stores the same credential under a new hash, so tokens stay valid
+        rehash = getattr(self, '_rehashing', False)
+        if not rehash and any(getattr(self, field) != value for field, value in loaded.items()):
+            self.token_version += 1
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'token_version'}
+        super().save(*args, **kwargs)
+        self._loaded_claims = {field: getattr(self, field) for field in TOKEN_CLAIM_FIELDS}
 
 class CandidateProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='candidate_profile')
@@ -37,6 +76,10 @@ class CandidateProfile(models.Model):
     
     class Meta:
         db_table = 'candidate_profiles'
+        indexes = [
+            # Serves the skill containment (@>) and ?| / ?& operators of application filtering
+            GinIndex(fields=['skills'], name='candidate_skills_gin'),
+        ]
 
 class RecruiterProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='recruiter_profile')
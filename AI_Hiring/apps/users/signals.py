@@ -0,0 +1,25 @@
+# apps/users/signals.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.authentication.backends import token_version_cache_key
+from utils.permissions import role_cache_key
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_role(sender, instance, **kwargs):
+    cache.delete(role_cache_key(instance.pk))
+
+
+@receiver(post_save, sender=User)
+def publish_token_version(sender, instance, **kwargs):
+    # Revocation takes effect on the next request rather than after the cache expires
+    cache.set(token_version_cache_key(instance.pk), instance.token_version, settings.TOKEN_VERSION_CACHE_TIMEOUT)
+
+
+@receiver(post_delete, sender=User)
+def forget_token_version(sender, instance, **kwargs):
+    cache.delete(token_version_cache_key(instance.pk))
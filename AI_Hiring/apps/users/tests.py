@@ -1,3 +1,25 @@
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
+from .models import User
 
-# Create your tests here.
+
+class TokenVersionTests(TestCase):
+    def setUp(self):
+        # A short salt makes the hasher ask for an upgrade on the next successful check
+        User.objects.create(username='jane', password=make_password('secret', salt='short', hasher='md5'))
+        self.user = User.objects.get(username='jane')
+
+    def test_rehash_on_login_keeps_tokens(self):
+        old_hash = self.user.password
+
+        self.assertTrue(self.user.check_password('secret'))
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertNotEqual(user.password, old_hash)
+        self.assertEqual(user.token_version, 0)
+
+    def test_password_change_saved_with_update_fields_revokes_tokens(self):
+        self.user.set_password('changed')
+        self.user.save(update_fields={'password'})
+
+        self.assertEqual(User.objects.get(pk=self.user.pk).token_version, 1)
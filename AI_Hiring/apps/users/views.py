@@ -2,9 +2,10 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from .models import User
+from apps.authentication.backends import DatabaseUserMixin
 from apps.authentication.serializers import UserSerializer
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(DatabaseUserMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
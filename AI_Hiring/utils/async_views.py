@@ -0,0 +1,104 @@
+import functools
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from apps.authentication.backends import aget_token_version, is_token_current
+from .db_routing import ais_pinned, read_from_replica
+
+User = get_user_model()
+
+
+async def aauthenticate(request):
+    """Resolve the JWT bearer on a plain Django request using the async ORM and cache"""
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header is None:
+        return None
+
+    try:
+        raw_token = authentication.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = authentication.get_validated_token(raw_token)
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+    except (AuthenticationFailed, InvalidToken, KeyError):
+        return None
+
+    if settings.AUTH_STATELESS_JWT:
+        if not is_token_current(validated_token, await aget_token_version(user_id)):
+            return None
+        return api_settings.TOKEN_USER_CLASS(validated_token)
+
+    try:
+        user = await User.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+    except User.DoesNotExist:
+        return None
+
+    return user if user.is_active else None
+
+
+def async_api_view(view):
+    """Read-only async endpoint: GET only, JWT-authenticated, user passed to the view, reads from a replica"""
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != 'GET':
+            return api_response({'detail': f'Method "{request.method}" not allowed.'}, status=405)
+        user = await aauthenticate(request)
+        if user is None:
+            return unauthorized()
+        if await ais_pinned(user.pk):
+            return await view(request, user, *args, **kwargs)
+        # The ORM's sync_to_async threads copy this context, so the router sees the replica
+        with read_from_replica():
+            return await view(request, user, *args, **kwargs)
+    return wrapper
+
+
+def api_response(data, status=200):
+    """JSON response rendered the same way as DRF's JSONRenderer"""
+    return JsonResponse(data, status=status, safe=False, encoder=JSONEncoder)
+
+
+def unauthorized():
+    return api_response({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+
+def not_found():
+    return api_response({'detail': 'Not found.'}, status=404)
+
+
+async def apaginate(request, queryset, serialize):
+    """PageNumberPagination-compatible page built with acount() and async iteration"""
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+    page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+
+    count = await queryset.acount()
+    offset = (page - 1) * page_size
+    if offset and offset >= count:
+        return not_found()
+
+    items = [item async for item in queryset[offset:offset + page_size]]
+    url = request.build_absolute_uri()
+
+    next_url = replace_query_param(url, 'page', page + 1) if offset + page_size < count else None
+    if page == 1:
+        previous_url = None
+    elif page == 2:
+        previous_url = remove_query_param(url, 'page')
+    else:
+        previous_url = replace_query_param(url, 'page', page - 1)
+
+    return api_response({
+        'count': count,
+        'next': next_url,
+        'previous': previous_url,
+        'results': serialize(items),
+    })
@@ -0,0 +1,170 @@
+# utils/db_routing.py
+import random
+import time
+from contextvars import ContextVar
+from functools import wraps
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.signals import connection_created
+from rest_framework.permissions import SAFE_METHODS
+from .instrumentation import REGISTRY
+
+DB_QUERY_DURATION = REGISTRY.histogram(
+    'db_query_duration_seconds', 'Query time by database alias.', ('alias',),
+)
+
+# Alias the current block reads from; None reads from the primary
+_read_alias: ContextVar = ContextVar('read_alias', default=None)
+
+
+class PrimaryReplicaRouter:
+    """Writes and ordinary reads go to the primary; reads inside read_from_replica go to its replica"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the primary's rows, so objects loaded from either can be related
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class read_from_replica:
+    """Route the reads of a block or function to one replica, picked per block.
+
+    Usable as ``with read_from_replica():`` or as ``@read_from_replica()``. Every
+    query of the block uses the same replica so they see one consistent snapshot;
+    without replicas configured reads stay on the primary.
+    """
+
+    def __init__(self):
+        self.token = None
+
+    def __enter__(self):
+        replicas = settings.DATABASE_REPLICAS
+        self.token = _read_alias.set(random.choice(replicas) if replicas else None)
+        return self
+
+    def __exit__(self, *exc_info):
+        _read_alias.reset(self.token)
+        return False
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with read_from_replica():
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def _pin_key(user_id) -> str:
+    return f'db:pinned:{user_id}'
+
+
+def pin_to_primary(user_id):
+    """Serve the user's reads from the primary until replicas have caught up with their write"""
+    if settings.DATABASE_REPLICAS:
+        cache.set(_pin_key(user_id), True, settings.DATABASE_REPLICA_PIN_SECONDS)
+
+
+def is_pinned(user_id) -> bool:
+    return bool(settings.DATABASE_REPLICAS) and cache.get(_pin_key(user_id)) is not None
+
+
+async def ais_pinned(user_id) -> bool:
+    return bool(settings.DATABASE_REPLICAS) and await cache.aget(_pin_key(user_id)) is not None
+
+
+class ReplicaReadMixin:
+    """Serve the viewset's replica_actions from a replica unless a recent write pinned the user to the primary"""
+
+    replica_actions = ('list', 'retrieve')
+
+    def initial(self, request, *args, **kwargs):
+        # After authentication and permission checks, which must see the primary's users and token versions
+        super().initial(request, *args, **kwargs)
+        if (
+            self.action in self.replica_actions
+            and request.method in SAFE_METHODS
+            and not (request.user.is_authenticated and is_pinned(request.user.pk))
+        ):
+            self._replica = read_from_replica().__enter__()
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            # Here rather than in finalize_response, which DRF skips when it re-raises a non-API exception
+            replica = getattr(self, '_replica', None)
+            if replica is not None:
+                replica.__exit__(None, None, None)
+                self._replica = None
+
+
+class ReplicaPinningMiddleware:
+    """Pin users to the primary for DATABASE_REPLICA_PIN_SECONDS after a successful write request.
+
+    Reads the user DRF authenticated, so token-authenticated API clients are pinned
+    too. Dropped at startup when no replicas are configured.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self._wrote(request, response):
+            self._pin(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self._wrote(request, response):
+            # request.user may still be a lazy session lookup, which must not run on the event loop
+            await sync_to_async(self._pin)(request)
+        return response
+
+    @staticmethod
+    def _wrote(request, response) -> bool:
+        return request.method not in SAFE_METHODS and response.status_code < 400
+
+    @staticmethod
+    def _pin(request):
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            pin_to_primary(user.pk)
+
+
+def _time_query(execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        DB_QUERY_DURATION.observe(time.perf_counter() - started, context['connection'].alias)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """Time every query per database alias; runs again on each reconnect of the same wrapper"""
+    if settings.PERF_INSTRUMENTATION and _time_query not in connection.execute_wrappers:
+        # First in the list, since execute_wrapper() blocks open on this connection pop from the end
+        connection.execute_wrappers.insert(0, _time_query)
+
+
+connection_created.connect(install_query_timer)
@@ -0,0 +1,297 @@
+# utils/instrumentation.py
+import bisect
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Sequence, Tuple
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import Http404, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+
+
+class Histogram:
+    """Prometheus-style histogram with one set of cumulative buckets per label combination"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # Per-bucket counts plus +Inf, then the sum
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> str:
+        with self._lock:
+            snapshot = {key: list(series) for key, series in self._series.items()}
+        return render_histogram(self.name, self.help_text, self.labels, self.buckets, snapshot)
+
+
+def render_histogram(name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float],
+                     snapshot: Dict[Tuple[str, ...], list]) -> str:
+    """Exposition text for per-bucket counts (+Inf last) followed by the sum, keyed by label values"""
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+    for label_values, series in sorted(snapshot.items()):
+        labels = [f'{label}="{_escape(value)}"' for label, value in zip(label_names, label_values)]
+        cumulative = 0
+        for bound, count in zip(tuple(buckets) + ('+Inf',), series):
+            cumulative += count
+            bucket_labels = ','.join(labels + [f'le="{bound}"'])
+            lines.append(f'{name}_bucket{{{bucket_labels}}} {cumulative}')
+        prefix = '{' + ','.join(labels) + '}' if labels else ''
+        lines.append(f'{name}_sum{prefix} {series[-1]:.6f}')
+        lines.append(f'{name}_count{prefix} {cumulative}')
+    return '\n'.join(lines)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        metric = Histogram(name, help_text, labels, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        """Add a callable returning exposition text for metrics kept outside this process"""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        sections = [metric.render() for metric in self.metrics]
+        for collector in self.collectors:
+            try:
+                sections.append(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+        return '\n'.join(section for section in sections if section) + '\n'
+
+
+# Metrics live in process memory, so each worker process exposes its own series
+REGISTRY = MetricsRegistry()
+REQUEST_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds', 'Wall time per request.', ('method', 'view', 'status'),
+)
+REQUEST_QUERIES = REGISTRY.histogram(
+    'http_request_db_queries', 'Database queries per sampled request.', ('view',), QUERY_BUCKETS,
+)
+REQUEST_DB_DURATION = REGISTRY.histogram(
+    'http_request_db_duration_seconds', 'Database time per sampled request.', ('view',),
+)
+SPAN_DURATION = REGISTRY.histogram(
+    'span_duration_seconds', 'Time inside named spans of sampled requests.', ('span',),
+)
+
+
+class QueryCounter:
+    """execute_wrapper that counts queries and their total time"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+@contextmanager
+def count_queries():
+    """Count the queries run on every database connection inside the block"""
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+class RequestProfile:
+    """Timing breakdown of one sampled request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: Dict[str, list] = {}
+
+    def add_span(self, name: str, seconds: float):
+        entry = self.spans.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+
+_profile: ContextVar = ContextVar('request_profile', default=None)
+
+
+class span:
+    """Time a block or function as a named span of the current sampled request.
+
+    Usable as ``with span('ats.parse'):`` or as ``@span('ats.parse')``. Outside a
+    sampled request it costs one context variable lookup.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profile = None
+        self.started = 0.0
+
+    def __enter__(self):
+        self.profile = _profile.get()
+        if self.profile is not None:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profile is not None:
+            self.profile.add_span(self.name, time.perf_counter() - self.started)
+        return False
+
+    def __call__(self, func):
+        name = self.name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # A fresh span per call, so concurrent calls never share timing state
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class PerformanceMiddleware:
+    """Record per-request wall time for every request and a full breakdown for a sample.
+
+    Sampled requests (PERF_SAMPLE_RATE) also count database queries, collect named
+    spans, return a Server-Timing header and write a structured log line. Requests
+    slower than PERF_SLOW_REQUEST_MS are logged whether sampled or not.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PERF_INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = settings.PERF_SAMPLE_RATE
+        self.slow_seconds = settings.PERF_SLOW_REQUEST_MS / 1000
+        # Under ASGI the chain stays async instead of going through a sync adapter per request
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if self._sampled():
+            profile = RequestProfile()
+            token = _profile.set(profile)
+            try:
+                with count_queries() as queries:
+                    response = self.get_response(request)
+            finally:
+                _profile.reset(token)
+            return self._record_profile(request, response, profile, queries)
+
+        started = time.perf_counter()
+        response = self.get_response(request)
+        return self._record(request, response, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        if self._sampled():
+            profile = RequestProfile()
+            token = _profile.set(profile)
+            try:
+                with count_queries() as queries:
+                    response = await self.get_response(request)
+            finally:
+                _profile.reset(token)
+            return self._record_profile(request, response, profile, queries)
+
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        return self._record(request, response, time.perf_counter() - started)
+
+    def _sampled(self) -> bool:
+        return bool(self.sample_rate) and random.random() < self.sample_rate
+
+    def _record(self, request, response, elapsed):
+        view = self._view_name(request)
+        REQUEST_DURATION.observe(elapsed, request.method, view, str(response.status_code))
+        if elapsed >= self.slow_seconds:
+            self._log(request, response, view, elapsed)
+        return response
+
+    def _record_profile(self, request, response, profile, queries):
+        elapsed = time.perf_counter() - profile.started
+
+        view = self._view_name(request)
+        REQUEST_DURATION.observe(elapsed, request.method, view, str(response.status_code))
+        REQUEST_QUERIES.observe(queries.count, view)
+        REQUEST_DB_DURATION.observe(queries.seconds, view)
+        for name, (_, seconds) in profile.spans.items():
+            SPAN_DURATION.observe(seconds, name)
+
+        timings = [f'total;dur={elapsed * 1000:.1f}', f'db;dur={queries.seconds * 1000:.1f};desc="{queries.count} queries"']
+        timings += [f'{name};dur={seconds * 1000:.1f}' for name, (_, seconds) in profile.spans.items()]
+        response['Server-Timing'] = ', '.join(timings)
+        self._log(request, response, view, elapsed, queries, profile)
+        return response
+
+    @staticmethod
+    def _view_name(request) -> str:
+        # The view name rather than the path keeps metric label cardinality bounded
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match else 'unresolved'
+
+    def _log(self, request, response, view, elapsed, queries=None, profile=None):
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': view,
+            'status': response.status_code,
+            'duration_ms': round(elapsed * 1000, 1),
+        }
+        if queries is not None:
+            record['db_queries'] = queries.count
+            record['db_ms'] = round(queries.seconds * 1000, 1)
+            record['spans'] = {
+                name: {'calls': calls, 'ms': round(seconds * 1000, 1)}
+                for name, (calls, seconds) in profile.spans.items()
+            }
+        level = logging.WARNING if elapsed >= self.slow_seconds else logging.INFO
+        logger.log(level, json.dumps(record), extra={'performance': record})
+
+
+def metrics_view(request):
+    """Prometheus metrics for this process, served only to PERF_METRICS_ALLOWED_IPS"""
+    if request.META.get('REMOTE_ADDR') not in settings.PERF_METRICS_ALLOWED_IPS:
+        raise Http404
+    return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
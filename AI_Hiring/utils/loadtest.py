@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LoadResult:
+    """Latency samples and outcome counts for one endpoint under load"""
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.queries = []
+        self.status_counts = Counter()
+        self.errors = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency, status, queries=None):
+        with self._lock:
+            self.latencies.append(latency)
+            if queries is not None:
+                self.queries.append(queries)
+            self.status_counts[status] += 1
+            if status is None or status >= 400:
+                self.errors += 1
+
+    @property
+    def rps(self):
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(int(round(p / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    def summary(self):
+        summary = {
+            'endpoint': self.name,
+            'requests': len(self.latencies),
+            'errors': self.errors,
+            'rps': round(self.rps, 1),
+            'p50_ms': round(self.percentile(50) * 1000, 2),
+            'p95_ms': round(self.percentile(95) * 1000, 2),
+            'p99_ms': round(self.percentile(99) * 1000, 2),
+        }
+        # Only servers running QueryCountMiddleware report query counts
+        if self.queries:
+            summary['queries_avg'] = round(sum(self.queries) / len(self.queries), 1)
+            summary['queries_max'] = max(self.queries)
+        return summary
+
+    def histogram(self):
+        """Request counts per latency bucket"""
+        row = {'endpoint': self.name}
+        lower = 0
+        for upper in HISTOGRAM_BUCKETS_MS:
+            row[f'<{upper}ms'] = sum(1 for latency in self.latencies if lower <= latency * 1000 < upper)
+            lower = upper
+        row[f'>={lower}ms'] = sum(1 for latency in self.latencies if latency * 1000 >= lower)
+        return row
+
+
+def encode_multipart(fields, files):
+    """Encode form fields and (filename, bytes, content type) files as multipart/form-data"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content, content_type) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def http_request(url, method='GET', headers=None, body=None, timeout=30, files=None):
+    """Issue one request and return (status, response headers, parsed JSON body or None).
+
+    With ``files`` the body fields and files are sent as multipart/form-data instead of JSON.
+    """
+    if files:
+        data, content_type = encode_multipart(body or {}, files)
+    else:
+        data, content_type = (json.dumps(body).encode(), 'application/json') if body is not None else (None, None)
+    request = urllib.request.Request(url, data=data, method=method, headers=headers or {})
+    if content_type:
+        request.add_header('Content-Type', content_type)
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status, response_headers, payload = response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        status, response_headers, payload = e.code, e.headers, e.read()
+    except (urllib.error.URLError, OSError):
+        return None, {}, None
+
+    try:
+        return status, response_headers, json.loads(payload) if payload else None
+    except ValueError:
+        return status, response_headers, None
+
+
+def query_count(headers):
+    value = headers.get('X-DB-Query-Count') if headers else None
+    return int(value) if value is not None else None
+
+
+def run_load(name, send, total, concurrency):
+    """Call send() total times from concurrency threads.
+
+    send returns an HTTP status, or (status, response headers) to also record query counts.
+    """
+    result = LoadResult(name)
+
+    def worker(_):
+        started = time.perf_counter()
+        outcome = send()
+        latency = time.perf_counter() - started
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, None)
+        result.record(latency, status, query_count(headers))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(total)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def format_table(rows):
+    """Render summary dicts as a fixed-width text table"""
+    if not rows:
+        return ''
+    columns = list(rows[0])
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    lines = ['  '.join(c.ljust(widths[c]) for c in columns)]
+    lines.append('  '.join('-' * widths[c] for c in columns))
+    for row in rows:
+        lines.append('  '.join(str(row[c]).ljust(widths[c]) for c in columns))
+    return '\n'.join(lines)
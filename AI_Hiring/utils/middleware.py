@@ -0,0 +1,23 @@
+# utils/middleware.py
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from .instrumentation import count_queries
+
+
+class QueryCountMiddleware:
+    """Report each request's database query count and time in response headers.
+
+    Enabled by LOADTEST_QUERY_HEADERS for load tests; otherwise Django drops it at startup.
+    """
+
+    def __init__(self, get_response):
+        if not settings.LOADTEST_QUERY_HEADERS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with count_queries() as counter:
+            response = self.get_response(request)
+        response['X-DB-Query-Count'] = str(counter.count)
+        response['X-DB-Query-Ms'] = f'{counter.seconds * 1000:.1f}'
+        return response
@@ -1,34 +1,83 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework import permissions
 
+ADMIN_ROLES = frozenset(['admin'])
+RECRUITER_ROLES = frozenset(['recruiter', 'admin'])
+HIRING_MANAGER_ROLES = frozenset(['hiring_manager', 'recruiter', 'admin'])
+INTERVIEWER_ROLES = frozenset(['interviewer', 'hiring_manager', 'recruiter', 'admin'])
+CANDIDATE_ROLES = frozenset(['candidate'])
+
+
+def role_cache_key(user_id):
+    return f'auth:role:{user_id}'
+
+
+def get_user_role(request):
+    """Resolve the user's role once per request.
+
+    Lookup order: request-scoped cache, a role already loaded on the user,
+    the JWT ``role`` claim, then a short-TTL shared cache in front of the database.
+    """
+    if hasattr(request, '_cached_role'):
+        return request._cached_role
+
+    user = request.user
+    role = None
+    if user and user.is_authenticated:
+        role = getattr(user, 'role', None)
+        token = getattr(request, 'auth', None)
+        if role is None and token is not None and hasattr(token, 'get'):
+            role = token.get('role')
+        if role is None:
+            key = role_cache_key(user.pk)
+            role = cache.get(key)
+            if role is None:
+                role = get_user_model().objects.filter(pk=user.pk).values_list('role', flat=True).first()
+                cache.set(key, role, settings.ROLE_CACHE_TIMEOUT)
+
+    request._cached_role = role
+    return role
+
+
+def has_role(request, roles):
+    return request.user.is_authenticated and get_user_role(request) in roles
+
+
+def is_owner(request, obj):
+    """Compare foreign key ids so ownership checks never load the related user"""
+    for field in ('candidate', 'user'):
+        owner_id = getattr(obj, f'{field}_id', None)
+        if owner_id is not None:
+            return str(owner_id) == str(request.user.pk)
+    return False
+
 class IsAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == 'admin'
+        return has_role(request, ADMIN_ROLES)
 
 class IsRecruiter(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role in ['recruiter', 'admin']
+        return has_role(request, RECRUITER_ROLES)
 
 class IsHiringManager(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role in ['hiring_manager', 'recruiter', 'admin']
+        return has_role(request, HIRING_MANAGER_ROLES)
 
 class IsInterviewer(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role in ['interviewer', 'hiring_manager', 'recruiter', 'admin']
+        return has_role(request, INTERVIEWER_ROLES)
 
 class IsCandidate(permissions.BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == 'candidate'
+        return has_role(request, CANDIDATE_ROLES)
 
 class IsRecruiterOrOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        if request.user.role in ['recruiter', 'admin']:
+        if has_role(request, RECRUITER_ROLES):
             return True
-        if hasattr(obj, 'candidate'):
-            return obj.candidate == request.user
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        return False
+        return is_owner(request, obj)
 
 class RoleBasedPermission(permissions.BasePermission):
     """Dynamic role-based permission"""
@@ -44,7 +93,7 @@ class RoleBasedPermission(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
         
-        user_role = request.user.role
+        user_role = get_user_role(request)
         required_permission = getattr(view, 'required_permission', None)
         
         if not required_permission:
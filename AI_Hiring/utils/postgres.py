@@ -0,0 +1,48 @@
+# utils/postgres.py
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.db import connections, migrations
+
+
+def is_postgres(using: str = 'default') -> bool:
+    return connections[using].vendor == 'postgresql'
+
+
+class PortableDateTimeRangeField(DateTimeRangeField):
+    """DateTimeRangeField that can be written on other backends, where it only ever holds null
+
+    The stock field casts every parameter to tstzrange, which no other backend parses.
+    """
+
+    def get_placeholder(self, value, compiler, connection):
+        if connection.vendor == 'postgresql':
+            return super().get_placeholder(value, compiler, connection)
+        return '%s'
+
+
+class PostgresOnlyMixin:
+    """Apply the operation's state change everywhere but run its SQL only on PostgreSQL.
+
+    Lets the schema migrate on SQLite for tests and local runs; the features that
+    depend on the skipped SQL (range exclusion constraints, GIN indexes) are then
+    unenforced or slower there.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgresOnlyAddIndex(PostgresOnlyMixin, migrations.AddIndex):
+    pass
+
+
+class PostgresOnlyAddConstraint(PostgresOnlyMixin, migrations.AddConstraint):
+    pass
+
+
+class PostgresOnlyRunSQL(PostgresOnlyMixin, migrations.RunSQL):
+    pass
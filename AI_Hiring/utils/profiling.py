@@ -0,0 +1,185 @@
+# utils/profiling.py
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+MAX_STACK_DEPTH = 64
+
+
+class StackSampler:
+    """Statistical profiler: a background thread records the profiled thread's stack every interval.
+
+    Stacks are kept in collapsed form ("module:function;module:function") from the
+    frame that started sampling down to the leaf, the input flamegraph tools expect.
+    With require_root, stacks that don't pass through root are dropped: a coroutine
+    frame is only on the stack while the event loop is running that coroutine.
+    """
+
+    def __init__(self, interval: float, root=None, require_root: bool = False):
+        self.interval = interval
+        self.root = root
+        self.require_root = require_root
+        self.samples = Counter()
+        self._thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                stack = self._collapse(frame)
+                if stack is not None:
+                    self.samples[stack] += 1
+
+    def _collapse(self, frame) -> Optional[str]:
+        names = []
+        while frame is not None:
+            if len(names) < MAX_STACK_DEPTH:
+                names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+            elif not self.require_root:
+                break
+            if frame is self.root:
+                break
+            frame = frame.f_back
+        else:
+            if self.require_root:
+                return None
+        return ';'.join(reversed(names))
+
+
+class ProfileCapture:
+    """Context of one sampled block; fields can be filled in while it runs"""
+
+    def __init__(self, kind: str, **context):
+        self.kind = kind
+        self.label = context.get('label', '')
+        self.application_id = context.get('application_id')
+        self.resume_hash = context.get('resume_hash', '')
+
+
+@contextmanager
+def sampled_profile(kind: str, sample_rate: float, **context):
+    """Stack-sample the block for a sample_rate fraction of calls and store the result as a ProfileSample.
+
+    Yields the ProfileCapture of a sampled call, or None, so unsampled calls cost one random draw.
+    """
+    if not sample_rate or random.random() >= sample_rate:
+        yield None
+        return
+
+    interval_ms = settings.PROFILE_INTERVAL_MS
+    # Frame 2 is the caller's: this generator, then contextmanager.__enter__, then the with statement
+    sampler = StackSampler(interval_ms / 1000, root=sys._getframe(2))
+    capture = ProfileCapture(kind, **context)
+    started = time.perf_counter()
+    sampler.start()
+    try:
+        yield capture
+    finally:
+        stacks = sampler.stop()
+        _store(capture, (time.perf_counter() - started) * 1000, interval_ms, stacks)
+
+
+def _store(capture: ProfileCapture, duration_ms: float, interval_ms: float, stacks: Counter):
+    from apps.analytics.models import ProfileSample
+
+    try:
+        # A savepoint, so a failed insert inside the caller's transaction doesn't break that transaction
+        with transaction.atomic():
+            ProfileSample.objects.create(
+                kind=capture.kind,
+                label=capture.label[:200],
+                application_id=capture.application_id,
+                resume_hash=capture.resume_hash or '',
+                duration_ms=round(duration_ms, 2),
+                interval_ms=interval_ms,
+                sample_count=sum(stacks.values()),
+                stacks=dict(stacks),
+            )
+    except Exception as e:
+        # e.g. the profiled block broke the surrounding transaction; profiling must never fail the caller
+        logger.warning(f"Could not store {capture.kind} profile: {e}")
+
+
+def hotspots(stack_counts: Dict[str, int]) -> List[Tuple[str, int, int]]:
+    """(function, self samples, total samples) from collapsed stacks, hottest self time first"""
+    self_samples, total_samples = Counter(), Counter()
+    for stack, count in stack_counts.items():
+        frames = stack.split(';')
+        self_samples[frames[-1]] += count
+        # Recursive functions count once per stack towards total time
+        for function in set(frames):
+            total_samples[function] += count
+    return sorted(
+        ((function, self_samples[function], total) for function, total in total_samples.items()),
+        key=lambda row: (-row[1], -row[2]),
+    )
+
+
+class ProfilingMiddleware:
+    """Stack-sample a PROFILE_REQUEST_SAMPLE_RATE fraction of requests; dropped at startup when zero.
+
+    Under ASGI only the request's own coroutine is sampled, on the event loop thread; ORM
+    calls it hands to sync_to_async run on another thread and show up as time spent awaiting.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILE_REQUEST_SAMPLE_RATE:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILE_REQUEST_SAMPLE_RATE
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with sampled_profile('request', self.sample_rate, label=f'{request.method} {request.path}') as capture:
+            response = self.get_response(request)
+            if capture is not None and getattr(request, 'resolver_match', None):
+                capture.label = f'{request.method} {request.resolver_match.view_name}'
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+
+        interval_ms = settings.PROFILE_INTERVAL_MS
+        # While this coroutine awaits, the loop runs other requests; their stacks don't include this frame
+        sampler = StackSampler(interval_ms / 1000, root=sys._getframe(), require_root=True)
+        capture = ProfileCapture('request', label=f'{request.method} {request.path}')
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            response = await self.get_response(request)
+            if getattr(request, 'resolver_match', None):
+                capture.label = f'{request.method} {request.resolver_match.view_name}'
+        finally:
+            stacks = sampler.stop()
+            await sync_to_async(_store)(capture, (time.perf_counter() - started) * 1000, interval_ms, stacks)
+        return response
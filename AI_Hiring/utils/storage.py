@@ -0,0 +1,115 @@
+import io
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+try:
+    from storages.backends.s3 import S3Storage
+    from storages.utils import clean_name, safe_join
+    S3_AVAILABLE = True
+except ImportError:
+    S3Storage = None
+    S3_AVAILABLE = False
+
+
+def is_s3_storage(storage=default_storage):
+    """Whether the storage talks to S3 (or an S3-compatible stand-in like MinIO)"""
+    return S3_AVAILABLE and isinstance(storage, S3Storage)
+
+
+def s3_key(storage, name):
+    """Translate a storage name into the object key, honouring the storage location"""
+    return safe_join(storage.location, clean_name(name))
+
+
+def presign_client(storage=default_storage):
+    """S3 client for URLs handed to browsers, signed for AWS_S3_PUBLIC_ENDPOINT_URL when one is set"""
+    public_endpoint = settings.AWS_S3_PUBLIC_ENDPOINT_URL
+    if not public_endpoint or public_endpoint == storage.endpoint_url:
+        return storage.connection.meta.client
+    # Presigning is local, so this client never connects; keep one per storage instead of one per request
+    client = getattr(storage, '_public_client', None)
+    if client is None:
+        client = storage._public_client = storage._create_session().client(
+            's3', region_name=storage.region_name, endpoint_url=public_endpoint, config=storage.config,
+        )
+    return client
+
+
+def create_presigned_post(name, max_size, expires_in, storage=default_storage):
+    """Presigned POST letting a client upload straight to the bucket, bypassing the web worker"""
+    return presign_client(storage).generate_presigned_post(
+        Bucket=storage.bucket_name,
+        Key=s3_key(storage, name),
+        Conditions=[
+            ['content-length-range', 1, max_size],
+            ['starts-with', '$Content-Type', ''],
+        ],
+        ExpiresIn=expires_in,
+    )
+
+
+class S3RangeReader(io.RawIOBase):
+    """Seekable read-only stream over an S3 object that fetches bytes with ranged GETs"""
+
+    def __init__(self, client, bucket, key, name=None):
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.name = name or key
+        self.size = client.head_object(Bucket=bucket, Key=key)['ContentLength']
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self.position = position
+        return self.position
+
+    def _read_range(self, end):
+        response = self.client.get_object(
+            Bucket=self.bucket,
+            Key=self.key,
+            Range=f'bytes={self.position}-{end}',
+        )
+        data = response['Body'].read()
+        self.position += len(data)
+        return data
+
+    def readinto(self, buffer):
+        if self.position >= self.size or not len(buffer):
+            return 0
+        data = self._read_range(min(self.position + len(buffer), self.size) - 1)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readall(self):
+        # One request for the remainder instead of a GET per default-sized block
+        if self.position >= self.size:
+            return b''
+        return self._read_range(self.size - 1)
+
+
+def open_stored_file(name, storage=default_storage):
+    """Open a stored file for streaming reads without downloading the whole object first"""
+    if is_s3_storage(storage):
+        raw = S3RangeReader(storage.connection.meta.client, storage.bucket_name, s3_key(storage, name), name=name)
+        return io.BufferedReader(raw, buffer_size=settings.RESUME_RANGE_READ_SIZE)
+    return storage.open(name, 'rb')
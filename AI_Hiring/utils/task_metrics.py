@@ -0,0 +1,132 @@
+# utils/task_metrics.py
+import bisect
+import logging
+import time
+from collections import defaultdict
+import redis
+from celery import current_app
+from celery.signals import before_task_publish, task_postrun, task_prerun, task_retry
+from django.conf import settings
+from .instrumentation import REGISTRY, render_histogram
+
+logger = logging.getLogger(__name__)
+
+# One Redis hash shared by every worker process, so the web /metrics endpoint sees all of them
+METRICS_KEY = 'celery:task_metrics'
+SENT_AT_HEADER = 'sent_at'
+RUNTIME_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+WAIT_BUCKETS = (0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+_client = None
+_started = {}
+
+
+def _redis():
+    global _client
+    if _client is None:
+        # Metrics must never hold up a task, so give up quickly when Redis is unreachable
+        _client = redis.Redis.from_url(settings.TASK_METRICS_REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+    return _client
+
+
+def _observe(pipe, metric: str, task: str, value: float, buckets):
+    pipe.hincrby(METRICS_KEY, f'{metric}|{task}|{bisect.bisect_left(buckets, value)}', 1)
+    pipe.hincrbyfloat(METRICS_KEY, f'{metric}|{task}|sum', value)
+
+
+def _write(record):
+    try:
+        pipe = _redis().pipeline(transaction=False)
+        record(pipe)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.debug(f"Task metrics not recorded: {e}")
+
+
+@before_task_publish.connect
+def stamp_sent_at(headers=None, **kwargs):
+    if settings.TASK_METRICS_ENABLED and headers is not None:
+        headers[SENT_AT_HEADER] = time.time()
+
+
+@task_prerun.connect
+def task_started(task_id=None, task=None, **kwargs):
+    if not settings.TASK_METRICS_ENABLED:
+        return
+    _started[task_id] = time.perf_counter()
+    sent_at = task.request.get(SENT_AT_HEADER) or (task.request.headers or {}).get(SENT_AT_HEADER)
+    # Retries are republished with a countdown, so only first deliveries measure queueing
+    if sent_at and not task.request.retries:
+        _write(lambda pipe: _observe(pipe, 'wait', task.name, max(0.0, time.time() - sent_at), WAIT_BUCKETS))
+
+
+@task_postrun.connect
+def task_finished(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if started is None:
+        return
+    runtime = time.perf_counter() - started
+
+    def record(pipe):
+        _observe(pipe, 'runtime', task.name, runtime, RUNTIME_BUCKETS)
+        pipe.hincrby(METRICS_KEY, f'outcome|{task.name}|{state}', 1)
+    _write(record)
+
+
+@task_retry.connect
+def task_retried(sender=None, **kwargs):
+    if settings.TASK_METRICS_ENABLED:
+        _write(lambda pipe: pipe.hincrby(METRICS_KEY, f'retries|{sender.name}|', 1))
+
+
+def task_queues():
+    app = current_app
+    return sorted({app.conf.task_default_queue} | {route['queue'] for route in app.conf.task_routes.values()})
+
+
+def collect() -> str:
+    """Exposition text for task runtime, queue wait, outcomes, retries and current queue depth"""
+    if not settings.TASK_METRICS_ENABLED:
+        return ''
+    client = _redis()
+    queues = task_queues()
+    pipe = client.pipeline(transaction=False)
+    pipe.hgetall(METRICS_KEY)
+    for queue in queues:
+        pipe.llen(queue)
+    raw, *depths = pipe.execute()
+
+    histograms = {'runtime': defaultdict(dict), 'wait': defaultdict(dict)}
+    counters = {'outcome': {}, 'retries': {}}
+    for field, value in raw.items():
+        metric, task, part = field.decode().split('|')
+        if metric in histograms:
+            histograms[metric][task][part] = float(value)
+        elif metric in counters:
+            counters[metric][(task, part) if part else (task,)] = int(value)
+
+    def series(samples, buckets):
+        return {
+            (task,): [int(parts.get(str(i), 0)) for i in range(len(buckets) + 1)] + [parts.get('sum', 0.0)]
+            for task, parts in samples.items()
+        }
+
+    sections = [
+        render_histogram('celery_task_runtime_seconds', 'Task execution time.', ('task',), RUNTIME_BUCKETS,
+                         series(histograms['runtime'], RUNTIME_BUCKETS)),
+        render_histogram('celery_task_queue_wait_seconds', 'Time from publish to start.', ('task',), WAIT_BUCKETS,
+                         series(histograms['wait'], WAIT_BUCKETS)),
+    ]
+    lines = ['# HELP celery_task_outcomes_total Finished tasks by final state.', '# TYPE celery_task_outcomes_total counter']
+    lines += [f'celery_task_outcomes_total{{task="{task}",state="{state}"}} {count}'
+              for (task, state), count in sorted(counters['outcome'].items())]
+    lines += ['# HELP celery_task_retries_total Task retries.', '# TYPE celery_task_retries_total counter']
+    lines += [f'celery_task_retries_total{{task="{task}"}} {count}' for (task,), count in sorted(counters['retries'].items())]
+    # The Redis transport keeps each queue as a list of waiting messages
+    lines += ['# HELP celery_queue_depth Messages waiting in each queue.', '# TYPE celery_queue_depth gauge']
+    lines += [f'celery_queue_depth{{queue="{queue}"}} {depth}' for queue, depth in zip(queues, depths)]
+    sections.append('\n'.join(lines))
+    return '\n'.join(sections)
+
+
+REGISTRY.register_collector(collect)
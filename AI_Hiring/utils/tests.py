@@ -0,0 +1,191 @@
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+import asyncio
+import time
+from collections import Counter
+from types import SimpleNamespace
+from unittest import mock
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.analytics.models import ProfileSample
+from apps.authentication.backends import ClaimsUser
+from apps.authentication.tokens import RoleRefreshToken
+from apps.jobs.models import Department
+from apps.jobs.views import DepartmentViewSet
+from apps.users.models import User
+from .db_routing import ReplicaPinningMiddleware, _read_alias, read_from_replica
+from .instrumentation import PerformanceMiddleware
+from .permissions import IsRecruiter, IsRecruiterOrOwner, get_user_role
+from .profiling import ProfileCapture, ProfilingMiddleware, _store
+
+
+async def async_view(request):
+    return HttpResponse('ok')
+
+
+def sync_view(request):
+    return HttpResponse('ok')
+
+
+class PerformanceMiddlewareTests(SimpleTestCase):
+    factory = RequestFactory()
+
+    def test_stays_async_under_async_chain(self):
+        self.assertTrue(iscoroutinefunction(PerformanceMiddleware(async_view)))
+        self.assertFalse(iscoroutinefunction(PerformanceMiddleware(sync_view)))
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    async def test_async_sampled_request_gets_server_timing(self):
+        response = await PerformanceMiddleware(async_view)(self.factory.get('/'))
+
+        self.assertEqual(response.content, b'ok')
+        self.assertTrue(response['Server-Timing'].startswith('total;dur='))
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    def test_sync_sampled_request_gets_server_timing(self):
+        response = PerformanceMiddleware(sync_view)(self.factory.get('/'))
+
+        self.assertTrue(response['Server-Timing'].startswith('total;dur='))
+
+
+async def busy_view(request):
+    # CPU time on the loop thread, then an await during which the coroutine is off the stack
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    await asyncio.sleep(0.05)
+    return HttpResponse('ok')
+
+
+class ProfileStoreTests(TestCase):
+    def test_failed_store_leaves_transaction_usable(self):
+        # A negative sample count violates the column's check constraint
+        with self.assertLogs('utils.profiling', 'WARNING'):
+            _store(ProfileCapture('request'), 1.0, 5.0, Counter({'module:view': -1}))
+
+        self.assertEqual(ProfileSample.objects.count(), 0)
+
+
+@override_settings(PROFILE_REQUEST_SAMPLE_RATE=1.0, PROFILE_INTERVAL_MS=1.0)
+class ProfilingMiddlewareTests(TestCase):
+    async def test_async_request_samples_only_its_own_coroutine(self):
+        middleware = ProfilingMiddleware(busy_view)
+        self.assertTrue(iscoroutinefunction(middleware))
+
+        response = await middleware(RequestFactory().get('/slow'))
+
+        self.assertEqual(response.content, b'ok')
+        sample = await ProfileSample.objects.aget()
+        self.assertEqual(sample.label, 'GET /slow')
+        self.assertGreater(sample.sample_count, 0)
+        self.assertTrue(all(stack.startswith('utils.profiling:__acall__') for stack in sample.stacks))
+        self.assertTrue(any('utils.tests:busy_view' in stack for stack in sample.stacks))
+
+
+class ReplicaRoutingTests(TestCase):
+    """Routing against a replica that is a separate database, so each read shows where it went"""
+
+    databases = {'default', 'replica_1'}
+
+    @classmethod
+    def setUpClass(cls):
+        # Migrations skip replicas; create the table outside the test transaction, which SQLite requires
+        with connections['replica_1'].schema_editor() as editor:
+            editor.create_model(Department)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connections['replica_1'].schema_editor() as editor:
+            editor.delete_model(Department)
+
+    def setUp(self):
+        cache.clear()
+        Department.objects.create(name='Primary')
+        Department.objects.using('replica_1').create(name='Replica')
+        self.user = User.objects.create(username='recruiter', email='recruiter@example.com', role='recruiter')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def names(self, response):
+        return [department['name'] for department in response.json()['results']]
+
+    def test_reads_inside_block_go_to_replica(self):
+        with read_from_replica():
+            self.assertEqual(list(Department.objects.values_list('name', flat=True)), ['Replica'])
+            Department.objects.create(name='Written')
+        self.assertEqual(Department.objects.using('replica_1').count(), 1)
+        self.assertEqual(Department.objects.filter(name='Written').count(), 1)
+
+    def test_list_reads_replica(self):
+        self.assertEqual(self.names(self.client.get('/api/jobs/departments/')), ['Replica'])
+        self.assertIsNone(_read_alias.get())
+
+    def test_write_pins_user_to_primary(self):
+        response = self.client.post('/api/jobs/departments/', {'name': 'New'}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        self.assertEqual(sorted(self.names(self.client.get('/api/jobs/departments/'))), ['New', 'Primary'])
+
+    def test_replica_choice_is_reset_after_unhandled_exception(self):
+        view = DepartmentViewSet.as_view({'get': 'list'})
+        request = APIRequestFactory().get('/api/jobs/departments/')
+        force_authenticate(request, self.user)
+
+        with mock.patch.object(DepartmentViewSet, 'list', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                view(request)
+
+        self.assertIsNone(_read_alias.get())
+
+    async def test_pinning_middleware_stays_async(self):
+        async def created(request):
+            return HttpResponse(status=201)
+
+        middleware = ReplicaPinningMiddleware(created)
+        self.assertTrue(iscoroutinefunction(middleware))
+        request = RequestFactory().post('/api/jobs/departments/')
+        request.user = self.user
+
+        await middleware(request)
+
+        self.assertTrue(await cache.aget(f'db:pinned:{self.user.pk}'))
+
+
+class RolePermissionTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create(username='recruiter', email='recruiter@example.com', role='recruiter')
+        self.candidate = User.objects.create(username='candidate', email='candidate@example.com', role='candidate')
+
+    def request(self, user, token_class=None):
+        token = (token_class or (lambda user: RoleRefreshToken.for_user(user).access_token))(user)
+        return SimpleNamespace(user=ClaimsUser(token), auth=token)
+
+    def test_token_claims_need_no_queries(self):
+        recruiter, candidate = self.request(self.recruiter), self.request(self.candidate)
+        own = SimpleNamespace(candidate_id=self.candidate.pk)
+        other = SimpleNamespace(candidate_id=self.recruiter.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(IsRecruiter().has_permission(recruiter, None))
+            self.assertFalse(IsRecruiter().has_permission(candidate, None))
+            self.assertTrue(IsRecruiterOrOwner().has_object_permission(recruiter, None, other))
+            self.assertTrue(IsRecruiterOrOwner().has_object_permission(candidate, None, own))
+            self.assertFalse(IsRecruiterOrOwner().has_object_permission(candidate, None, other))
+
+    def test_cached_role_is_invalidated_when_user_is_saved(self):
+        cache.clear()
+        # A token minted without the role claim falls back to the shared cache
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_role(self.request(self.candidate, AccessToken.for_user)), 'candidate')
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_role(self.request(self.candidate, AccessToken.for_user)), 'candidate')
+
+        self.candidate.role = 'recruiter'
+        self.candidate.save()
+
+        self.assertEqual(get_user_role(self.request(self.candidate, AccessToken.for_user)), 'recruiter')